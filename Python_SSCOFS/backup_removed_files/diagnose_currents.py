@@ -2,23 +2,211 @@
 Diagnostic script to examine current data in detail
 """
 import argparse
-import xarray as xr
+import contextlib
+import io
+import math
+import sys
 import numpy as np
-from latest_cycle import latest_cycle_and_url_for_local_hour
-from sscofs_cache import load_sscofs_data, list_cache, clear_cache
 import datetime as dt
 from datetime import timezone
 from zoneinfo import ZoneInfo
 
-def haversine_distance(lat1, lon1, lat2, lon2):
-    """Calculate distance in miles"""
-    lat1, lon1, lat2, lon2 = map(np.radians, [lat1, lon1, lat2, lon2])
-    dlat = lat2 - lat1
-    dlon = lon2 - lon1
-    a = np.sin(dlat/2)**2 + np.cos(lat1) * np.cos(lat2) * np.sin(dlon/2)**2
-    c = 2 * np.arcsin(np.sqrt(a))
-    r = 3959.0  # miles
-    return c * r
+try:
+    import numba as _numba_mod
+    _NUMBA_AVAILABLE = True
+except ImportError:
+    _NUMBA_AVAILABLE = False
+    _numba_mod = None
+
+MS_TO_KNOTS = 1.94384
+
+if _NUMBA_AVAILABLE:
+    @_numba_mod.njit(parallel=True, fastmath=True, cache=True)
+    def _haversine_jit(lat1, lon1, lats, lons, out):
+        """Numba-compiled haversine (miles); lat1/lon1 in radians, arrays in degrees."""
+        cos_lat1 = np.cos(lat1)
+        deg = np.pi / 180.0
+        for i in _numba_mod.prange(lats.size):
+            lat2 = lats[i] * deg
+            s_dlat = np.sin(0.5 * (lat2 - lat1))
+            s_dlon = np.sin(0.5 * (lons[i] * deg - lon1))
+            a = s_dlat * s_dlat + cos_lat1 * np.cos(lat2) * s_dlon * s_dlon
+            out[i] = 2.0 * 3959.0 * np.arcsin(np.sqrt(a))
+else:
+    _haversine_jit = None
+
+def haversine_distance(lat1, lon1, lats, lons):
+    """
+    Calculate distance in miles from a scalar point (lat1, lon1) to arrays
+    of points (lats, lons).  Uses the Numba kernel when available, otherwise
+    works in two reused buffers instead of allocating a temporary per step.
+    The result has the dtype of lats, so float32 inputs stay float32.
+    """
+    # Scalars go through math (no ufunc dispatch); only the arrays use NumPy.
+    lat1_r = math.radians(lat1)
+    lon1_r = math.radians(lon1)
+    cos_lat1 = math.cos(lat1_r)
+
+    if _haversine_jit is not None:
+        lats = np.ascontiguousarray(lats)
+        out = np.empty_like(lats)
+        _haversine_jit(lat1_r, lon1_r, lats, np.ascontiguousarray(lons), out)
+        return out
+
+    lat2_r = np.radians(lats)
+
+    # a = sin(dlon/2)^2 * cos(lat1) * cos(lat2)
+    a = np.radians(lons)
+    a -= lon1_r
+    a *= 0.5
+    np.sin(a, out=a)
+    a *= a
+    tmp = np.cos(lat2_r)
+    a *= tmp
+    a *= cos_lat1
+
+    # a += sin(dlat/2)^2
+    np.subtract(lat2_r, lat1_r, out=tmp)
+    tmp *= 0.5
+    np.sin(tmp, out=tmp)
+    tmp *= tmp
+    a += tmp
+
+    np.sqrt(a, out=a)
+    np.arcsin(a, out=a)
+    a *= 2 * 3959.0  # miles
+    return a
+
+if _NUMBA_AVAILABLE:
+    # Every fastmath flag except 'nnan'/'ninf', so the NaN checks survive.
+    @_numba_mod.njit(parallel=True, cache=True,
+                     fastmath={'nsz', 'arcp', 'contract', 'afn', 'reassoc'})
+    def _current_stats_jit(u, v, thresh, n_chunks):
+        """
+        One streaming pass over u, v.  Each chunk keeps its own partial
+        min/max/sum/count; the chunks are merged serially at the end.
+
+        Returns (partials[9], counts[4]) where partials is
+        [u_min, u_max, u_sum, v_min, v_max, v_sum, s_min, s_max, s_sum]
+        and counts is [n_u, n_v, n_speed, n_nonzero].
+        """
+        n = u.size
+        part = np.empty((n_chunks, 9))
+        cnt = np.zeros((n_chunks, 4), dtype=np.int64)
+        for c in _numba_mod.prange(n_chunks):
+            lo = c * n // n_chunks
+            hi = (c + 1) * n // n_chunks
+            u_min = np.inf; u_max = -np.inf; u_sum = 0.0
+            v_min = np.inf; v_max = -np.inf; v_sum = 0.0
+            s_min = np.inf; s_max = -np.inf; s_sum = 0.0
+            n_u = 0; n_v = 0; n_s = 0; n_nz = 0
+            for i in range(lo, hi):
+                uu = u[i]
+                vv = v[i]
+                u_ok = not np.isnan(uu)
+                v_ok = not np.isnan(vv)
+                if u_ok:
+                    u_min = min(u_min, uu); u_max = max(u_max, uu)
+                    u_sum += uu; n_u += 1
+                if v_ok:
+                    v_min = min(v_min, vv); v_max = max(v_max, vv)
+                    v_sum += vv; n_v += 1
+                if u_ok and v_ok:
+                    sp = np.sqrt(uu * uu + vv * vv)
+                    s_min = min(s_min, sp); s_max = max(s_max, sp)
+                    s_sum += sp; n_s += 1
+                    if sp > thresh:
+                        n_nz += 1
+            part[c, 0] = u_min; part[c, 1] = u_max; part[c, 2] = u_sum
+            part[c, 3] = v_min; part[c, 4] = v_max; part[c, 5] = v_sum
+            part[c, 6] = s_min; part[c, 7] = s_max; part[c, 8] = s_sum
+            cnt[c, 0] = n_u; cnt[c, 1] = n_v; cnt[c, 2] = n_s; cnt[c, 3] = n_nz
+
+        out = np.empty(9)
+        for k in range(3):
+            out[3 * k] = part[:, 3 * k].min()
+            out[3 * k + 1] = part[:, 3 * k + 1].max()
+            out[3 * k + 2] = part[:, 3 * k + 2].sum()
+        return out, cnt.sum(axis=0)
+else:
+    _current_stats_jit = None
+
+def current_stats(u, v, thresh=0.001):
+    """
+    Min/max/mean of u, v and speed (m/s) plus the count of points with
+    speed above `thresh`, computed without materializing the speed array
+    when Numba is available.
+    """
+    if _current_stats_jit is not None and u.size > 0:
+        n_chunks = min(_numba_mod.get_num_threads() * 4, u.size)
+        out, counts = _current_stats_jit(np.ascontiguousarray(u), np.ascontiguousarray(v),
+                                         thresh, n_chunks)
+        n_u, n_v, n_s, n_nz = (int(c) for c in counts)
+        # With no valid values the kernel's min/max are still +/-inf;
+        # report NaN like np.nanmin/np.nanmax do
+        nan = float('nan')
+        for k, n in enumerate((n_u, n_v, n_s)):
+            if n == 0:
+                out[3 * k:3 * k + 2] = nan
+        return {
+            'u_min': out[0], 'u_max': out[1], 'u_mean': out[2] / n_u if n_u else nan,
+            'v_min': out[3], 'v_max': out[4], 'v_mean': out[5] / n_v if n_v else nan,
+            'speed_min': out[6], 'speed_max': out[7], 'speed_mean': out[8] / n_s if n_s else nan,
+            'n_nonzero': n_nz,
+        }
+
+    speed = np.hypot(u, v)
+    return {
+        'u_min': np.nanmin(u), 'u_max': np.nanmax(u), 'u_mean': np.nanmean(u),
+        'v_min': np.nanmin(v), 'v_max': np.nanmax(v), 'v_mean': np.nanmean(v),
+        'speed_min': np.nanmin(speed), 'speed_max': np.nanmax(speed), 'speed_mean': np.nanmean(speed),
+        'n_nonzero': int(np.count_nonzero(speed > thresh)),
+    }
+
+def raw_to_float32(da):
+    """
+    float32 values of a DataArray opened with decode_cf=False, applying
+    _FillValue/missing_value, scale_factor and add_offset from its attributes.
+    """
+    raw = da.values
+    vals = raw.astype(np.float32, copy=True)
+    for key in ('_FillValue', 'missing_value'):
+        if key in da.attrs:
+            vals[raw == da.attrs[key]] = np.nan
+    if 'scale_factor' in da.attrs:
+        vals *= np.float32(da.attrs['scale_factor'])
+    if 'add_offset' in da.attrs:
+        vals += np.float32(da.attrs['add_offset'])
+    return vals
+
+def bbox_indices(lats, lons, center_lat, center_lon, radius_miles):
+    """
+    Indices of points inside the lon/lat box that encloses the radius.
+    Returning indices (not a boolean mask) keeps downstream gathers O(hits).
+    """
+    dlat = radius_miles / 69.0
+    dlon = dlat / max(math.cos(math.radians(center_lat)), 1e-3)
+    inside = np.abs(lats - center_lat) < dlat
+    # Longitude difference wrapped to [-180, 180): SSCOFS may store 0-360
+    dl = lons - center_lon
+    dl += 180.0
+    np.remainder(dl, 360.0, out=dl)
+    dl -= 180.0
+    inside &= np.abs(dl) < dlon
+    return np.flatnonzero(inside)
+
+def unit_sphere_xyz(lats, lons):
+    """Convert lat/lon in degrees to points on the unit sphere"""
+    lat_r = np.radians(lats)
+    lon_r = np.radians(lons)
+    cos_lat = np.cos(lat_r)
+    return np.column_stack([cos_lat * np.cos(lon_r), cos_lat * np.sin(lon_r), np.sin(lat_r)])
+
+def points_within_radius(tree, center_lat, center_lon, radius_miles):
+    """Indices of tree points within radius_miles (great-circle) of the center"""
+    chord = 2 * np.sin(radius_miles / (2 * 3959.0))
+    center = unit_sphere_xyz(np.array([center_lat]), np.array([center_lon]))[0]
+    return np.sort(np.asarray(tree.query_ball_point(center, chord), dtype=np.intp))
 
 def main():
     parser = argparse.ArgumentParser(
@@ -51,15 +239,21 @@ def main():
     
     args = parser.parse_args()
     
-    # Handle cache management commands first
+    # Handle cache management commands first (before any heavy imports)
     if args.list_cache:
+        from sscofs_cache import list_cache
         list_cache()
         return 0
     
     if args.clear_cache:
+        from sscofs_cache import clear_cache
         clear_cache()
         return 0
     
+    import xarray as xr
+    from latest_cycle import latest_cycle_and_url_for_local_hour
+    from sscofs_cache import load_sscofs_data
+    
     # Get parameters from args
     center_lat = args.lat
     center_lon = args.lon
@@ -83,23 +277,38 @@ def main():
     
     # Load data using shared cache
     print()
-    ds = load_sscofs_data(info, use_cache=not args.no_cache, verbose=True)
+    # Numeric-only read: skip CF decoding and handle the attributes ourselves
+    ds = load_sscofs_data(info, use_cache=not args.no_cache, verbose=True,
+                          decode_cf=False)
     
     # Now examine the dataset
-    with ds:
+    # Collect the report in memory and write it with a single call at the
+    # end (also on error) instead of one write/flush per print.
+    buf = io.StringIO()
+    with contextlib.ExitStack() as stack:
+        stack.callback(lambda: sys.stdout.write(buf.getvalue()))
+        stack.enter_context(ds)
+        stack.enter_context(contextlib.redirect_stdout(buf))
         
         print("\n" + "="*70)
         print("DATASET STRUCTURE")
         print("="*70)
         print(f"Dimensions: {dict(ds.dims)}")
-        print(f"\nTime values: {ds.time.values}")
+        # Only the small time coordinate is decoded, for display
+        times = xr.decode_cf(ds[['time']]).time.values
+        print(f"\nTime values: {', '.join(np.datetime_as_string(times, unit='s'))}")
         
         # Extract currents
         print("\n" + "="*70)
         print("EXAMINING U and V VARIABLES")
         print("="*70)
-        u = ds["u"].isel(time=0, siglay=0)
-        v = ds["v"].isel(time=0, siglay=0)
+        # One indexing pass and one load for everything we need; all work
+        # below is on the in-memory arrays.
+        sub = ds[["u", "v", "lonc", "latc"]].isel(time=0, siglay=0).load()
+        u = sub["u"]
+        v = sub["v"]
+        u_vals = raw_to_float32(u)
+        v_vals = raw_to_float32(v)
         
         print(f"u shape: {u.shape}")
         print(f"v shape: {v.shape}")
@@ -107,27 +316,25 @@ def main():
         print(f"v dimensions: {v.dims}")
         
         # Get coordinates
-        lons = ds["lonc"].values
-        lats = ds["latc"].values
+        # Single precision is plenty for a few-mile radius (5 mi is ~1.3e-3
+        # rad, far above float32 epsilon) and halves the bytes moved.
+        lons = raw_to_float32(sub["lonc"])
+        lats = raw_to_float32(sub["latc"])
         
         print(f"\nCoordinate arrays shape: lon={lons.shape}, lat={lats.shape}")
         print(f"Longitude range: {lons.min():.4f} to {lons.max():.4f}")
         print(f"Latitude range: {lats.min():.4f} to {lats.max():.4f}")
         
         # Statistics on full domain
-        u_vals = u.values
-        v_vals = v.values
-        speed = np.sqrt(u_vals**2 + v_vals**2)
-        speed_knots = speed * 1.94384
-        
         print("\n" + "="*70)
         print("FULL DOMAIN STATISTICS")
         print("="*70)
+        st = current_stats(u_vals, v_vals)
         print(f"Total grid points: {len(u_vals)}")
-        print(f"u - min: {np.nanmin(u_vals):.6f}, max: {np.nanmax(u_vals):.6f}, mean: {np.nanmean(u_vals):.6f} m/s")
-        print(f"v - min: {np.nanmin(v_vals):.6f}, max: {np.nanmax(v_vals):.6f}, mean: {np.nanmean(v_vals):.6f} m/s")
-        print(f"speed - min: {np.nanmin(speed_knots):.6f}, max: {np.nanmax(speed_knots):.6f}, mean: {np.nanmean(speed_knots):.6f} knots")
-        print(f"Non-zero currents: {np.count_nonzero(speed > 0.001)} ({100*np.count_nonzero(speed > 0.001)/len(speed):.1f}%)")
+        print(f"u - min: {st['u_min']:.6f}, max: {st['u_max']:.6f}, mean: {st['u_mean']:.6f} m/s")
+        print(f"v - min: {st['v_min']:.6f}, max: {st['v_max']:.6f}, mean: {st['v_mean']:.6f} m/s")
+        print(f"speed - min: {st['speed_min']*MS_TO_KNOTS:.6f}, max: {st['speed_max']*MS_TO_KNOTS:.6f}, mean: {st['speed_mean']*MS_TO_KNOTS:.6f} knots")
+        print(f"Non-zero currents: {st['n_nonzero']} ({100*st['n_nonzero']/len(u_vals):.1f}%)")
         
         # Now filter by location
         print("\n" + "="*70)
@@ -135,19 +342,32 @@ def main():
         print("="*70)
         print(f"Center: ({center_lat:.4f}, {center_lon:.4f})")
         
-        distances = haversine_distance(center_lat, center_lon, lats, lons)
-        mask = distances <= radius_miles
+        if args.no_cache:
+            # One-off run: a bounding-box pass plus an exact check on the
+            # few hits is cheaper than building a KD-tree for one query.
+            tree = None
+            cand = bbox_indices(lats, lons, center_lat, center_lon, radius_miles)
+            cand_dist = haversine_distance(center_lat, center_lon, lats[cand], lons[cand])
+            hit = np.flatnonzero(cand_dist <= radius_miles)
+            idx = cand[hit]
+            distances_masked = cand_dist[hit]
+        else:
+            from sscofs_cache import load_mesh_tree
+            tree = load_mesh_tree(lons, lats)
+            idx = points_within_radius(tree, center_lat, center_lon, radius_miles)
+            distances_masked = haversine_distance(center_lat, center_lon, lats[idx], lons[idx])
+        n_hits = idx.size
         
-        print(f"Points within radius: {np.sum(mask)}")
+        print(f"Points within radius: {n_hits}")
         
-        if np.sum(mask) > 0:
-            lons_masked = lons[mask]
-            lats_masked = lats[mask]
-            u_masked = u_vals[mask]
-            v_masked = v_vals[mask]
-            speed_masked = speed[mask]
-            speed_knots_masked = speed_knots[mask]
-            distances_masked = distances[mask]
+        if n_hits > 0:
+            # idx is a small integer array: every gather below is O(hits)
+            lons_masked = lons[idx]
+            lats_masked = lats[idx]
+            u_masked = u_vals[idx]
+            v_masked = v_vals[idx]
+            # Speed is only needed for the in-radius points
+            speed_masked = np.hypot(u_masked, v_masked)
             
             print(f"\nLon range in area: {lons_masked.min():.4f} to {lons_masked.max():.4f}")
             print(f"Lat range in area: {lats_masked.min():.4f} to {lats_masked.max():.4f}")
@@ -156,10 +376,11 @@ def main():
             print("\n" + "="*70)
             print("LOCAL AREA STATISTICS")
             print("="*70)
-            print(f"u - min: {np.nanmin(u_masked):.6f}, max: {np.nanmax(u_masked):.6f}, mean: {np.nanmean(u_masked):.6f} m/s")
-            print(f"v - min: {np.nanmin(v_masked):.6f}, max: {np.nanmax(v_masked):.6f}, mean: {np.nanmean(v_masked):.6f} m/s")
-            print(f"speed - min: {np.nanmin(speed_knots_masked):.6f}, max: {np.nanmax(speed_knots_masked):.6f}, mean: {np.nanmean(speed_knots_masked):.6f} knots")
-            print(f"Non-zero currents: {np.count_nonzero(speed_masked > 0.001)} ({100*np.count_nonzero(speed_masked > 0.001)/len(speed_masked):.1f}%)")
+            st = current_stats(u_masked, v_masked)
+            print(f"u - min: {st['u_min']:.6f}, max: {st['u_max']:.6f}, mean: {st['u_mean']:.6f} m/s")
+            print(f"v - min: {st['v_min']:.6f}, max: {st['v_max']:.6f}, mean: {st['v_mean']:.6f} m/s")
+            print(f"speed - min: {st['speed_min']*MS_TO_KNOTS:.6f}, max: {st['speed_max']*MS_TO_KNOTS:.6f}, mean: {st['speed_mean']*MS_TO_KNOTS:.6f} knots")
+            print(f"Non-zero currents: {st['n_nonzero']} ({100*st['n_nonzero']/n_hits:.1f}%)")
             
             # Show some sample values
             print("\n" + "="*70)
@@ -169,26 +390,37 @@ def main():
             print("-"*70)
             for i in range(min(10, len(lons_masked))):
                 print(f"{lons_masked[i]:10.4f} {lats_masked[i]:10.4f} {distances_masked[i]:10.2f} "
-                      f"{u_masked[i]:10.4f} {v_masked[i]:10.4f} {speed_knots_masked[i]:10.4f}")
+                      f"{u_masked[i]:10.4f} {v_masked[i]:10.4f} {speed_masked[i]*MS_TO_KNOTS:10.4f}")
             
             # Show highest speed points
-            if np.nanmax(speed_knots_masked) > 0:
+            if st['speed_max'] > 0:
                 print("\n" + "="*70)
                 print("TOP 10 HIGHEST SPEED POINTS")
                 print("="*70)
                 print(f"{'Lon':>10s} {'Lat':>10s} {'Dist(mi)':>10s} {'u(m/s)':>10s} {'v(m/s)':>10s} {'Speed(kt)':>10s}")
                 print("-"*70)
-                sorted_idx = np.argsort(speed_knots_masked)[::-1][:10]
+                # Partial selection of the top k, then sort only those k
+                valid = np.flatnonzero(~np.isnan(speed_masked))
+                k = min(10, valid.size)
+                top_idx = valid[np.argpartition(speed_masked[valid], -k)[-k:]]
+                sorted_idx = top_idx[np.argsort(speed_masked[top_idx])[::-1]]
                 for i in sorted_idx:
                     print(f"{lons_masked[i]:10.4f} {lats_masked[i]:10.4f} {distances_masked[i]:10.2f} "
-                          f"{u_masked[i]:10.4f} {v_masked[i]:10.4f} {speed_knots_masked[i]:10.4f}")
+                          f"{u_masked[i]:10.4f} {v_masked[i]:10.4f} {speed_masked[i]*MS_TO_KNOTS:10.4f}")
         else:
             print("ERROR: No points found in the specified area!")
             print("\nClosest point to target:")
-            closest_idx = np.argmin(distances)
-            print(f"  Distance: {distances[closest_idx]:.2f} miles")
+            if tree is not None:
+                center = unit_sphere_xyz(np.array([center_lat]), np.array([center_lon]))[0]
+                _, closest_idx = tree.query(center)
+                closest_dist = haversine_distance(center_lat, center_lon, lats[[closest_idx]], lons[[closest_idx]])[0]
+            else:
+                distances = haversine_distance(center_lat, center_lon, lats, lons)
+                closest_idx = np.argmin(distances)
+                closest_dist = distances[closest_idx]
+            print(f"  Distance: {closest_dist:.2f} miles")
             print(f"  Location: ({lats[closest_idx]:.4f}, {lons[closest_idx]:.4f})")
-            print(f"  Speed: {speed_knots[closest_idx]:.4f} knots")
+            print(f"  Speed: {np.hypot(u_vals[closest_idx], v_vals[closest_idx])*MS_TO_KNOTS:.4f} knots")
     
     return 0
 
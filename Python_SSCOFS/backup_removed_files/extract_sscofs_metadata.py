@@ -31,16 +31,316 @@ Usage:
 import argparse
 import datetime as dt
 from datetime import timezone, timedelta
+import hashlib
+import io
 import json
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, Any, List, Optional
 import numpy as np
 import xarray as xr
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import numba as _numba_mod
+    _NUMBA_AVAILABLE = True
+except ImportError:
+    _NUMBA_AVAILABLE = False
+    _numba_mod = None
+
 # Import helper functions from existing modules
 from latest_cycle import latest_cycle_and_url_for_local_hour
 from fetch_sscofs import build_sscofs_url
-from sscofs_cache import load_sscofs_data
+from sscofs_cache import DEFAULT_CACHE_DIR, get_cached_filename, load_sscofs_data
+
+
+if _NUMBA_AVAILABLE:
+    # Every fastmath flag except 'nnan'/'ninf', so the NaN checks survive.
+    @_numba_mod.njit(parallel=True, cache=True,
+                     fastmath={'nsz', 'arcp', 'contract', 'afn', 'reassoc'})
+    def _fused_stats(a, n_chunks):
+        """
+        Single parallel pass over a 1-D array: (min, max, mean, M2,
+        n_valid, n_total), skipping and counting NaNs inline so no isnan
+        mask is allocated.  Each chunk runs Welford's update for mean and
+        M2 (sum of squared deviations); the chunks are merged serially with
+        Chan et al.'s pairwise formula, so no large sum of squares is ever
+        formed and cancelled.
+        """
+        n_total = a.size
+        part = np.empty((n_chunks, 4))
+        cnt = np.zeros(n_chunks, dtype=np.int64)
+        for c in _numba_mod.prange(n_chunks):
+            lo = c * n_total // n_chunks
+            hi = (c + 1) * n_total // n_chunks
+            mn = np.inf
+            mx = -np.inf
+            mean = 0.0
+            m2 = 0.0
+            n = 0
+            for i in range(lo, hi):
+                x = a[i]
+                if np.isnan(x):
+                    continue
+                if x < mn:
+                    mn = x
+                if x > mx:
+                    mx = x
+                n += 1
+                d = x - mean
+                mean += d / n
+                m2 += d * (x - mean)
+            part[c, 0] = mn; part[c, 1] = mx; part[c, 2] = mean; part[c, 3] = m2
+            cnt[c] = n
+        
+        n = 0
+        mean = 0.0
+        m2 = 0.0
+        for c in range(n_chunks):
+            nb = cnt[c]
+            if nb == 0:
+                continue
+            tot = n + nb
+            d = part[c, 2] - mean
+            mean += d * nb / tot
+            m2 += part[c, 3] + d * d * n * nb / tot
+            n = tot
+        return part[:, 0].min(), part[:, 1].max(), mean, m2, n, n_total
+else:
+    _fused_stats = None
+
+
+if _NUMBA_AVAILABLE:
+    @_numba_mod.njit(parallel=True, fastmath=True, cache=True)
+    def _lon_lat_stats(lon, lat):
+        """
+        (lon_min, lon_max, lon_mean, lat_min, lat_max, lat_mean) in one
+        parallel pass, converting 0-360 longitudes to -180..180 per element.
+        """
+        n = lon.size
+        lon_min = np.inf
+        lon_max = -np.inf
+        lon_sum = 0.0
+        lat_min = np.inf
+        lat_max = -np.inf
+        lat_sum = 0.0
+        for i in _numba_mod.prange(n):
+            x = lon[i]
+            if x > 180.0:
+                x -= 360.0
+            y = lat[i]
+            lon_min = min(lon_min, x)
+            lon_max = max(lon_max, x)
+            lon_sum += x
+            lat_min = min(lat_min, y)
+            lat_max = max(lat_max, y)
+            lat_sum += y
+        return lon_min, lon_max, lon_sum / n, lat_min, lat_max, lat_sum / n
+else:
+    _lon_lat_stats = None
+
+
+def summarize_lon_lat(lons: np.ndarray, lats: np.ndarray) -> Dict[str, Any]:
+    """
+    Count, ranges and means of a set of mesh positions, with longitudes
+    reported in the -180..180 convention.
+    
+    Parameters:
+    -----------
+    lons, lats : np.ndarray
+        1-D coordinate arrays in degrees (longitude may be 0-360)
+        
+    Returns:
+    --------
+    dict : Keys 'count', 'lon_range', 'lat_range', 'lon_mean', 'lat_mean'
+    """
+    if _lon_lat_stats is not None and lons.size > 0:
+        lon_min, lon_max, lon_mean, lat_min, lat_max, lat_mean = _lon_lat_stats(
+            np.ascontiguousarray(lons), np.ascontiguousarray(lats))
+    else:
+        # Handle longitude convention (0-360 vs -180 to 180)
+        if lons.max() > 180:
+            # One copy wrapped in place; avoids np.where's extra
+            # full-size temporary for `lons - 360`
+            lons = lons.copy()
+            np.subtract(lons, 360, out=lons, where=lons > 180)
+        lon_min, lon_max, lon_mean = np.min(lons), np.max(lons), np.mean(lons)
+        lat_min, lat_max, lat_mean = np.min(lats), np.max(lats), np.mean(lats)
+    
+    return {
+        'count': len(lons),
+        'lon_range': [float(lon_min), float(lon_max)],
+        'lat_range': [float(lat_min), float(lat_max)],
+        'lon_mean': float(lon_mean),
+        'lat_mean': float(lat_mean),
+    }
+
+
+def compute_array_stats(flat: np.ndarray) -> Dict[str, Any]:
+    """
+    Min/max/mean/std and NaN count of a 1-D array in one pass.
+    
+    Uses the parallel Numba kernel when available so no NaN mask or
+    filtered copy is allocated; otherwise falls back to NumPy's nan-aware reductions.
+    
+    Parameters:
+    -----------
+    flat : np.ndarray
+        1-D numeric array
+        
+    Returns:
+    --------
+    dict : Keys 'n_valid', 'nan_count' and, if n_valid > 0, 'min', 'max',
+           'mean', 'std'
+    """
+    if _fused_stats is not None:
+        n_chunks = max(1, min(_numba_mod.get_num_threads() * 4, flat.size))
+        mn, mx, mean, m2, n, total = _fused_stats(np.ascontiguousarray(flat), n_chunks)
+        stats = {'n_valid': int(n), 'nan_count': int(total - n)}
+        if n > 0:
+            # Population std (ddof=0), as np.nanstd
+            stats.update(min=float(mn), max=float(mx), mean=float(mean),
+                         std=float(np.sqrt(m2 / n)))
+        return stats
+    
+    nan_count = int(np.count_nonzero(np.isnan(flat))) if flat.dtype.kind == 'f' else 0
+    n = flat.size - nan_count
+    stats = {'n_valid': n, 'nan_count': nan_count}
+    if n > 0:
+        stats.update(min=float(np.nanmin(flat)), max=float(np.nanmax(flat)),
+                     mean=float(np.nanmean(flat)), std=float(np.nanstd(flat)))
+    return stats
+
+
+def partition_percentiles(values: np.ndarray, qs) -> List[float]:
+    """
+    Several percentiles of a 1-D array from a single partial sort.
+    
+    Matches np.percentile's default linear interpolation, but partitions
+    once around every order statistic needed instead of once per call.
+    
+    Parameters:
+    -----------
+    values : np.ndarray
+        1-D array without NaNs
+    qs : sequence of float
+        Percentiles in [0, 100]
+        
+    Returns:
+    --------
+    list : One float per requested percentile (all NaN for an empty array)
+    """
+    n = values.size
+    if n == 0:
+        return [np.nan] * len(qs)
+    pos = np.asarray(qs, dtype=np.float64) / 100.0 * (n - 1)
+    lo = np.floor(pos).astype(np.intp)
+    hi = np.minimum(lo + 1, n - 1)
+    part = np.partition(values, np.unique(np.concatenate([lo, hi])))
+    a = part[lo].astype(np.float64)
+    b = part[hi].astype(np.float64)
+    return (a + (b - a) * (pos - lo)).tolist()
+
+
+def compute_lazy_stats(data) -> Dict[str, Any]:
+    """
+    Same summary as compute_array_stats, for a dask-backed array.
+    
+    All five reductions go through a single dask.compute() call so the
+    scheduler reads each chunk once and memory stays O(chunk size).
+    
+    Parameters:
+    -----------
+    data : dask.array.Array
+        Chunked array of any shape
+        
+    Returns:
+    --------
+    dict : Same keys as compute_array_stats
+    """
+    import dask
+    import dask.array as da
+    
+    if not np.issubdtype(data.dtype, np.floating):
+        data = data.astype(np.float64)
+    nan_count, vmin, vmax, mean, std = dask.compute(
+        da.isnan(data).sum(), da.nanmin(data), da.nanmax(data),
+        da.nanmean(data), da.nanstd(data))
+    n_valid = int(data.size - nan_count)
+    stats = {'n_valid': n_valid, 'nan_count': int(nan_count)}
+    if n_valid > 0:
+        stats['min'] = float(vmin)
+        stats['max'] = float(vmax)
+        stats['mean'] = float(mean)
+        stats['std'] = float(std)
+    return stats
+
+
+def _clean_seq_attr(value):
+    n = len(value)
+    if n > 10:
+        return f"[array of {n} values, showing first 5: {list(value[:5])}...]"
+    return list(value) if isinstance(value, np.ndarray) else value
+
+
+def _clean_str_attr(value):
+    return value[:200] + "..." if len(value) > 200 else value
+
+
+def _keep_attr(value):
+    return value
+
+
+# Exact-type dispatch for the common attribute types; subclasses (e.g.
+# np.str_) fall through to the isinstance checks in _clean_attr_value.
+_ATTR_HANDLERS = {
+    str: _clean_str_attr,
+    list: _clean_seq_attr,
+    np.ndarray: _clean_seq_attr,
+    int: _keep_attr,
+    float: _keep_attr,
+}
+
+
+def _clean_attr_value(value):
+    handler = _ATTR_HANDLERS.get(type(value))
+    if handler is not None:
+        return handler(value)
+    if isinstance(value, (list, np.ndarray)):
+        return _clean_seq_attr(value)
+    if isinstance(value, str):
+        return _clean_str_attr(value)
+    return value
+
+
+def _clean_attr_items(items) -> Dict[str, Any]:
+    """Truncate long arrays and strings in (key, value) attribute pairs."""
+    return {key: _clean_attr_value(value) for key, value in items}
+
+
+@lru_cache(maxsize=256)
+def _clean_attrs_cached(typed_items) -> Dict[str, Any]:
+    return _clean_attr_items((key, value) for key, _, value in typed_items)
+
+
+def clean_attrs(attrs: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Attribute dict with long arrays and strings truncated for display.
+    
+    FVCOM files repeat the same attribute sets (units, long_name, ...) on
+    many variables, so results for all-hashable attribute sets are
+    memoized.  The value type is part of the key so 1, 1.0 and True are
+    not conflated.  Sets holding arrays or lists are cleaned directly.
+    """
+    try:
+        cleaned = _clean_attrs_cached(tuple((k, type(v), v) for k, v in attrs.items()))
+    except TypeError:
+        return _clean_attr_items(attrs.items())
+    return dict(cleaned)
 
 
 def extract_global_attributes(ds: xr.Dataset) -> Dict[str, Any]:
@@ -75,7 +375,7 @@ def extract_dimensions_info(ds: xr.Dataset) -> Dict[str, int]:
     return dict(ds.dims)
 
 
-def extract_coordinates_info(ds: xr.Dataset) -> Dict[str, Dict[str, Any]]:
+def extract_coordinates_info(ds: xr.Dataset, value_lists: bool = True) -> Dict[str, Dict[str, Any]]:
     """
     Extract information about coordinate variables.
     
@@ -83,6 +383,10 @@ def extract_coordinates_info(ds: xr.Dataset) -> Dict[str, Dict[str, Any]]:
     -----------
     ds : xr.Dataset
         SSCOFS dataset
+    value_lists : bool
+        If True, store the values of small coordinates as a list of numbers
+        ('values', for JSON consumers); otherwise only as a formatted
+        string ('values_repr', for the text report)
         
     Returns:
     --------
@@ -90,55 +394,123 @@ def extract_coordinates_info(ds: xr.Dataset) -> Dict[str, Dict[str, Any]]:
     """
     coords_info = {}
     
-    for coord_name in ds.coords:
-        coord = ds.coords[coord_name]
-        
-        # Clean attributes - truncate arrays in attributes
-        clean_attrs = {}
-        for key, value in coord.attrs.items():
-            if isinstance(value, (list, np.ndarray)):
-                if len(value) > 10:
-                    clean_attrs[key] = f"[array of {len(value)} values, showing first 5: {list(value[:5])}...]"
-                else:
-                    clean_attrs[key] = list(value) if isinstance(value, np.ndarray) else value
-            elif isinstance(value, str) and len(value) > 200:
-                clean_attrs[key] = value[:200] + "..."
-            else:
-                clean_attrs[key] = value
-        
+    for coord_name, coord in ds.coords.items():
         info = {
             'dtype': str(coord.dtype),
             'shape': coord.shape,
             'dimensions': list(coord.dims),
-            'attributes': clean_attrs,
+            'attributes': clean_attrs(coord.attrs),
         }
         
         # Add basic statistics and sample values for numeric coordinates
         if np.issubdtype(coord.dtype, np.number):
-            coord_values = coord.values
-            info['min'] = float(coord.min().values)
-            info['max'] = float(coord.max().values)
-            info['mean'] = float(coord.mean().values)
+            # Reduce on the underlying ndarray instead of going through
+            # xarray's reduction dispatch for each statistic
+            raw = coord.data
+            coord_values = raw if isinstance(raw, np.ndarray) else np.asarray(raw)
+            if coord_values.dtype.kind == 'f':
+                # Match xarray's skipna default for float coordinates
+                info['min'] = float(np.nanmin(coord_values))
+                info['max'] = float(np.nanmax(coord_values))
+                info['mean'] = float(np.nanmean(coord_values))
+            else:
+                info['min'] = float(coord_values.min())
+                info['max'] = float(coord_values.max())
+                info['mean'] = float(coord_values.mean())
             
             # For large coordinate arrays, only store a sample
             if coord_values.size > 20:
-                if len(coord_values.shape) == 1:
+                ndim = coord_values.ndim
+                if ndim == 1:
                     # 1D array
                     info['value_sample'] = coord_values[:5].tolist() + ['...'] + coord_values[-5:].tolist()
-                elif len(coord_values.shape) == 2:
+                elif ndim == 2:
                     # 2D array - just show dimensions, not values
                     info['note'] = f"2D array ({coord_values.shape[0]} x {coord_values.shape[1]}), values not shown"
                 else:
                     info['note'] = f"Multi-dimensional array, shape {coord_values.shape}, values not shown"
             else:
                 # Small arrays - show all values
-                info['values'] = coord_values.tolist()
+                if value_lists:
+                    info['values'] = coord_values.tolist()
+                else:
+                    info['values_repr'] = np.array2string(coord_values, separator=', ',
+                                                          threshold=20, edgeitems=5)
             
         coords_info[coord_name] = info
     
     return coords_info
 
 
+def _extract_variable_info(var: xr.DataArray, detailed_stats: bool = False) -> Dict[str, Any]:
+    """Metadata and statistics for a single data variable."""
+    info = {
+        'dtype': str(var.dtype),
+        'shape': var.shape,
+        'dimensions': list(var.dims),
+        'attributes': clean_attrs(var.attrs),
+        # From shape and itemsize alone; no duck-array dispatch
+        'size_mb': float(np.prod(var.shape, dtype=np.int64)) * var.dtype.itemsize / (1024 * 1024),
+    }
+    
+    # Add basic statistics for numeric variables
+    if np.issubdtype(var.dtype, np.number):
+        try:
+            sample = None
+            if hasattr(var.data, 'chunks'):
+                # Dask-backed: reduce chunk by chunk, no sampling needed
+                stats = compute_lazy_stats(var.data)
+                n_total = var.size
+                info['stats_note'] = 'Statistics computed from full dataset (chunked)'
+            else:
+                # Use a sample for large arrays to avoid memory issues
+                if var.size > 10_000_000:
+                    # Sample 1% of the data by striding the longest dimension
+                    # lazily, so only that fraction is read and decoded
+                    longest = var.dims[int(np.argmax(var.shape))]
+                    sample = var.isel({longest: slice(None, None, 100)}).values.ravel()
+                    info['stats_note'] = 'Statistics computed from 1% sample due to large size'
+                else:
+                    # ravel() is a view for the (usual) C-contiguous case
+                    sample = var.values.ravel()
+                    info['stats_note'] = 'Statistics computed from full dataset'
+                
+                stats = compute_array_stats(sample)
+                n_total = sample.size
+            
+            if stats['n_valid'] > 0:
+                info['min'] = stats['min']
+                info['max'] = stats['max']
+                info['mean'] = stats['mean']
+                info['std'] = stats['std']
+                
+                if detailed_stats:
+                    # Percentiles need the valid values themselves
+                    if sample is None:
+                        longest = var.dims[int(np.argmax(var.shape))]
+                        step = 100 if var.size > 10_000_000 else 1
+                        sample = var.isel({longest: slice(None, None, step)}).values.ravel()
+                    sample_valid = sample[~np.isnan(sample)]
+                    p25, p50, p75, p95, p99 = partition_percentiles(
+                        sample_valid, (25, 50, 75, 95, 99))
+                    info['median'] = p50
+                    info['percentile_25'] = p25
+                    info['percentile_75'] = p75
+                    info['percentile_95'] = p95
+                    info['percentile_99'] = p99
+                
+                # Count NaN values
+                info['nan_count'] = stats['nan_count']
+                info['nan_percentage'] = float(stats['nan_count'] / n_total * 100)
+            else:
+                info['note'] = 'All values are NaN'
+        
+        except Exception as e:
+            info['stats_error'] = str(e)
+    
+    return info
+
+
 def extract_variables_info(ds: xr.Dataset, detailed_stats: bool = False) -> Dict[str, Dict[str, Any]]:
     """
     Extract information about data variables.
@@ -154,74 +526,9 @@ def extract_variables_info(ds: xr.Dataset, detailed_stats: bool = False) -> Dict
     --------
     dict : Dictionary with variable information
     """
-    vars_info = {}
-    
-    for var_name in ds.data_vars:
-        var = ds[var_name]
-        
-        # Clean attributes - truncate arrays in attributes
-        clean_attrs = {}
-        for key, value in var.attrs.items():
-            if isinstance(value, (list, np.ndarray)):
-                if len(value) > 10:
-                    clean_attrs[key] = f"[array of {len(value)} values, showing first 5: {list(value[:5])}...]"
-                else:
-                    clean_attrs[key] = list(value) if isinstance(value, np.ndarray) else value
-            elif isinstance(value, str) and len(value) > 200:
-                clean_attrs[key] = value[:200] + "..."
-            else:
-                clean_attrs[key] = value
-        
-        info = {
-            'dtype': str(var.dtype),
-            'shape': var.shape,
-            'dimensions': list(var.dims),
-            'attributes': clean_attrs,
-            'size_mb': var.nbytes / (1024 * 1024),
-        }
-        
-        # Add basic statistics for numeric variables
-        if np.issubdtype(var.dtype, np.number):
-            try:
-                # Use a sample for large arrays to avoid memory issues
-                if var.size > 10_000_000:
-                    # Sample 1% of the data
-                    sample = var.values.flatten()[::100]
-                    info['stats_note'] = 'Statistics computed from 1% sample due to large size'
-                else:
-                    sample = var.values.flatten()
-                    info['stats_note'] = 'Statistics computed from full dataset'
-                
-                # Remove NaN values for statistics
-                sample_valid = sample[~np.isnan(sample)]
-                
-                if len(sample_valid) > 0:
-                    info['min'] = float(np.min(sample_valid))
-                    info['max'] = float(np.max(sample_valid))
-                    info['mean'] = float(np.mean(sample_valid))
-                    info['std'] = float(np.std(sample_valid))
-                    
-                    if detailed_stats:
-                        info['median'] = float(np.median(sample_valid))
-                        info['percentile_25'] = float(np.percentile(sample_valid, 25))
-                        info['percentile_75'] = float(np.percentile(sample_valid, 75))
-                        info['percentile_95'] = float(np.percentile(sample_valid, 95))
-                        info['percentile_99'] = float(np.percentile(sample_valid, 99))
-                    
-                    # Count NaN values
-                    total_size = sample.size
-                    nan_count = np.sum(np.isnan(sample))
-                    info['nan_count'] = int(nan_count)
-                    info['nan_percentage'] = float(nan_count / total_size * 100)
-                else:
-                    info['note'] = 'All values are NaN'
-                    
-            except Exception as e:
-                info['stats_error'] = str(e)
-        
-        vars_info[var_name] = info
-    
-    return vars_info
+    # One variable at a time; the Numba stats kernel parallelizes within each
+    return {var_name: _extract_variable_info(var, detailed_stats)
+            for var_name, var in ds.data_vars.items()}
 
 
 def extract_temporal_info(ds: xr.Dataset) -> Dict[str, Any]:
@@ -240,17 +547,20 @@ def extract_temporal_info(ds: xr.Dataset) -> Dict[str, Any]:
     temporal_info = {}
     
     if 'time' in ds.coords:
-        time_coord = ds['time']
-        temporal_info['num_timesteps'] = len(time_coord)
+        time_values = np.asarray(ds['time'].data)
+        temporal_info['num_timesteps'] = len(time_values)
         
-        # Convert to datetime strings
-        times = [str(t.values) for t in time_coord]
+        # Convert to datetime strings in one vectorized call
+        if np.issubdtype(time_values.dtype, np.datetime64):
+            times = np.datetime_as_string(time_values, unit='s').tolist()
+        else:
+            times = time_values.astype(str).tolist()
         temporal_info['first_time'] = times[0]
         temporal_info['last_time'] = times[-1]
         
         # Calculate time step if more than one time
-        if len(time_coord) > 1:
-            dt_seconds = (time_coord[1] - time_coord[0]).values / np.timedelta64(1, 's')
+        if len(time_values) > 1:
+            dt_seconds = (time_values[1] - time_values[0]) / np.timedelta64(1, 's')
             temporal_info['time_step_seconds'] = float(dt_seconds)
             temporal_info['time_step_hours'] = float(dt_seconds / 3600)
         
@@ -276,45 +586,19 @@ def extract_spatial_info(ds: xr.Dataset) -> Dict[str, Any]:
     
     # Get node coordinates if available
     if 'lon' in ds.coords and 'lat' in ds.coords:
-        lons = ds['lon'].values
-        lats = ds['lat'].values
-        
-        # Handle longitude convention (0-360 vs -180 to 180)
-        if lons.max() > 180:
-            lons_converted = np.where(lons > 180, lons - 360, lons)
-        else:
-            lons_converted = lons
-        
-        spatial_info['nodes'] = {
-            'count': len(lons),
-            'lon_range': [float(np.min(lons_converted)), float(np.max(lons_converted))],
-            'lat_range': [float(np.min(lats)), float(np.max(lats))],
-            'lon_mean': float(np.mean(lons_converted)),
-            'lat_mean': float(np.mean(lats)),
-        }
+        lons = np.asarray(ds.coords['lon'].data)
+        lats = np.asarray(ds.coords['lat'].data)
+        spatial_info['nodes'] = summarize_lon_lat(lons, lats)
     
     # Get element coordinates if available
     if 'lonc' in ds.coords and 'latc' in ds.coords:
-        lonsc = ds['lonc'].values
-        latsc = ds['latc'].values
-        
-        # Handle longitude convention
-        if lonsc.max() > 180:
-            lonsc_converted = np.where(lonsc > 180, lonsc - 360, lonsc)
-        else:
-            lonsc_converted = lonsc
-        
-        spatial_info['elements'] = {
-            'count': len(lonsc),
-            'lon_range': [float(np.min(lonsc_converted)), float(np.max(lonsc_converted))],
-            'lat_range': [float(np.min(latsc)), float(np.max(latsc))],
-            'lon_mean': float(np.mean(lonsc_converted)),
-            'lat_mean': float(np.mean(latsc)),
-        }
+        lonsc = np.asarray(ds.coords['lonc'].data)
+        latsc = np.asarray(ds.coords['latc'].data)
+        spatial_info['elements'] = summarize_lon_lat(lonsc, latsc)
     
     # Get vertical layer information
     if 'siglay' in ds.coords:
-        sigma_values = ds['siglay'].values
+        sigma_values = np.asarray(ds.coords['siglay'].data)
         # Only include sigma values if there aren't too many
         if len(sigma_values) <= 20:
             spatial_info['vertical_layers'] = {
@@ -379,29 +663,31 @@ def format_metadata_text(metadata: Dict[str, Any], detailed: bool = False) -> st
     --------
     str : Formatted text
     """
-    lines = []
-    lines.append("=" * 80)
-    lines.append("SSCOFS NETCDF METADATA REPORT")
-    lines.append("=" * 80)
-    lines.append("")
+    buf = io.StringIO()
+    w = buf.write
+    w("=" * 80 + "\n")
+    w("SSCOFS NETCDF METADATA REPORT\n")
+    w("=" * 80 + "\n")
+    w("\n")
     
     # File information
     if 'file_info' in metadata:
-        lines.append("FILE INFORMATION")
-        lines.append("-" * 80)
+        w("FILE INFORMATION\n")
+        w("-" * 80 + "\n")
         for key, value in metadata['file_info'].items():
-            lines.append(f"  {key}: {value}")
-        lines.append("")
+            w("  " + key + ": " + str(value) + "\n")
+        w("\n")
     
     # Global attributes
     if 'global_attributes' in metadata:
-        lines.append("GLOBAL ATTRIBUTES")
-        lines.append("-" * 80)
+        w("GLOBAL ATTRIBUTES\n")
+        w("-" * 80 + "\n")
         for key, value in metadata['global_attributes'].items():
             # Truncate very long values and arrays
             if isinstance(value, (list, np.ndarray)):
-                if len(value) > 10:
-                    value_str = f"[array of {len(value)} values]"
+                n = len(value)
+                if n > 10:
+                    value_str = f"[array of {n} values]"
                     if detailed:
                         value_str += f" First 5: {list(value[:5])}..."
                 else:
@@ -411,164 +697,167 @@ def format_metadata_text(metadata: Dict[str, Any], detailed: bool = False) -> st
                 max_len = 500 if detailed else 200
                 if len(value_str) > max_len:
                     value_str = value_str[:max_len] + "..."
-            lines.append(f"  {key}: {value_str}")
-        lines.append("")
+            w("  " + key + ": " + value_str + "\n")
+        w("\n")
     
     # Dimensions
     if 'dimensions' in metadata:
-        lines.append("DIMENSIONS")
-        lines.append("-" * 80)
+        w("DIMENSIONS\n")
+        w("-" * 80 + "\n")
         for dim_name, dim_size in metadata['dimensions'].items():
-            lines.append(f"  {dim_name}: {dim_size:,}")
-        lines.append("")
+            w(f"  {dim_name}: {dim_size:,}\n")
+        w("\n")
     
     # Spatial information
     if 'spatial_info' in metadata:
-        lines.append("SPATIAL INFORMATION")
-        lines.append("-" * 80)
+        w("SPATIAL INFORMATION\n")
+        w("-" * 80 + "\n")
         spatial = metadata['spatial_info']
         
         if 'nodes' in spatial:
-            lines.append(f"  Nodes: {spatial['nodes']['count']:,}")
-            lines.append(f"    Longitude range: {spatial['nodes']['lon_range'][0]:.4f} to {spatial['nodes']['lon_range'][1]:.4f}")
-            lines.append(f"    Latitude range: {spatial['nodes']['lat_range'][0]:.4f} to {spatial['nodes']['lat_range'][1]:.4f}")
-            lines.append(f"    Center: ({spatial['nodes']['lat_mean']:.4f}, {spatial['nodes']['lon_mean']:.4f})")
+            w(f"  Nodes: {spatial['nodes']['count']:,}\n")
+            w(f"    Longitude range: {spatial['nodes']['lon_range'][0]:.4f} to {spatial['nodes']['lon_range'][1]:.4f}\n")
+            w(f"    Latitude range: {spatial['nodes']['lat_range'][0]:.4f} to {spatial['nodes']['lat_range'][1]:.4f}\n")
+            w(f"    Center: ({spatial['nodes']['lat_mean']:.4f}, {spatial['nodes']['lon_mean']:.4f})\n")
         
         if 'elements' in spatial:
-            lines.append(f"  Elements: {spatial['elements']['count']:,}")
-            lines.append(f"    Longitude range: {spatial['elements']['lon_range'][0]:.4f} to {spatial['elements']['lon_range'][1]:.4f}")
-            lines.append(f"    Latitude range: {spatial['elements']['lat_range'][0]:.4f} to {spatial['elements']['lat_range'][1]:.4f}")
+            w(f"  Elements: {spatial['elements']['count']:,}\n")
+            w(f"    Longitude range: {spatial['elements']['lon_range'][0]:.4f} to {spatial['elements']['lon_range'][1]:.4f}\n")
+            w(f"    Latitude range: {spatial['elements']['lat_range'][0]:.4f} to {spatial['elements']['lat_range'][1]:.4f}\n")
         
         if 'vertical_layers' in spatial:
-            lines.append(f"  Vertical layers: {spatial['vertical_layers']['count']}")
+            w(f"  Vertical layers: {spatial['vertical_layers']['count']}\n")
             if 'sigma_range' in spatial['vertical_layers']:
-                lines.append(f"    Sigma range: {spatial['vertical_layers']['sigma_range'][0]:.6f} to {spatial['vertical_layers']['sigma_range'][1]:.6f}")
+                w(f"    Sigma range: {spatial['vertical_layers']['sigma_range'][0]:.6f} to {spatial['vertical_layers']['sigma_range'][1]:.6f}\n")
                 if detailed and 'sigma_sample' in spatial['vertical_layers']:
                     sigma_sample = spatial['vertical_layers']['sigma_sample']
-                    lines.append(f"    Sigma sample (first 5 and last 5): {sigma_sample}")
+                    w(f"    Sigma sample (first 5 and last 5): {sigma_sample}\n")
             elif detailed and 'sigma_values' in spatial['vertical_layers']:
-                lines.append(f"    Sigma values: {spatial['vertical_layers']['sigma_values']}")
+                w(f"    Sigma values: {spatial['vertical_layers']['sigma_values']}\n")
         
-        lines.append("")
+        w("\n")
     
     # Temporal information
     if 'temporal_info' in metadata:
-        lines.append("TEMPORAL INFORMATION")
-        lines.append("-" * 80)
+        w("TEMPORAL INFORMATION\n")
+        w("-" * 80 + "\n")
         temporal = metadata['temporal_info']
-        lines.append(f"  Number of time steps: {temporal.get('num_timesteps', 'N/A')}")
-        lines.append(f"  First time: {temporal.get('first_time', 'N/A')}")
-        lines.append(f"  Last time: {temporal.get('last_time', 'N/A')}")
+        w(f"  Number of time steps: {temporal.get('num_timesteps', 'N/A')}\n")
+        w(f"  First time: {temporal.get('first_time', 'N/A')}\n")
+        w(f"  Last time: {temporal.get('last_time', 'N/A')}\n")
         if 'time_step_hours' in temporal:
-            lines.append(f"  Time step: {temporal['time_step_hours']:.2f} hours")
+            w(f"  Time step: {temporal['time_step_hours']:.2f} hours\n")
         
         if detailed and 'all_times' in temporal:
             all_times = temporal['all_times']
             if len(all_times) <= 10:
-                lines.append("  All times:")
+                w("  All times:\n")
                 for i, t in enumerate(all_times):
-                    lines.append(f"    [{i}] {t}")
+                    w(f"    [{i}] {t}\n")
             else:
-                lines.append(f"  All times (showing first 5 and last 5 of {len(all_times)}):")
+                w(f"  All times (showing first 5 and last 5 of {len(all_times)}):\n")
                 for i in range(5):
-                    lines.append(f"    [{i}] {all_times[i]}")
-                lines.append(f"    ...")
+                    w(f"    [{i}] {all_times[i]}\n")
+                w(f"    ...\n")
                 for i in range(len(all_times) - 5, len(all_times)):
-                    lines.append(f"    [{i}] {all_times[i]}")
+                    w(f"    [{i}] {all_times[i]}\n")
         
-        lines.append("")
+        w("\n")
     
     # Grid connectivity
     if 'grid_connectivity' in metadata and metadata['grid_connectivity']:
-        lines.append("GRID CONNECTIVITY")
-        lines.append("-" * 80)
+        w("GRID CONNECTIVITY\n")
+        w("-" * 80 + "\n")
         for key, value in metadata['grid_connectivity'].items():
-            lines.append(f"  {key}: {value}")
-        lines.append("")
+            w("  " + key + ": " + str(value) + "\n")
+        w("\n")
     
     # Coordinates
     if 'coordinates' in metadata:
-        lines.append("COORDINATES")
-        lines.append("-" * 80)
+        w("COORDINATES\n")
+        w("-" * 80 + "\n")
         for coord_name, coord_info in metadata['coordinates'].items():
-            lines.append(f"  {coord_name}:")
-            lines.append(f"    Type: {coord_info['dtype']}")
-            lines.append(f"    Shape: {coord_info['shape']}")
-            lines.append(f"    Dimensions: {coord_info['dimensions']}")
+            w(f"  {coord_name}:\n")
+            w(f"    Type: {coord_info['dtype']}\n")
+            w(f"    Shape: {coord_info['shape']}\n")
+            w(f"    Dimensions: {coord_info['dimensions']}\n")
             
             if 'min' in coord_info:
-                lines.append(f"    Range: {coord_info['min']:.6g} to {coord_info['max']:.6g}")
-                lines.append(f"    Mean: {coord_info['mean']:.6g}")
+                w(f"    Range: {coord_info['min']:.6g} to {coord_info['max']:.6g}\n")
+                w(f"    Mean: {coord_info['mean']:.6g}\n")
                 
                 # Show values or value sample
-                if 'values' in coord_info:
-                    lines.append(f"    Values: {coord_info['values']}")
+                if 'values_repr' in coord_info:
+                    w(f"    Values: {coord_info['values_repr']}\n")
+                elif 'values' in coord_info:
+                    w(f"    Values: {coord_info['values']}\n")
                 elif 'value_sample' in coord_info:
-                    lines.append(f"    Value sample (first 5 and last 5): {coord_info['value_sample']}")
+                    w(f"    Value sample (first 5 and last 5): {coord_info['value_sample']}\n")
                     
                 if 'note' in coord_info:
-                    lines.append(f"    Note: {coord_info['note']}")
+                    w(f"    Note: {coord_info['note']}\n")
             
             if detailed and coord_info['attributes']:
-                lines.append(f"    Attributes:")
+                w(f"    Attributes:\n")
                 for attr_key, attr_val in coord_info['attributes'].items():
-                    lines.append(f"      {attr_key}: {attr_val}")
-        lines.append("")
+                    w("      " + attr_key + ": " + str(attr_val) + "\n")
+        w("\n")
     
     # Variables
     if 'variables' in metadata:
-        lines.append("DATA VARIABLES")
-        lines.append("-" * 80)
+        w("DATA VARIABLES\n")
+        w("-" * 80 + "\n")
         
         # Calculate total size
         total_size_mb = sum(v['size_mb'] for v in metadata['variables'].values())
-        lines.append(f"Total data size: {total_size_mb:.2f} MB")
-        lines.append("")
+        w(f"Total data size: {total_size_mb:.2f} MB\n")
+        w("\n")
         
         for var_name, var_info in metadata['variables'].items():
-            lines.append(f"  {var_name}:")
-            lines.append(f"    Type: {var_info['dtype']}")
-            lines.append(f"    Shape: {var_info['shape']}")
-            lines.append(f"    Dimensions: {var_info['dimensions']}")
-            lines.append(f"    Size: {var_info['size_mb']:.2f} MB")
+            w(f"  {var_name}:\n")
+            w(f"    Type: {var_info['dtype']}\n")
+            w(f"    Shape: {var_info['shape']}\n")
+            w(f"    Dimensions: {var_info['dimensions']}\n")
+            w(f"    Size: {var_info['size_mb']:.2f} MB\n")
             
             if 'min' in var_info:
-                lines.append(f"    Range: {var_info['min']:.6g} to {var_info['max']:.6g}")
-                lines.append(f"    Mean: {var_info['mean']:.6g}")
-                lines.append(f"    Std Dev: {var_info['std']:.6g}")
+                w(f"    Range: {var_info['min']:.6g} to {var_info['max']:.6g}\n")
+                w(f"    Mean: {var_info['mean']:.6g}\n")
+                w(f"    Std Dev: {var_info['std']:.6g}\n")
                 
                 if var_info.get('nan_count', 0) > 0:
-                    lines.append(f"    NaN values: {var_info['nan_count']:,} ({var_info['nan_percentage']:.2f}%)")
+                    w(f"    NaN values: {var_info['nan_count']:,} ({var_info['nan_percentage']:.2f}%)\n")
                 
                 if detailed and 'median' in var_info:
-                    lines.append(f"    Median: {var_info['median']:.6g}")
-                    lines.append(f"    25th percentile: {var_info['percentile_25']:.6g}")
-                    lines.append(f"    75th percentile: {var_info['percentile_75']:.6g}")
-                    lines.append(f"    95th percentile: {var_info['percentile_95']:.6g}")
-                    lines.append(f"    99th percentile: {var_info['percentile_99']:.6g}")
+                    w(f"    Median: {var_info['median']:.6g}\n")
+                    w(f"    25th percentile: {var_info['percentile_25']:.6g}\n")
+                    w(f"    75th percentile: {var_info['percentile_75']:.6g}\n")
+                    w(f"    95th percentile: {var_info['percentile_95']:.6g}\n")
+                    w(f"    99th percentile: {var_info['percentile_99']:.6g}\n")
                 
                 if 'stats_note' in var_info:
-                    lines.append(f"    Note: {var_info['stats_note']}")
+                    w(f"    Note: {var_info['stats_note']}\n")
             
             if 'note' in var_info:
-                lines.append(f"    Note: {var_info['note']}")
+                w(f"    Note: {var_info['note']}\n")
             
             if detailed and var_info['attributes']:
-                lines.append(f"    Attributes:")
+                w(f"    Attributes:\n")
                 for attr_key, attr_val in var_info['attributes'].items():
                     attr_str = str(attr_val)
                     if len(attr_str) > 100:
                         attr_str = attr_str[:100] + "..."
-                    lines.append(f"      {attr_key}: {attr_str}")
+                    w("      " + attr_key + ": " + attr_str + "\n")
             
-            lines.append("")
+            w("\n")
     
-    lines.append("=" * 80)
-    return "\n".join(lines)
+    w("=" * 80)
+    return buf.getvalue()
 
 
 def extract_all_metadata(ds: xr.Dataset, run_info: Optional[Dict] = None, 
-                        detailed_stats: bool = False) -> Dict[str, Any]:
+                        detailed_stats: bool = False,
+                        value_lists: bool = True) -> Dict[str, Any]:
     """
     Extract all metadata from a dataset.
     
@@ -580,6 +869,9 @@ def extract_all_metadata(ds: xr.Dataset, run_info: Optional[Dict] = None,
         Information about the model run
     detailed_stats : bool
         If True, compute detailed statistics
+    value_lists : bool
+        If True, keep small coordinate values as numbers (needed for JSON
+        output); if False, only a formatted string is stored
         
     Returns:
     --------
@@ -599,7 +891,7 @@ def extract_all_metadata(ds: xr.Dataset, run_info: Optional[Dict] = None,
     # Extract all metadata components
     metadata['global_attributes'] = extract_global_attributes(ds)
     metadata['dimensions'] = extract_dimensions_info(ds)
-    metadata['coordinates'] = extract_coordinates_info(ds)
+    metadata['coordinates'] = extract_coordinates_info(ds, value_lists=value_lists)
     metadata['variables'] = extract_variables_info(ds, detailed_stats=detailed_stats)
     metadata['temporal_info'] = extract_temporal_info(ds)
     metadata['spatial_info'] = extract_spatial_info(ds)
@@ -611,6 +903,109 @@ def extract_all_metadata(ds: xr.Dataset, run_info: Optional[Dict] = None,
     return metadata
 
 
+def write_metadata_json(metadata: Dict[str, Any], path: Path, indent: bool = True) -> None:
+    """
+    Serialize metadata to a JSON file.
+    
+    Uses orjson when it is installed (C serializer, native NumPy scalar and
+    array support); otherwise falls back to the standard library.
+    Anything neither can encode natively is written as its str().
+    """
+    if orjson is not None:
+        option = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        Path(path).write_bytes(orjson.dumps(metadata, default=str, option=option))
+    else:
+        with open(path, 'w') as f:
+            json.dump(metadata, f, indent=2 if indent else None, default=str)
+
+
+def _metadata_cache_path(run_info: Dict, detailed_stats: bool = False,
+                         value_lists: bool = True,
+                         chunks: Optional[Dict[str, int]] = None) -> Path:
+    """
+    Location of the cached metadata JSON for a model run.
+    
+    Keyed on the source URL and the extraction options (including the dask
+    chunking the file was opened with), since they change what the variable
+    and coordinate summaries contain.
+    """
+    key = f"{run_info['url']}|detailed={int(detailed_stats)}|lists={int(value_lists)}"
+    if chunks:
+        key += "|chunks=" + ",".join(f"{dim}={size}" for dim, size in sorted(chunks.items()))
+    digest = hashlib.sha1(key.encode()).hexdigest()
+    return DEFAULT_CACHE_DIR / "metadata" / f"{digest}.json"
+
+
+def _nulls_to_nan(obj: Any) -> Any:
+    """Copy of decoded JSON with every null replaced by NaN (extracted
+    metadata holds no None values; NaN statistics come back as null)."""
+    if obj is None:
+        return float('nan')
+    if isinstance(obj, dict):
+        return {k: _nulls_to_nan(v) for k, v in obj.items()}
+    if isinstance(obj, list):
+        return [_nulls_to_nan(v) for v in obj]
+    return obj
+
+
+def load_cached_metadata(run_info: Dict, detailed_stats: bool = False,
+                         value_lists: bool = True,
+                         chunks: Optional[Dict[str, int]] = None) -> Optional[Dict[str, Any]]:
+    """
+    Return previously extracted metadata for a run, or None.
+    
+    The cache entry is only trusted if it is newer than the cached NetCDF
+    file it was extracted from; a re-downloaded file invalidates it.
+    JSON has no tuples, so the coordinate and variable shapes are turned
+    back into tuples, and orjson writes NaN as null, so nulls are turned
+    back into NaN, to match freshly extracted metadata.  'extraction_time'
+    is set to the time the entry is served.
+    """
+    meta_path = _metadata_cache_path(run_info, detailed_stats, value_lists, chunks)
+    nc_path = DEFAULT_CACHE_DIR / get_cached_filename(run_info)
+    if not meta_path.exists() or not nc_path.exists():
+        return None
+    if meta_path.stat().st_mtime < nc_path.stat().st_mtime:
+        return None
+    try:
+        with open(meta_path) as f:
+            metadata = json.load(f)
+    except (OSError, ValueError):
+        return None
+    metadata = _nulls_to_nan(metadata)
+    for section in ('coordinates', 'variables'):
+        for info in metadata.get(section, {}).values():
+            if isinstance(info.get('shape'), list):
+                info['shape'] = tuple(info['shape'])
+    metadata['extraction_time'] = dt.datetime.now(timezone.utc).isoformat()
+    return metadata
+
+
+def save_cached_metadata(metadata: Dict[str, Any], run_info: Dict, 
+                         detailed_stats: bool = False, value_lists: bool = True,
+                         chunks: Optional[Dict[str, int]] = None) -> None:
+    """Write extracted metadata to the on-disk metadata cache."""
+    meta_path = _metadata_cache_path(run_info, detailed_stats, value_lists, chunks)
+    meta_path.parent.mkdir(parents=True, exist_ok=True)
+    write_metadata_json(metadata, meta_path, indent=False)
+
+
+def parse_chunks(text: str) -> Dict[str, int]:
+    """Parse a 'dim=size,dim=size' string into a chunks mapping."""
+    chunks = {}
+    for item in text.split(','):
+        dim, sep, size = item.partition('=')
+        if not sep or not dim.strip():
+            raise argparse.ArgumentTypeError(f"invalid chunk spec '{item}', expected dim=size")
+        try:
+            chunks[dim.strip()] = int(size)
+        except ValueError:
+            raise argparse.ArgumentTypeError(f"invalid chunk size in '{item}'")
+    return chunks
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="Extract metadata from SSCOFS NetCDF files"
@@ -669,6 +1064,14 @@ def main():
         help="Include detailed information in text output"
     )
     
+    parser.add_argument(
+        "--chunks",
+        type=parse_chunks,
+        default=None,
+        help="Open the file with dask chunks, e.g. 'node=100000,nele=200000' "
+             "(requires dask; statistics are then reduced chunk by chunk)"
+    )
+    
     # Cache options
     parser.add_argument(
         "--no-cache",
@@ -718,15 +1121,30 @@ def main():
         
         print()
         
-        # Load the dataset
-        ds = load_sscofs_data(run_info, use_cache=not args.no_cache, verbose=True)
-        print()
+        # Numeric coordinate value lists are only needed for JSON output
+        value_lists = bool(args.json)
+        metadata = None
+        if not args.no_cache:
+            metadata = load_cached_metadata(run_info, args.detailed_stats, value_lists,
+                                            chunks=args.chunks)
+            if metadata is not None:
+                print("Using cached metadata")
+                print()
         
-        # Extract metadata
-        print("Extracting metadata...")
-        metadata = extract_all_metadata(ds, run_info, detailed_stats=args.detailed_stats)
-        print("Done!")
-        print()
+        if metadata is None:
+            # Load the dataset
+            ds = load_sscofs_data(run_info, use_cache=not args.no_cache, verbose=True,
+                                  chunks=args.chunks)
+            print()
+            
+            # Extract metadata
+            print("Extracting metadata...")
+            metadata = extract_all_metadata(ds, run_info, detailed_stats=args.detailed_stats,
+                                            value_lists=value_lists)
+            save_cached_metadata(metadata, run_info, args.detailed_stats, value_lists,
+                                 chunks=args.chunks)
+            print("Done!")
+            print()
         
         # Format and display
         text_output = format_metadata_text(metadata, detailed=args.detailed)
@@ -741,8 +1159,7 @@ def main():
         # Save JSON output if requested
         if args.json:
             json_path = Path(args.json)
-            with open(json_path, 'w') as f:
-                json.dump(metadata, f, indent=2, default=str)
+            write_metadata_json(metadata, json_path)
             print(f"Metadata JSON saved to: {json_path}")
         
         return 0
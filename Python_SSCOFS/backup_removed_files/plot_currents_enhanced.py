@@ -21,39 +21,32 @@ Usage:
 import argparse
 import datetime as dt
 from datetime import timezone, timedelta
-import numpy as np
-import pandas as pd
-import matplotlib.pyplot as plt
-import matplotlib.tri as mtri
-import xarray as xr
-from matplotlib.patches import Circle
-from matplotlib.colors import Normalize
-from matplotlib.cm import get_cmap
+from functools import lru_cache
 from pathlib import Path
-from pyproj import Transformer
+import numpy as np
 
-# Optional basemap dependencies
-try:
-    import contextily as ctx
-    HAS_CONTEXTILY = True
-except ImportError:
-    HAS_CONTEXTILY = False
+# matplotlib, pandas, pyproj, scipy and the optional basemap packages
+# (contextily, geopandas) are imported where they are used, so the
+# --list-cache / --clear-cache paths start without loading them.
 
 try:
-    import geopandas as gpd
-    HAS_GEOPANDAS = True
+    import numba as _numba_mod
+    _NUMBA_AVAILABLE = True
 except ImportError:
-    HAS_GEOPANDAS = False
+    _NUMBA_AVAILABLE = False
+    _numba_mod = None
 
-# Import helper functions from existing modules
-from latest_cycle import latest_cycle_and_url_for_local_hour
-from fetch_sscofs import build_sscofs_url
-from sscofs_cache import load_sscofs_data, list_cache, clear_cache
 
 def get_utm_zone(lon):
     """Get UTM zone number from longitude."""
     return int((lon + 180) / 6) + 1
 
+@lru_cache(maxsize=None)
+def _utm10n_transformer():
+    """WGS84 -> UTM Zone 10N transformer, built once per process."""
+    from pyproj import Transformer
+    return Transformer.from_crs("EPSG:4326", "EPSG:32610", always_xy=True)
+
 def create_utm_transformer(center_lat, center_lon):
     """
     Create a transformer for converting lat/lon to UTM coordinates.
@@ -63,11 +56,11 @@ def create_utm_transformer(center_lat, center_lon):
     hemisphere = 'north' if center_lat >= 0 else 'south'
     
     # For Puget Sound, we know it's UTM Zone 10N (EPSG:32610)
-    transformer = Transformer.from_crs("EPSG:4326", "EPSG:32610", always_xy=True)
+    transformer = _utm10n_transformer()
     
     return transformer, utm_zone, hemisphere
 
-def add_basemap(ax, basemap_type='contextily', zoom='auto', alpha=0.5):
+def add_basemap(ax, basemap_type='contextily', zoom='auto', alpha=0.5, reuse_from=None):
     """
     Add a basemap to the axis.
     
@@ -83,6 +76,9 @@ def add_basemap(ax, basemap_type='contextily', zoom='auto', alpha=0.5):
         Zoom level for contextily ('auto' or 1-18)
     alpha : float
         Transparency of basemap (0=transparent, 1=opaque)
+    reuse_from : matplotlib.axes.Axes, optional
+        Axis that already has a contextily basemap for the same extent;
+        its tile image is copied instead of being fetched again
     
     Returns:
     --------
@@ -92,7 +88,19 @@ def add_basemap(ax, basemap_type='contextily', zoom='auto', alpha=0.5):
         return False
     
     if basemap_type == 'contextily':
-        if not HAS_CONTEXTILY:
+        if reuse_from is not None and reuse_from.images:
+            # Same bounding box as the other panel: reuse the warped tiles
+            # rather than making a second round of tile requests
+            tiles = reuse_from.images[0]
+            ax.imshow(tiles.get_array(), extent=tiles.get_extent(), alpha=alpha,
+                      interpolation='bilinear')
+            print(f"  Reused basemap tiles (alpha={alpha})")
+            return True
+        
+        try:
+            import contextily as ctx
+            from pyproj import Transformer
+        except ImportError:
             print("Warning: contextily not installed. Install with: pip install contextily")
             return False
         
@@ -126,7 +134,9 @@ def add_basemap(ax, basemap_type='contextily', zoom='auto', alpha=0.5):
             return False
     
     elif basemap_type == 'natural_earth':
-        if not HAS_GEOPANDAS:
+        try:
+            import geopandas as gpd
+        except ImportError:
             print("Warning: geopandas not installed. Install with: conda install geopandas")
             return False
         
@@ -169,6 +179,9 @@ def get_latest_current_data(use_cache=True):
     Get the latest SSCOFS current data using the current time.
     Returns the dataset and metadata about the run.
     """
+    from latest_cycle import latest_cycle_and_url_for_local_hour
+    from sscofs_cache import load_sscofs_data
+    
     current_time_utc = dt.datetime.now(timezone.utc)
     try:
         from zoneinfo import ZoneInfo
@@ -194,7 +207,83 @@ def get_latest_current_data(use_cache=True):
     
     return ds, info
 
-def interpolate_to_grid(x_utm, y_utm, u, v, x0, y0, R_utm, nx=300, ny=300, pad_factor=0.1):
+def barycentric_weights(x, y, xq, yq):
+    """
+    Linear (barycentric) interpolation weights of query points on the
+    Delaunay triangulation of scattered points.
+    
+    Parameters:
+    -----------
+    x, y : 1D arrays
+        Data point coordinates
+    xq, yq : 1D arrays
+        Query point coordinates
+    
+    Returns:
+    --------
+    verts : (M, 3) int array
+        Data point indices of the triangle containing each query point
+    weights : (M, 3) array
+        Barycentric weights for those vertices
+    outside : (M,) bool array
+        True where the query point lies outside the triangulation
+    """
+    from scipy.spatial import Delaunay
+    
+    tri = Delaunay(np.column_stack([x, y]))
+    q = np.column_stack([xq, yq])
+    simplex = tri.find_simplex(q)
+    T = tri.transform[simplex]
+    b = np.einsum('ijk,ik->ij', T[:, :2], q - T[:, 2])
+    weights = np.column_stack([b, 1.0 - b.sum(axis=1)])
+    return tri.simplices[simplex], weights, simplex < 0
+
+@lru_cache(maxsize=8)
+def _cached_grid_weights(x_bytes, y_bytes, xmin, xmax, ymin, ymax, nx, ny):
+    """
+    barycentric_weights for a regular nx-by-ny grid, memoized on the raw
+    mesh coordinates and grid bounds.  The SSCOFS mesh is static, so
+    redraws of other time steps reuse the triangulation.  The returned
+    arrays are shared between calls and marked read-only.
+    """
+    x = np.frombuffer(x_bytes, dtype=np.float64)
+    y = np.frombuffer(y_bytes, dtype=np.float64)
+    Xg, Yg = np.meshgrid(np.linspace(xmin, xmax, nx), np.linspace(ymin, ymax, ny))
+    result = barycentric_weights(x, y, Xg.ravel(), Yg.ravel())
+    for a in result:
+        a.setflags(write=False)
+    return result
+
+if _NUMBA_AVAILABLE:
+    @_numba_mod.njit(parallel=True, cache=True,
+                     fastmath={'nsz', 'arcp', 'contract', 'afn', 'reassoc'})
+    def _apply_bary(verts, weights, outside, u, v, Ug, Vg):
+        """
+        Gather and blend u and v at every grid node in one pass, writing
+        into the flat outputs Ug, Vg.  Nodes outside the mesh, or with a
+        NaN in either component, are NaN in both.
+        """
+        for k in _numba_mod.prange(Ug.size):
+            if outside[k]:
+                Ug[k] = np.nan
+                Vg[k] = np.nan
+                continue
+            a = 0.0
+            b = 0.0
+            for m in range(3):
+                w = weights[k, m]
+                a += w * u[verts[k, m]]
+                b += w * v[verts[k, m]]
+            if np.isnan(a) or np.isnan(b):
+                a = np.nan
+                b = np.nan
+            Ug[k] = a
+            Vg[k] = b
+else:
+    _apply_bary = None
+
+def interpolate_to_grid(x_utm, y_utm, u, v, x0, y0, R_utm, nx=300, ny=300, pad_factor=0.1,
+                        dtype=np.float32):
     """
     Interpolate unstructured u,v data to a regular grid for visualization.
     
@@ -212,6 +301,9 @@ def interpolate_to_grid(x_utm, y_utm, u, v, x0, y0, R_utm, nx=300, ny=300, pad_f
         Grid resolution
     pad_factor : float
         Padding around the circle as fraction of radius
+    dtype : numpy dtype
+        Precision of the gridded velocity fields (default float32; grid
+        coordinates stay float64 since UTM northings are ~5e6 m)
     
     Returns:
     --------
@@ -230,23 +322,102 @@ def interpolate_to_grid(x_utm, y_utm, u, v, x0, y0, R_utm, nx=300, ny=300, pad_f
     yg = np.linspace(ymin, ymax, ny)
     Xg, Yg = np.meshgrid(xg, yg)
     
-    # Triangulate and interpolate
-    tri = mtri.Triangulation(x_utm, y_utm)
-    interp_u = mtri.LinearTriInterpolator(tri, u)
-    interp_v = mtri.LinearTriInterpolator(tri, v)
-    
-    Ug = interp_u(Xg, Yg).filled(np.nan)
-    Vg = interp_v(Xg, Yg).filled(np.nan)
+    # Triangulate once and locate every grid node in it once; the same
+    # vertices and barycentric weights then serve both u and v, and every
+    # later frame on the same mesh subset and grid
+    verts, weights, outside = _cached_grid_weights(
+        np.ascontiguousarray(x_utm, dtype=np.float64).tobytes(),
+        np.ascontiguousarray(y_utm, dtype=np.float64).tobytes(),
+        float(xmin), float(xmax), float(ymin), float(ymax), int(nx), int(ny))
+    if _apply_bary is not None:
+        Ug = np.empty(ny * nx, dtype=dtype)
+        Vg = np.empty(ny * nx, dtype=dtype)
+        _apply_bary(verts, weights, outside,
+                    np.ascontiguousarray(u, dtype=np.float64),
+                    np.ascontiguousarray(v, dtype=np.float64), Ug, Vg)
+        Ug = Ug.reshape(ny, nx)
+        Vg = Vg.reshape(ny, nx)
+        return xg, yg, Xg, Yg, Ug, Vg, np.hypot(Ug, Vg)
+    
+    uv = np.column_stack([u, v])
+    # A cell missing either component is dropped for both, so Ug, Vg and
+    # Sg share one NaN footprint without re-masking the grid afterwards
+    uv[np.isnan(uv).any(axis=1)] = np.nan
+    UVg = np.einsum('ij,ijk->ik', weights, uv[verts]).astype(dtype, copy=False)
+    UVg[outside] = np.nan
+    Ug = UVg[:, 0].reshape(ny, nx)
+    Vg = UVg[:, 1].reshape(ny, nx)
     Sg = np.hypot(Ug, Vg)
     
-    # Mask land/NaN
-    mask = np.isnan(Sg)
-    Ug[mask] = np.nan
-    Vg[mask] = np.nan
-    Sg[mask] = np.nan
-    
     return xg, yg, Xg, Yg, Ug, Vg, Sg
 
+if _NUMBA_AVAILABLE:
+    # Every fastmath flag except 'nnan'/'ninf', so NaN (land) cells propagate.
+    @_numba_mod.njit(parallel=True, cache=True,
+                     fastmath={'nsz', 'arcp', 'contract', 'afn', 'reassoc'})
+    def _flow_diag_kernel(Ug, Vg, dx, dy, zeta, div, OW):
+        """
+        Vorticity, divergence and Okubo-Weiss in one pass over a uniform
+        grid.  Same stencil as np.gradient: centered differences inside,
+        one-sided first-order differences on the edges.  A NaN at any
+        stencil neighbour makes the outputs NaN, exactly as np.gradient's
+        differences do (the centre cell is not part of a centered stencil).
+        """
+        ny, nx = Ug.shape
+        for i in _numba_mod.prange(ny):
+            if i == 0:
+                im, ip, hy = 0, 1, dy
+            elif i == ny - 1:
+                im, ip, hy = ny - 2, ny - 1, dy
+            else:
+                im, ip, hy = i - 1, i + 1, 2.0 * dy
+            for j in range(nx):
+                if j == 0:
+                    jm, jp, hx = 0, 1, dx
+                elif j == nx - 1:
+                    jm, jp, hx = nx - 2, nx - 1, dx
+                else:
+                    jm, jp, hx = j - 1, j + 1, 2.0 * dx
+                ux = (Ug[i, jp] - Ug[i, jm]) / hx
+                vx = (Vg[i, jp] - Vg[i, jm]) / hx
+                uy = (Ug[ip, j] - Ug[im, j]) / hy
+                vy = (Vg[ip, j] - Vg[im, j]) / hy
+                z = vx - uy
+                sn = ux - vy
+                ss = vx + uy
+                zeta[i, j] = z
+                div[i, j] = ux + vy
+                OW[i, j] = sn * sn + ss * ss - z * z
+
+    @_numba_mod.njit(parallel=True, cache=True,
+                     fastmath={'nsz', 'arcp', 'contract', 'afn', 'reassoc'})
+    def _grad_mag_kernel(S, dx, dy, W):
+        """
+        |grad S| on a uniform grid with the np.gradient stencil, written
+        straight into W without the two intermediate derivative arrays.
+        """
+        ny, nx = S.shape
+        for i in _numba_mod.prange(ny):
+            if i == 0:
+                im, ip, hy = 0, 1, dy
+            elif i == ny - 1:
+                im, ip, hy = ny - 2, ny - 1, dy
+            else:
+                im, ip, hy = i - 1, i + 1, 2.0 * dy
+            for j in range(nx):
+                if j == 0:
+                    jm, jp, hx = 0, 1, dx
+                elif j == nx - 1:
+                    jm, jp, hx = nx - 2, nx - 1, dx
+                else:
+                    jm, jp, hx = j - 1, j + 1, 2.0 * dx
+                sx = (S[i, jp] - S[i, jm]) / hx
+                sy = (S[ip, j] - S[im, j]) / hy
+                W[i, j] = np.sqrt(sx * sx + sy * sy)
+else:
+    _flow_diag_kernel = None
+    _grad_mag_kernel = None
+
 def compute_flow_diagnostics(Ug, Vg, xg, yg):
     """
     Compute flow diagnostics: vorticity, divergence, and Okubo-Weiss parameter.
@@ -267,9 +438,29 @@ def compute_flow_diagnostics(Ug, Vg, xg, yg):
     OW : 2D array
         Okubo-Weiss parameter (s^-2)
     """
-    # Compute derivatives (note: np.gradient order is rows->y, cols->x)
-    Vy, Vx = np.gradient(Vg, yg, xg)
-    Uy, Ux = np.gradient(Ug, yg, xg)
+    # The fields only feed contour overlays, so float32 is plenty and halves
+    # the memory traffic (interpolate_to_grid already returns float32)
+    Ug = np.asarray(Ug, dtype=np.float32)
+    Vg = np.asarray(Vg, dtype=np.float32)
+    
+    if _flow_diag_kernel is not None and Ug.shape[0] > 1 and Ug.shape[1] > 1:
+        # xg, yg come from np.linspace, so the spacing is uniform
+        zeta = np.empty(Ug.shape, dtype=np.float32)
+        div = np.empty(Ug.shape, dtype=np.float32)
+        OW = np.empty(Ug.shape, dtype=np.float32)
+        _flow_diag_kernel(Ug, Vg, float(xg[1] - xg[0]), float(yg[1] - yg[0]),
+                          zeta, div, OW)
+        return zeta, div, OW
+    
+    # Compute derivatives (note: np.gradient order is rows->y, cols->x).
+    # Scalar spacings keep the result in float32; float32 UTM coordinates
+    # (~5e6 m) would lose too much precision to difference.
+    if len(xg) > 1 and len(yg) > 1:
+        dx, dy = float(xg[1] - xg[0]), float(yg[1] - yg[0])
+    else:
+        dx = dy = 1.0
+    Vy, Vx = np.gradient(Vg, dy, dx)
+    Uy, Ux = np.gradient(Ug, dy, dx)
     
     # Vorticity: ζ = ∂v/∂x - ∂u/∂y
     zeta = Vx - Uy
@@ -310,34 +501,45 @@ def adaptive_quiver_points(Xg, Yg, Ug, Vg, Sg, xg, yg, percentile=70, min_pix=5)
         Arrow positions, velocities, and speeds
     """
     # Compute gradient magnitude of speed
-    Sy, Sx = np.gradient(Sg, yg, xg)
-    W = np.hypot(Sx, Sy)
+    if _grad_mag_kernel is not None and Sg.shape[0] > 1 and Sg.shape[1] > 1:
+        # xg, yg come from np.linspace, so the spacing is uniform
+        W = np.empty(Sg.shape)
+        _grad_mag_kernel(Sg, float(xg[1] - xg[0]), float(yg[1] - yg[0]), W)
+    else:
+        Sy, Sx = np.gradient(Sg, yg, xg)
+        W = np.hypot(Sx, Sy)
     
     mask = np.isnan(Sg)
     
     # Build sampling mask using gradient threshold
     thr = np.nanpercentile(W, percentile)
-    candidates = np.argwhere((~mask) & (W >= thr))
-    
-    # Greedy min-distance thinning
-    keep = []
-    for iy, ix in candidates:
-        if all((abs(iy - ky) > min_pix) or (abs(ix - kx) > min_pix) for ky, kx in keep):
-            keep.append((iy, ix))
     
-    if len(keep) == 0:
+    # Block thinning: split the grid into (min_pix+1)-cell tiles and keep the
+    # strongest-gradient cell of each tile if it clears the threshold.  One
+    # vectorized pass instead of a greedy O(N*K) distance check per candidate.
+    b = int(min_pix) + 1
+    nby, nbx = Sg.shape[0] // b, Sg.shape[1] // b
+    Wc = np.where(mask | np.isnan(W), -np.inf, W)[:nby * b, :nbx * b]
+    tiles = Wc.reshape(nby, b, nbx, b).transpose(0, 2, 1, 3).reshape(nby, nbx, b * b)
+    k = tiles.argmax(axis=-1)
+    best = np.take_along_axis(tiles, k[..., None], axis=-1)[..., 0]
+    iy = np.arange(nby)[:, None] * b + k // b
+    ix = np.arange(nbx)[None, :] * b + k % b
+    sel = best >= thr
+    iy, ix = iy[sel], ix[sel]
+    
+    if iy.size == 0:
         # Fallback: just take every min_pix points
-        iy_idx = np.arange(0, len(yg), min_pix*2)
-        ix_idx = np.arange(0, len(xg), min_pix*2)
-        for iy in iy_idx:
-            for ix in ix_idx:
-                if iy < Sg.shape[0] and ix < Sg.shape[1] and not mask[iy, ix]:
-                    keep.append((iy, ix))
-    
-    qy = np.array([yg[iy] for iy, ix in keep])
-    qx = np.array([xg[ix] for iy, ix in keep])
-    qu = np.array([Ug[iy, ix] for iy, ix in keep])
-    qv = np.array([Vg[iy, ix] for iy, ix in keep])
+        iy_idx = np.arange(0, min(len(yg), Sg.shape[0]), min_pix*2)
+        ix_idx = np.arange(0, min(len(xg), Sg.shape[1]), min_pix*2)
+        iy, ix = np.meshgrid(iy_idx, ix_idx, indexing='ij')
+        valid = ~mask[iy, ix]
+        iy, ix = iy[valid], ix[valid]
+    
+    qy = yg[iy]
+    qx = xg[ix]
+    qu = Ug[iy, ix]
+    qv = Vg[iy, ix]
     qs = np.hypot(qu, qv)
     
     return qx, qy, qu, qv, qs
@@ -373,6 +575,16 @@ def plot_currents_enhanced(ds, center_lat, center_lon, radius_miles=5,
         None - no basemap (default)
     """
     
+    import matplotlib.pyplot as plt
+    import pandas as pd
+    from matplotlib.patches import Circle
+    from matplotlib.colors import ListedColormap, Normalize
+    from matplotlib.cm import get_cmap
+    
+    # ContourPy's 'serial' algorithm is roughly 2x faster than the default
+    # 'mpl2014' for the same contours (selectable from matplotlib 3.6)
+    contour_kw = {'algorithm': 'serial'} if 'contour.algorithm' in plt.rcParams else {}
+    
     # Convert radius from miles to meters
     radius_meters = radius_miles * 1609.34
     
@@ -380,30 +592,48 @@ def plot_currents_enhanced(ds, center_lat, center_lon, radius_miles=5,
     transformer, utm_zone, hemisphere = create_utm_transformer(center_lat, center_lon)
     print(f"\nUsing UTM Zone {utm_zone}{hemisphere[0].upper()} (EPSG:32610) for plotting")
     
-    # Extract surface currents (first sigma layer)
-    u = ds["u"].isel(time=time_index, siglay=0)
-    v = ds["v"].isel(time=time_index, siglay=0)
+    # Extract surface currents (first sigma layer); both fields are read in
+    # one load, and everything below works on plain NumPy arrays
+    surface = ds[["u", "v"]].isel(time=time_index, siglay=0).load()
+    u = np.asarray(surface["u"].values)
+    v = np.asarray(surface["v"].values)
     
     # Get coordinates (u,v are on elements, so use lonc, latc)
-    lons = ds["lonc"].values
-    lats = ds["latc"].values
-    
-    # Convert longitudes from 0-360 to -180 to 180 if needed
-    if lons.max() > 180:
-        lons = np.where(lons > 180, lons - 360, lons)
+    lons = np.asarray(ds["lonc"].values)
+    lats = np.asarray(ds["latc"].values)
+    
+    # Coarse lon/lat bounding box first, so only the local subset of the
+    # mesh is reprojected.  The longitude difference is wrapped, which
+    # also covers meshes stored in 0-360.
+    dlat = radius_meters / 111320.0
+    dlon = dlat / np.cos(np.radians(center_lat))
+    dlon_all = (lons - center_lon + 180.0) % 360.0 - 180.0
+    bbox = (np.abs(lats - center_lat) < 1.5 * dlat) & (np.abs(dlon_all) < 1.5 * dlon)
+    lons = lons[bbox]
+    lats = lats[bbox]
+    
+    # Convert longitudes from 0-360 to -180 to 180 if needed (in place; the
+    # boolean indexing above already made lons a private copy)
+    np.subtract(lons, 360.0, out=lons, where=lons > 180)
     
     # Transform to UTM
-    x_utm, y_utm = transformer.transform(lons, lats)
-    center_x, center_y = transformer.transform(center_lon, center_lat)
-    
-    # Mask to radius
-    distances = np.sqrt((x_utm - center_x)**2 + (y_utm - center_y)**2)
-    mask = distances <= radius_meters * 1.2  # Slightly larger for interpolation
+    # One call for the mesh and the centre point together
+    x_all, y_all = transformer.transform(np.append(lons, center_lon),
+                                         np.append(lats, center_lat))
+    x_utm, y_utm = x_all[:-1], y_all[:-1]
+    center_x, center_y = float(x_all[-1]), float(y_all[-1])
+    
+    # Mask to radius, comparing squared distances (no sqrt)
+    dx = x_utm - center_x
+    dy = y_utm - center_y
+    r2 = dx * dx
+    r2 += dy * dy
+    mask = r2 <= (radius_meters * 1.2)**2  # Slightly larger for interpolation
     
     x_masked = x_utm[mask]
     y_masked = y_utm[mask]
-    u_masked = u.values[mask]
-    v_masked = v.values[mask]
+    u_masked = u[bbox][mask]
+    v_masked = v[bbox][mask]
     
     print(f"\nStatistics for currents within {radius_miles} miles:")
     print(f"  Number of data points: {len(x_masked)}")
@@ -414,10 +644,13 @@ def plot_currents_enhanced(ds, center_lat, center_lon, radius_miles=5,
     
     # Interpolate to regular grid
     print("\nInterpolating to regular grid...")
+    # A colour background doesn't need 300x300; keep the finer grid only
+    # for the derivative-based diagnostics
+    n_grid = 300 if (show_diagnostics or style == 'diagnostic') else 200
     xg, yg, Xg, Yg, Ug, Vg, Sg = interpolate_to_grid(
         x_masked, y_masked, u_masked, v_masked,
         center_x, center_y, radius_meters,
-        nx=300, ny=300
+        nx=n_grid, ny=n_grid
     )
     
     # Convert speed to knots
@@ -468,17 +701,20 @@ def plot_currents_enhanced(ds, center_lat, center_lon, radius_miles=5,
         
         add_basemap(ax1, basemap_type=basemap, zoom='auto', alpha=0.5)
     
-    # 1) Filled contours for speed bands
-    levels = np.linspace(vmin, vmax, 20)
-    cs = ax1.contourf(Xg, Yg, Sg_knots, levels=levels, cmap=cmap, norm=norm, alpha=0.7)
+    # 1) Speed field as a raster background; it is purely colour, so a
+    # pcolormesh (one image at savefig) is much cheaper than contour polygons
+    cs = ax1.pcolormesh(xg, yg, Sg_knots, cmap=cmap, norm=norm, shading='auto',
+                        alpha=0.7, rasterized=True)
     
     # 2) Add flow visualization based on style
     if style in ['streamline', 'both', 'diagnostic']:
         print("Adding streamlines...")
-        # Variable linewidth based on speed
-        lw_base = 0.5
-        lw_var = 2.0 * (Sg - np.nanmin(Sg)) / (np.nanmax(Sg) - np.nanmin(Sg) + 1e-10)
-        lw = lw_base + lw_var
+        # Variable linewidth based on speed, scaled on the same vmin/vmax
+        # as the colours (no extra nanmin/nanmax passes), built in place
+        lw = (Sg_knots - vmin) / (vmax - vmin + 1e-10)
+        np.clip(lw, 0.0, 1.0, out=lw)
+        lw *= 2.0
+        lw += 0.5
         
         # Streamplot
         strm = ax1.streamplot(
@@ -488,11 +724,16 @@ def plot_currents_enhanced(ds, center_lat, center_lon, radius_miles=5,
             linewidth=lw, broken_streamlines=False,
             zorder=3
         )
+        # Hundreds of line segments and arrow patches; rasterize them so
+        # savefig emits one image instead of serializing every path
+        strm.lines.set_rasterized(True)
+        strm.arrows.set_rasterized(True)
     
     if style in ['adaptive', 'both', 'diagnostic']:
         print("Computing adaptive quiver placement...")
         qx, qy, qu, qv, qs = adaptive_quiver_points(Xg, Yg, Ug, Vg, Sg, xg, yg,
-                                                     percentile=70, min_pix=8)
+                                                     percentile=70,
+                                                     min_pix=max(1, round(8 * n_grid / 300)))
         qs_knots = qs * 1.94384
         
         print(f"  Placing {len(qx)} arrows at high-gradient locations")
@@ -507,7 +748,8 @@ def plot_currents_enhanced(ds, center_lat, center_lon, radius_miles=5,
     # 3) Tactical speed contours (0.5, 1.0, 1.5 knots)
     tactical_levels = [0.5, 1.0, 1.5, 2.0]
     ax1.contour(Xg, Yg, Sg_knots, levels=tactical_levels, 
-               colors='white', linewidths=1.2, alpha=0.6, linestyles='-')
+               colors='white', linewidths=1.2, alpha=0.6, linestyles='-',
+               **contour_kw)
     
     # Label the tactical contours
     ax1.text(0.02, 0.98, 'White contours: 0.5, 1.0, 1.5, 2.0 knots',
@@ -550,28 +792,34 @@ def plot_currents_enhanced(ds, center_lat, center_lon, radius_miles=5,
             ax2.set_xlim(ax1.get_xlim())
             ax2.set_ylim(ax1.get_ylim())
             ax2.set_aspect('equal')
-            add_basemap(ax2, basemap_type=basemap, zoom='auto', alpha=0.5)
+            add_basemap(ax2, basemap_type=basemap, zoom='auto', alpha=0.5,
+                        reuse_from=ax1)
         
         # Background: speed contours (lighter)
-        ax2.contourf(Xg, Yg, Sg_knots, levels=levels, cmap=cmap, norm=norm, alpha=0.4)
+        ax2.pcolormesh(xg, yg, Sg_knots, cmap=cmap, norm=norm, shading='auto',
+                       alpha=0.4, rasterized=True)
         
         # Vorticity contours (diverging colormap)
         zeta_levels = np.linspace(np.nanpercentile(zeta, 5), 
                                  np.nanpercentile(zeta, 95), 9)
         vort_cs = ax2.contour(Xg, Yg, zeta, levels=zeta_levels,
-                             cmap='PuOr', alpha=0.7, linewidths=1.5)
+                             cmap='PuOr', alpha=0.7, linewidths=1.5,
+                             rasterized=True, **contour_kw)
         ax2.clabel(vort_cs, inline=True, fontsize=8, fmt='%0.1e')
         
         # Okubo-Weiss zero contour (boundary between strain/eddy regimes)
         ax2.contour(Xg, Yg, OW, levels=[0], colors='black', 
                    linewidths=2, linestyles='--', 
-                   label='OW=0 (eddy/strain boundary)')
+                   label='OW=0 (eddy/strain boundary)', **contour_kw)
         
-        # Mark eddy cores (OW < 0, strong vorticity)
+        # Mark eddy cores (OW < 0, strong vorticity); a binary fill needs no
+        # contour polygons, so draw it as a single NaN-masked raster
         eddy_mask = OW < np.nanpercentile(OW, 20)
         if np.any(eddy_mask):
-            ax2.contourf(Xg, Yg, eddy_mask.astype(float), 
-                        levels=[0.5, 1.5], colors=['cyan'], alpha=0.2)
+            ax2.imshow(np.where(eddy_mask, 1.0, np.nan),
+                       extent=[xg[0], xg[-1], yg[0], yg[-1]], origin='lower',
+                       cmap=ListedColormap(['cyan']), alpha=0.2,
+                       interpolation='nearest', zorder=2)
         
         # Add annotations
         ax2.text(0.02, 0.98, 
@@ -609,7 +857,11 @@ def plot_currents_enhanced(ds, center_lat, center_lon, radius_miles=5,
     plt.tight_layout()
     
     if save_file:
-        plt.savefig(save_file, dpi=150, bbox_inches='tight')
+        # Drop the per-run timestamp for vector formats (PNG has none)
+        date_key = {'.pdf': 'CreationDate', '.ps': 'CreationDate',
+                    '.eps': 'CreationDate', '.svg': 'Date'}.get(Path(save_file).suffix.lower())
+        plt.savefig(save_file, dpi=150, bbox_inches='tight',
+                    metadata={date_key: None} if date_key else None)
         print(f"\nPlot saved to: {save_file}")
     
     plt.show()
@@ -672,10 +924,12 @@ def main():
     
     # Handle cache management
     if args.list_cache:
+        from sscofs_cache import list_cache
         list_cache()
         return 0
     
     if args.clear_cache:
+        from sscofs_cache import clear_cache
         clear_cache()
         return 0
     
@@ -8,13 +8,13 @@ Display u and v components side by side to verify the interpolation works correc
 Key features:
 - Area-weighted interpolation from cells to nodes (respects wet/dry boundaries)
 - Masked triangulation that excludes dry cells
-- Land/water mask for proper rendering of coastlines
+- Land shown through the colormap's "bad" colour (land = NaN)
 - Only interpolates over water areas (land = NaN)
 - Quiver arrows showing current direction and magnitude
 - Optional basemap support (contextily web tiles or local shapefiles)
 
 The 'inside' mask identifies valid water grid points.
-The land_mask (~inside) can be used to overlay basemaps, coastlines, or land features.
+Its complement (land) can be used to overlay basemaps, coastlines, or land features.
 
 Usage:
     python plot_currents_simple.py
@@ -25,6 +25,7 @@ Usage:
 import argparse
 import datetime as dt
 from datetime import timezone, timedelta
+from functools import lru_cache
 import numpy as np
 import pandas as pd
 import matplotlib.pyplot as plt
@@ -36,15 +37,49 @@ from pyproj import Transformer
 # Import helper functions from existing modules
 from latest_cycle import latest_cycle_and_url_for_local_hour
 from sscofs_cache import load_sscofs_data, list_cache, clear_cache
-from basemap_utils import add_basemap
+from extract_sscofs_metadata import partition_percentiles
+
+try:
+    import numba as _numba_mod
+    _NUMBA_AVAILABLE = True
+except ImportError:
+    _NUMBA_AVAILABLE = False
+    _numba_mod = None
+
+@lru_cache(maxsize=None)
+def _utm10n_transformer():
+    """WGS84 -> UTM Zone 10N transformer, built once per process."""
+    return Transformer.from_crs("EPSG:4326", "EPSG:32610", always_xy=True)
 
 def create_utm_transformer(center_lat, center_lon):
     """
     Create a transformer for converting lat/lon to UTM coordinates.
     For Puget Sound, we use UTM Zone 10N (EPSG:32610).
     """
-    transformer = Transformer.from_crs("EPSG:4326", "EPSG:32610", always_xy=True)
-    return transformer
+    return _utm10n_transformer()
+
+def lonlat_box(lons, lats, center_lat, center_lon, half_m):
+    """
+    Boolean mask of points within a lon/lat box of roughly +/-half_m metres
+    around the center.  The longitude difference is wrapped, so meshes
+    stored in 0-360 work as well.
+    """
+    dlat = half_m / 111000.0
+    dlon = dlat / np.cos(np.radians(center_lat))
+    dlon_all = (lons - center_lon + 180.0) % 360.0 - 180.0
+    return (np.abs(lats - center_lat) < dlat) & (np.abs(dlon_all) < dlon)
+
+def as_bool_mask(values):
+    """
+    0/1 mask as a bool array.  Masks stored one byte wide (bool, int8,
+    uint8) are reinterpreted in place instead of copied.
+    """
+    values = np.asarray(values)
+    if values.dtype == np.bool_:
+        return values
+    if values.dtype.itemsize == 1 and values.dtype.kind in 'iu':
+        return values.view(np.bool_)
+    return values != 0
 
 def get_latest_current_data(use_cache=True):
     """
@@ -76,39 +111,238 @@ def get_latest_current_data(use_cache=True):
     
     return ds, info
 
+if _NUMBA_AVAILABLE:
+    @_numba_mod.njit(parallel=True, fastmath=True, cache=True)
+    def _tri_areas_jit(x, y, tri, out):
+        """Numba-compiled triangle_areas, written into out."""
+        for t in _numba_mod.prange(tri.shape[0]):
+            p0 = tri[t, 0]
+            p1 = tri[t, 1]
+            p2 = tri[t, 2]
+            out[t] = 0.5 * abs((x[p1] - x[p0]) * (y[p2] - y[p0])
+                               - (x[p2] - x[p0]) * (y[p1] - y[p0]))
+    
+    # Every fastmath flag except 'nnan'/'ninf', so NaN velocities propagate.
+    @_numba_mod.njit(parallel=True, cache=True,
+                     fastmath={'nsz', 'arcp', 'contract', 'afn', 'reassoc'})
+    def _scatter_uvw_jit(tri, u, v, wA, nn, n_chunks):
+        """
+        Area-weighted scatter of u, v and the weights to the vertices.  Each
+        chunk of cells accumulates into its own node buffers; the buffers
+        are summed per node at the end.
+        
+        Returns (acc[3, nn]) with rows accU, accV, wsum.
+        """
+        nele = tri.shape[0]
+        part = np.zeros((n_chunks, 3, nn))
+        for c in _numba_mod.prange(n_chunks):
+            lo = c * nele // n_chunks
+            hi = (c + 1) * nele // n_chunks
+            for t in range(lo, hi):
+                w = wA[t]
+                wu = u[t] * w
+                wv = v[t] * w
+                for k in range(3):
+                    i = tri[t, k]
+                    part[c, 0, i] += wu
+                    part[c, 1, i] += wv
+                    part[c, 2, i] += w
+        acc = np.zeros((3, nn))
+        for i in _numba_mod.prange(nn):
+            for c in range(n_chunks):
+                acc[0, i] += part[c, 0, i]
+                acc[1, i] += part[c, 1, i]
+                acc[2, i] += part[c, 2, i]
+        return acc
+    
+    @_numba_mod.njit(parallel=True, cache=True,
+                     fastmath={'nsz', 'arcp', 'contract', 'afn', 'reassoc'})
+    def _bary_jit(tri, x, y, u_node, v_node, tind, qx, qy, qu, qv):
+        """Numba-compiled bary_interp, written into qu, qv."""
+        for k in _numba_mod.prange(qx.size):
+            t = tind[k]
+            p0 = tri[t, 0]
+            p1 = tri[t, 1]
+            p2 = tri[t, 2]
+            x0 = x[p0]
+            y0 = y[p0]
+            x10 = x[p1] - x0
+            y10 = y[p1] - y0
+            x20 = x[p2] - x0
+            y20 = y[p2] - y0
+            dx = qx[k] - x0
+            dy = qy[k] - y0
+            det = x10 * y20 - x20 * y10
+            w1 = (dx * y20 - x20 * dy) / det
+            w2 = (x10 * dy - dx * y10) / det
+            w0 = 1.0 - w1 - w2
+            qu[k] = w0 * u_node[p0] + w1 * u_node[p1] + w2 * u_node[p2]
+            qv[k] = w0 * v_node[p0] + w1 * v_node[p1] + w2 * v_node[p2]
+else:
+    _tri_areas_jit = None
+    _scatter_uvw_jit = None
+    _bary_jit = None
+
 def triangle_areas(x, y, tri_idx):
     """Compute areas of triangles given vertices."""
+    if _tri_areas_jit is not None and len(tri_idx) > 0:
+        out = np.empty(len(tri_idx))
+        _tri_areas_jit(np.ascontiguousarray(x), np.ascontiguousarray(y),
+                       np.ascontiguousarray(tri_idx), out)
+        return out
     p0, p1, p2 = tri_idx[:,0], tri_idx[:,1], tri_idx[:,2]
     x0, y0 = x[p0], y[p0]
     x1, y1 = x[p1], y[p1]
     x2, y2 = x[p2], y[p2]
     return 0.5 * np.abs((x1-x0)*(y2-y0) - (x2-x0)*(y1-y0))
 
-def cells_to_nodes_area_weighted(x, y, tri_idx, u_cell, wet_cells):
+def cells_to_nodes_area_weighted_uv(x, y, tri_idx, u_cell, v_cell, wet_cells,
+                                    areas=None):
     """
-    Move cell-centered values to nodes by area-weighted averaging of *wet* neighboring cells.
-    Returns node arrays with NaN for nodes with no wet neighbors.
+    Move cell-centered u and v to nodes by area-weighted averaging of *wet*
+    neighboring cells.  The triangle areas, wet weights and node weight
+    sums are computed once and shared (the areas may also be passed in
+    when they are already known).
+    Returns (u_node, v_node) with NaN for nodes with no wet neighbors.
     """
-    nele = tri_idx.shape[0]
     nn = x.size
-    A = triangle_areas(x, y, tri_idx)  # (nele,)
-    
-    # Only use wet cells: weight = area if wet else 0
+    A = triangle_areas(x, y, tri_idx) if areas is None else areas  # (nele,)
     wA = (A * wet_cells).astype(float)
     
-    accU = np.zeros(nn, dtype=float)
-    wsum = np.zeros(nn, dtype=float)
+    if _scatter_uvw_jit is not None and len(tri_idx) > 0:
+        # One node buffer set per chunk; a few thousand cells per chunk
+        # keeps the buffers small on cropped meshes
+        n_chunks = max(1, min(_numba_mod.get_num_threads(), len(tri_idx) // 4096))
+        accU, accV, wsum = _scatter_uvw_jit(
+            np.ascontiguousarray(tri_idx), np.ascontiguousarray(u_cell, dtype=float),
+            np.ascontiguousarray(v_cell, dtype=float), wA, nn, n_chunks)
+        denom = np.where(wsum > 0, wsum, np.nan)
+        return accU / denom, accV / denom
+    
+    flat_idx = tri_idx.ravel()
+    wsum = np.bincount(flat_idx, weights=np.repeat(wA, 3), minlength=nn)
+    accU = np.bincount(flat_idx, weights=np.repeat(u_cell * wA, 3), minlength=nn)
+    accV = np.bincount(flat_idx, weights=np.repeat(v_cell * wA, 3), minlength=nn)
+    
+    denom = np.where(wsum > 0, wsum, np.nan)
+    return accU / denom, accV / denom
+
+def bary_interp(tri_idx, x_nodes, y_nodes, u_node, v_node, qx, qy, tind):
+    """
+    Linear interpolation of u and v at query points whose containing
+    triangles are already known (e.g. from a TriFinder), so the triangle
+    search is not repeated.  One set of barycentric weights serves both
+    components.
+    
+    Parameters:
+    -----------
+    tri_idx : array (nele, 3)
+        Triangle connectivity (0-based indexing)
+    x_nodes, y_nodes : 1D arrays
+        Node coordinates
+    u_node, v_node : 1D arrays
+        Velocity components at nodes
+    qx, qy : 1D arrays
+        Query points
+    tind : 1D int array
+        Index of the triangle containing each query point (all >= 0)
+    
+    Returns:
+    --------
+    qu, qv : 1D arrays
+        Interpolated velocities (NaN where a vertex value is NaN)
+    """
+    if _bary_jit is not None and len(tind) > 0:
+        qu = np.empty(len(tind))
+        qv = np.empty(len(tind))
+        _bary_jit(np.ascontiguousarray(tri_idx), np.ascontiguousarray(x_nodes),
+                  np.ascontiguousarray(y_nodes), np.ascontiguousarray(u_node),
+                  np.ascontiguousarray(v_node), np.ascontiguousarray(tind),
+                  np.ascontiguousarray(qx), np.ascontiguousarray(qy), qu, qv)
+        return qu, qv
+    
+    verts = tri_idx[tind]
+    p0, p1, p2 = verts[:, 0], verts[:, 1], verts[:, 2]
+    x0, y0 = x_nodes[p0], y_nodes[p0]
+    x10, y10 = x_nodes[p1] - x0, y_nodes[p1] - y0
+    x20, y20 = x_nodes[p2] - x0, y_nodes[p2] - y0
+    dx, dy = qx - x0, qy - y0
+    det = x10 * y20 - x20 * y10
+    w1 = (dx * y20 - x20 * dy) / det
+    w2 = (x10 * dy - dx * y10) / det
+    w0 = 1.0 - w1 - w2
+    qu = w0 * u_node[p0] + w1 * u_node[p1] + w2 * u_node[p2]
+    qv = w0 * v_node[p0] + w1 * v_node[p1] + w2 * v_node[p2]
+    return qu, qv
+
+def crop_mesh(tri_idx, keep_cells, n_nodes):
+    """
+    Restrict the mesh to a subset of cells.
     
-    for k in range(3):  # scatter-add to each vertex
-        i = tri_idx[:, k]
-        np.add.at(accU, i, u_cell * wA)
-        np.add.at(wsum, i, wA)
+    Parameters:
+    -----------
+    tri_idx : array (nele, 3)
+        Triangle connectivity (0-based indexing)
+    keep_cells : 1D boolean array (nele,)
+        Cells to keep
+    n_nodes : int
+        Number of nodes in the full mesh
     
-    u_node = accU / np.where(wsum > 0, wsum, np.nan)
-    return u_node
+    Returns:
+    --------
+    keep_nodes : 1D boolean array (n_nodes,)
+        Nodes referenced by the kept cells
+    tri_local : array (n_kept, 3)
+        Connectivity of the kept cells, renumbered to the kept nodes
+    """
+    tri_kept = tri_idx[keep_cells]
+    keep_nodes = np.zeros(n_nodes, dtype=bool)
+    keep_nodes[tri_kept.ravel()] = True
+    old2new = np.full(n_nodes, -1, dtype=np.int64)
+    old2new[keep_nodes] = np.arange(np.count_nonzero(keep_nodes))
+    return keep_nodes, old2new[tri_kept]
+
+@lru_cache(maxsize=4)
+def _cached_triangulation(x_bytes, y_bytes, tri_bytes):
+    """
+    Unmasked Triangulation with its TriFinder already built, memoized on the
+    raw node coordinates and connectivity.  Wet/dry is applied per call from
+    wet_cells rather than with set_mask (which would rebuild the trapezoid
+    map), so the same object serves every time step on the mesh.
+    """
+    x = np.frombuffer(x_bytes, dtype=np.float64)
+    y = np.frombuffer(y_bytes, dtype=np.float64)
+    tri_idx = np.frombuffer(tri_bytes, dtype=np.int64).reshape(-1, 3)
+    tri = mtri.Triangulation(x, y, triangles=tri_idx)
+    tri.get_trifinder()
+    return tri
+
+def get_triangulation(x_nodes, y_nodes, tri_idx):
+    """
+    Shared (cached) Triangulation of the mesh; see _cached_triangulation.
+    Do not call set_mask on the returned object.
+    """
+    return _cached_triangulation(
+        np.ascontiguousarray(x_nodes, dtype=np.float64).tobytes(),
+        np.ascontiguousarray(y_nodes, dtype=np.float64).tobytes(),
+        np.ascontiguousarray(tri_idx, dtype=np.int64).tobytes())
+
+def regular_grid(x0, y0, R_utm, nx=300, ny=300, pad_factor=0.1):
+    """
+    Regular grid over the square of half-width R_utm * (1 + pad_factor)
+    around (x0, y0).  Returns xg, yg and read-only broadcast views Xg, Yg
+    in place of a materialized meshgrid.
+    """
+    pad = R_utm * pad_factor
+    xg = np.linspace(x0 - R_utm - pad, x0 + R_utm + pad, nx)
+    yg = np.linspace(y0 - R_utm - pad, y0 + R_utm + pad, ny)
+    Xg = np.broadcast_to(xg, (ny, nx))
+    Yg = np.broadcast_to(yg[:, None], (ny, nx))
+    return xg, yg, Xg, Yg
 
 def interpolate_to_grid(x_nodes, y_nodes, tri_idx, u_cells, v_cells, wet_cells, 
-                       x0, y0, R_utm, nx=300, ny=300):
+                       x0, y0, R_utm, nx=300, ny=300, tri=None, dtype=np.float32,
+                       tind=None, areas=None):
     """
     Interpolate unstructured u,v data to a regular grid, respecting wet/dry boundaries.
     
@@ -128,181 +362,114 @@ def interpolate_to_grid(x_nodes, y_nodes, tri_idx, u_cells, v_cells, wet_cells,
         Radius in meters
     nx, ny : int
         Grid resolution
+    tri : matplotlib.tri.Triangulation, optional
+        Pre-built unmasked triangulation of the nodes (default: the cached
+        one from get_triangulation)
+    dtype : numpy dtype
+        Precision of the gridded velocity fields (default float32; node and
+        grid coordinates stay float64 since UTM northings are ~5e6 m)
+    tind : 2D int array (ny, nx), optional
+        Triangle of tri containing each grid point (-1 outside the mesh),
+        from an earlier lookup on the same mesh and grid; the TriFinder is
+        only queried when this is not given
+    areas : 1D array, optional
+        Triangle areas of the mesh (default: computed here)
     
     Returns:
     --------
     xg, yg : 1D arrays
         Grid coordinates
     Xg, Yg : 2D arrays
-        Meshgrid
+        Meshgrid (read-only broadcast views of xg, yg)
     Ug, Vg : 2D arrays
         Interpolated u, v velocities (NaN over land)
     tri : Triangulation
-        The triangulation object
+        The (unmasked) triangulation object
     inside : 2D boolean array
         Mask indicating valid water grid points
     """
-    # Create grid bounds with some padding
-    pad = R_utm * 0.1
-    xmin, xmax = x0 - R_utm - pad, x0 + R_utm + pad
-    ymin, ymax = y0 - R_utm - pad, y0 + R_utm + pad
-    
-    xg = np.linspace(xmin, xmax, nx)
-    yg = np.linspace(ymin, ymax, ny)
-    Xg, Yg = np.meshgrid(xg, yg)
+    # Create grid with some padding
+    xg, yg, Xg, Yg = regular_grid(x0, y0, R_utm, nx, ny)
     
     print(f"\nGrid setup:")
-    print(f"  X range: {xmin:.0f} to {xmax:.0f} m")
-    print(f"  Y range: {ymin:.0f} to {ymax:.0f} m")
+    print(f"  X range: {xg[0]:.0f} to {xg[-1]:.0f} m")
+    print(f"  Y range: {yg[0]:.0f} to {yg[-1]:.0f} m")
     print(f"  Grid size: {nx} x {ny}")
     
-    # Create triangulation and mask out dry triangles
-    print(f"  Creating triangulation with {len(tri_idx)} triangles...")
-    tri = mtri.Triangulation(x_nodes, y_nodes, triangles=tri_idx)
-    tri.set_mask(~wet_cells)  # Mask out dry triangles
+    # Triangulation and its TriFinder are reused across calls on the same
+    # mesh; dry triangles are excluded below through wet_cells
+    if tri is None:
+        print(f"  Creating triangulation with {len(tri_idx)} triangles...")
+        tri = get_triangulation(x_nodes, y_nodes, tri_idx)
     
     num_wet = np.sum(wet_cells)
     print(f"  Wet triangles: {num_wet} / {len(wet_cells)} ({100*num_wet/len(wet_cells):.1f}%)")
     
     # Move cell values to nodes using area-weighted averaging over wet neighbors
     print(f"  Converting cell values to nodes (area-weighted)...")
-    u_node = cells_to_nodes_area_weighted(x_nodes, y_nodes, tri_idx, u_cells, wet_cells)
-    v_node = cells_to_nodes_area_weighted(x_nodes, y_nodes, tri_idx, v_cells, wet_cells)
-    
-    # Create masked interpolators (respect tri.mask)
-    print(f"  Creating interpolators...")
-    Ui = mtri.LinearTriInterpolator(tri, u_node)
-    Vi = mtri.LinearTriInterpolator(tri, v_node)
+    u_node, v_node = cells_to_nodes_area_weighted_uv(x_nodes, y_nodes, tri_idx,
+                                                     u_cells, v_cells, wet_cells,
+                                                     areas=areas)
     
-    # Grid and wet-only mask via TriFinder
+    # Grid and wet-only mask via TriFinder; which triangle holds each grid
+    # point depends only on the mesh, whether it is wet on the time step
     print(f"  Finding wet grid points...")
-    tind = tri.get_trifinder()(Xg, Yg)
+    if tind is None:
+        tind = tri.get_trifinder()(Xg, Yg)
     inside = tind >= 0  # Inside triangulation
-    inside &= wet_cells[np.where(inside, tind, 0)]  # Inside AND wet triangle
+    inside[inside] = wet_cells[tind[inside]]  # ... AND in a wet triangle
     
     # Initialize with NaN, then fill wet points
-    Ug = np.full_like(Xg, np.nan, dtype=float)
-    Vg = np.full_like(Yg, np.nan, dtype=float)
-    Ug[inside] = Ui(Xg, Yg)[inside]
-    Vg[inside] = Vi(Xg, Yg)[inside]
+    Ug = np.full(Xg.shape, np.nan, dtype=dtype)
+    Vg = np.full(Yg.shape, np.nan, dtype=dtype)
+    # Only the wet points are interpolated, reusing the triangles the
+    # TriFinder already located; land stays NaN
+    iy, ix = np.nonzero(inside)
+    Ug[iy, ix], Vg[iy, ix] = bary_interp(tri.triangles, tri.x, tri.y, u_node, v_node,
+                                         xg[ix], yg[iy], tind[iy, ix])
     
     valid_points = np.sum(inside)
     print(f"  Valid water grid points: {valid_points} / {nx*ny} ({100*valid_points/(nx*ny):.1f}%)")
     
     return xg, yg, Xg, Yg, Ug, Vg, tri, inside, u_node, v_node
 
-def create_land_overlay(Xg, Yg, land_mask, color='tan', alpha=0.5):
-    """
-    Create a masked array for rendering land areas.
-    
-    Parameters:
-    -----------
-    Xg, Yg : 2D arrays
-        Grid coordinates
-    land_mask : 2D boolean array
-        True for land points, False for water
-    color : str
-        Color to use for land (will be mapped through colormap)
-    alpha : float
-        Transparency
-    
-    Returns:
-    --------
-    masked_array : numpy masked array
-        Values are 1.0 where land_mask is True, masked elsewhere
-    """
-    return np.ma.masked_where(~land_mask, np.ones_like(Xg))
-
-def create_quiver_grid(x0, y0, R_utm, spacing_m=100):
+def grid_size_for_mesh(areas, R_utm, pad_factor=0.1, points_per_cell=4,
+                       min_size=150, max_size=600):
     """
-    Create a regular grid for quiver arrows.
+    Grid resolution matched to the local mesh density.
     
     Parameters:
     -----------
-    x0, y0 : float
-        Center point in UTM
+    areas : 1D array
+        Triangle areas of the local mesh (m^2)
     R_utm : float
         Radius in meters
-    spacing_m : float
-        Spacing between arrows in meters (default: 100m)
+    pad_factor : float
+        Grid padding around the circle as fraction of radius (as in
+        interpolate_to_grid)
+    points_per_cell : float
+        Grid points across a typical (median) triangle
+    min_size, max_size : int
+        Limits on the number of grid points per axis
     
     Returns:
     --------
-    qx, qy : 1D arrays
-        X and Y coordinates of quiver points
+    n : int
+        Grid points per axis
     """
-    # Create grid bounds
-    xmin, xmax = x0 - R_utm, x0 + R_utm
-    ymin, ymax = y0 - R_utm, y0 + R_utm
-    
-    # Create regular grid with specified spacing
-    x_points = np.arange(xmin, xmax + spacing_m, spacing_m)
-    y_points = np.arange(ymin, ymax + spacing_m, spacing_m)
-    
-    # Create meshgrid and flatten
-    qx_grid, qy_grid = np.meshgrid(x_points, y_points)
-    qx = qx_grid.flatten()
-    qy = qy_grid.flatten()
-    
-    return qx, qy
+    if len(areas) == 0:
+        return min_size
+    cell = np.sqrt(np.median(areas))
+    n = 2 * R_utm * (1 + pad_factor) / cell * points_per_cell
+    return int(np.clip(n, min_size, max_size))
 
-def interpolate_at_points(tri, u_node, v_node, qx, qy, inside_mask_grid, xg, yg):
+def prepare_mesh_context(ds, center_lat, center_lon, radius_miles=5,
+                         quiver_spacing_m=100, grid_size=None):
     """
-    Interpolate u,v velocities at specific points, excluding land.
-    
-    Parameters:
-    -----------
-    tri : matplotlib.tri.Triangulation
-        Triangulation object (with mask set for dry cells)
-    u_node, v_node : 1D arrays
-        Velocity components at nodes
-    qx, qy : 1D arrays
-        Points where to interpolate
-    inside_mask_grid : 2D boolean array
-        Water mask on the regular grid
-    xg, yg : 1D arrays
-        Grid coordinates (for inside_mask_grid)
-    
-    Returns:
-    --------
-    qx_water, qy_water : 1D arrays
-        Coordinates of points in water
-    qu, qv : 1D arrays
-        Interpolated velocities at those points
-    """
-    # Create interpolators
-    Ui = mtri.LinearTriInterpolator(tri, u_node)
-    Vi = mtri.LinearTriInterpolator(tri, v_node)
-    
-    # Find which quiver points are in water
-    # Use TriFinder to check if points are in wet triangles
-    trifinder = tri.get_trifinder()
-    tri_indices = trifinder(qx, qy)
-    
-    # Keep only points inside a wet triangle
-    in_water = tri_indices >= 0
-    
-    qx_water = qx[in_water]
-    qy_water = qy[in_water]
-    
-    # Interpolate at water points
-    qu = Ui(qx_water, qy_water)
-    qv = Vi(qx_water, qy_water)
-    
-    # Handle any NaN values
-    valid = ~(np.isnan(qu) | np.isnan(qv))
-    qx_water = qx_water[valid]
-    qy_water = qy_water[valid]
-    qu = qu[valid]
-    qv = qv[valid]
-    
-    return qx_water, qy_water, qu, qv
-
-def plot_uv_components(ds, center_lat, center_lon, radius_miles=5, 
-                       time_index=0, save_file=None, basemap=None, arrow_scale=1.0,
-                       quiver_spacing_m=100):
-    """
-    Plot u and v components side by side to verify interpolation.
+    Time-invariant part of plot_uv_components: the local mesh, its
+    triangulation, the interpolation grid with the triangle under each grid
+    point, and the quiver sampling pattern.  Build it once per region and
+    pass it to plot_frame for each time step.
     
     Parameters:
     -----------
@@ -312,18 +479,17 @@ def plot_uv_components(ds, center_lat, center_lon, radius_miles=5,
         Center coordinates in decimal degrees
     radius_miles : float
         Radius in miles to plot around center
-    time_index : int
-        Which time step to plot
-    save_file : str, optional
-        If provided, save the plot to this file
-    basemap : str, optional
-        'contextily' - use web tiles
-        None - no basemap (default)
-    arrow_scale : float
-        Multiplier for arrow lengths (default: 1.0)
-        Higher values = longer arrows, lower values = shorter arrows
     quiver_spacing_m : float
-        Spacing between quiver arrows in meters (default: 100)
+        Spacing between quiver arrows in meters (default: 100), rounded to
+        a whole number of interpolation grid cells
+    grid_size : int, optional
+        Interpolation grid points per axis (default: matched to the local
+        mesh density, see grid_size_for_mesh)
+    
+    Returns:
+    --------
+    ctx : dict
+        Mesh context for plot_frame
     """
     
     # Convert radius from miles to meters
@@ -336,45 +502,172 @@ def plot_uv_components(ds, center_lat, center_lon, radius_miles=5,
     # Create UTM transformer
     transformer = create_utm_transformer(center_lat, center_lon)
     
-    # Extract data needed for interpolation
-    # u, v are on cells (elements)
-    u_cells = ds["u"].isel(time=time_index, siglay=0).values
-    v_cells = ds["v"].isel(time=time_index, siglay=0).values
-    wet_cells = ds["wet_cells"].isel(time=time_index).values.astype(bool)
-    
-    # Node coordinates
+    # Mesh geometry first: coordinates and connectivity are small next to
+    # the field variables, and they decide which cells and nodes are read
     lons_nodes = ds["lon"].values
     lats_nodes = ds["lat"].values
+    lons_cells = ds["lonc"].values
+    lats_cells = ds["latc"].values
     
     # Triangle connectivity (nv is 1-based, convert to 0-based)
     tri_idx = ds["nv"].values.T - 1  # (nele, 3)
     
-    # Convert longitudes from 0-360 to -180 to 180 if needed
-    if lons_nodes.max() > 180:
-        lons_nodes = np.where(lons_nodes > 180, lons_nodes - 360, lons_nodes)
-    
     print(f"\nDataset info:")
     print(f"  Nodes: {len(lons_nodes)}")
-    print(f"  Cells: {len(u_cells)}")
+    print(f"  Cells: {len(lons_cells)}")
     print(f"  Triangles: {len(tri_idx)}")
-    print(f"  Wet cells: {np.sum(wet_cells)} ({100*np.sum(wet_cells)/len(wet_cells):.1f}%)")
     
-    # Transform all nodes to UTM
-    x_nodes, y_nodes = transformer.transform(lons_nodes, lats_nodes)
+    # Coarse lon/lat boxes around the center.  At 2 R they cover the 1.3 R
+    # crop square used below plus a ring of neighbouring cells; only what
+    # lies inside is read and reprojected
+    node_box = lonlat_box(lons_nodes, lats_nodes, center_lat, center_lon, 2.0 * radius_meters)
+    cell_box = lonlat_box(lons_cells, lats_cells, center_lat, center_lon, 2.0 * radius_meters)
+    cell_idx = np.flatnonzero(cell_box | node_box[tri_idx].all(axis=1))
+    node_idx = np.flatnonzero(node_box)
+    tri_idx = tri_idx[cell_idx]  # still numbered by global node
+    
+    print(f"  Local cells: {len(cell_idx)}, nodes: {len(node_idx)}")
+    
+    # Transform the local nodes to UTM (NaN elsewhere, so the global node
+    # numbering in tri_idx stays valid)
+    # Longitudes may be stored 0-360: convert the local subset (a fresh
+    # copy from the fancy indexing) to -180..180 in place
+    lon_local = lons_nodes[node_idx]
+    np.subtract(lon_local, 360.0, out=lon_local, where=lon_local > 180)
+    x_nodes = np.full(len(lons_nodes), np.nan)
+    y_nodes = np.full(len(lons_nodes), np.nan)
+    x_nodes[node_idx], y_nodes[node_idx] = transformer.transform(lon_local,
+                                                                 lats_nodes[node_idx])
     center_x, center_y = transformer.transform(center_lon, center_lat)
     
     print(f"\nCenter in UTM: ({center_x:.0f}, {center_y:.0f})")
     
-    # Find cells within radius (use cell centers)
-    lons_cells = ds["lonc"].values
-    lats_cells = ds["latc"].values
-    if lons_cells.max() > 180:
-        lons_cells = np.where(lons_cells > 180, lons_cells - 360, lons_cells)
-    
-    x_cells, y_cells = transformer.transform(lons_cells, lats_cells)
+    # Cells within radius (use cell centers)
+    lon_local = lons_cells[cell_idx]
+    np.subtract(lon_local, 360.0, out=lon_local, where=lon_local > 180)
+    x_cells, y_cells = transformer.transform(lon_local, lats_cells[cell_idx])
     distances = np.sqrt((x_cells - center_x)**2 + (y_cells - center_y)**2)
     cells_in_radius = distances <= radius_meters * 1.2
     
+    # Nodes within radius, for the wet/dry node overlay
+    x_local, y_local = x_nodes[node_idx], y_nodes[node_idx]
+    distances_nodes = np.sqrt((x_local - center_x)**2 + (y_local - center_y)**2)
+    node_mask = distances_nodes <= radius_meters * 1.2
+    
+    # Crop the mesh to the plotted square before triangulating.  The grid
+    # spans +/-1.1 R; cells within 1.3 R cover it, and adding every cell
+    # that shares a node with them keeps the area-weighted node averages
+    # identical to the full-mesh ones
+    half = radius_meters * 1.3
+    core_cells = (np.abs(x_cells - center_x) <= half) & (np.abs(y_cells - center_y) <= half)
+    core_nodes = np.zeros(len(x_nodes), dtype=bool)
+    core_nodes[tri_idx[core_cells].ravel()] = True
+    # (cells with a vertex outside the projected box have no coordinates)
+    keep_cells = core_nodes[tri_idx].any(axis=1) & node_box[tri_idx].all(axis=1)
+    keep_nodes, tri_local = crop_mesh(tri_idx, keep_cells, len(x_nodes))
+    print(f"  Local mesh: {len(tri_local)} of {len(tri_idx)} triangles, "
+          f"{np.count_nonzero(keep_nodes)} of {len(x_nodes)} nodes")
+    
+    x_mesh, y_mesh = x_nodes[keep_nodes], y_nodes[keep_nodes]
+    areas = triangle_areas(x_mesh, y_mesh, tri_local)
+    if grid_size is None:
+        # No finer than the mesh resolves, no coarser than it needs
+        grid_size = grid_size_for_mesh(areas, radius_meters)
+    
+    # Triangulation and the triangle under each grid point; whether that
+    # triangle is wet is decided per time step
+    tri = get_triangulation(x_mesh, y_mesh, tri_local)
+    xg, yg, Xg, Yg = regular_grid(center_x, center_y, radius_meters,
+                                  grid_size, grid_size)
+    tind = tri.get_trifinder()(Xg, Yg)
+    
+    # Quiver points: every step-th node of the interpolation grid within the
+    # radius square, so they reuse the gridded values and need no further
+    # triangle lookups or interpolation.  The spacing is rounded to a
+    # whole number of grid cells.
+    step_x = max(1, int(round(quiver_spacing_m / (xg[1] - xg[0]))))
+    step_y = max(1, int(round(quiver_spacing_m / (yg[1] - yg[0]))))
+    if abs(step_x * (xg[1] - xg[0]) - quiver_spacing_m) > 0.5:
+        print(f"  Quiver spacing: {quiver_spacing_m:.0f}m requested, "
+              f"{step_x * (xg[1] - xg[0]):.0f}m used ({step_x} grid cells)")
+    quiver_mask = np.zeros(tind.shape, dtype=bool)
+    quiver_mask[::step_y, ::step_x] = True
+    quiver_mask &= ((np.abs(yg - center_y) <= radius_meters)[:, None]
+                    & (np.abs(xg - center_x) <= radius_meters))
+    
+    return {
+        'center_lat': center_lat,
+        'center_lon': center_lon,
+        'radius_miles': radius_miles,
+        'radius_meters': radius_meters,
+        'center_x': center_x,
+        'center_y': center_y,
+        'cell_idx': cell_idx,
+        'node_idx': node_idx,
+        'cells_in_radius': cells_in_radius,
+        'node_mask': node_mask,
+        'x_nodes_in': x_local[node_mask],
+        'y_nodes_in': y_local[node_mask],
+        'keep_cells': keep_cells,
+        'x_mesh': x_mesh,
+        'y_mesh': y_mesh,
+        'tri_local': tri_local,
+        'areas': areas,
+        'tri': tri,
+        'grid_size': grid_size,
+        'tind': tind,
+        'quiver_mask': quiver_mask,
+        'arrow_spacing_m': step_x * (xg[1] - xg[0]),
+    }
+
+def plot_frame(ctx, ds, time_index=0, save_file=None, basemap=None,
+               arrow_scale=1.0, show=True):
+    """
+    Plot u and v components for one time step on a prepared mesh context.
+    
+    Only the fields of the time step are read: u, v and wet_cells for the
+    local cells, and wet_nodes for the local nodes.
+    
+    Parameters:
+    -----------
+    ctx : dict
+        Mesh context from prepare_mesh_context (same dataset mesh)
+    ds : xarray.Dataset
+        SSCOFS dataset
+    time_index : int
+        Which time step to plot
+    save_file : str, optional
+        If provided, save the plot to this file
+    basemap : str, optional
+        'contextily' - use web tiles
+        None - no basemap (default)
+    arrow_scale : float
+        Multiplier for arrow lengths (default: 1.0)
+        Higher values = longer arrows, lower values = shorter arrows
+    show : bool
+        Display the figure with plt.show() (default: True)
+    
+    Returns:
+    --------
+    fig : matplotlib Figure, or None if there are too few wet cells
+    """
+    center_lat, center_lon = ctx['center_lat'], ctx['center_lon']
+    center_x, center_y = ctx['center_x'], ctx['center_y']
+    radius_miles, radius_meters = ctx['radius_miles'], ctx['radius_meters']
+    cell_idx, keep_cells = ctx['cell_idx'], ctx['keep_cells']
+    cells_in_radius = ctx['cells_in_radius']
+    
+    # Extract data needed for interpolation, for the local cells only
+    # (u, v are on cells (elements)); a lazily opened dataset then reads
+    # just that part of each variable
+    u_cells = ds["u"].isel(time=time_index, siglay=0, nele=cell_idx).values
+    v_cells = ds["v"].isel(time=time_index, siglay=0, nele=cell_idx).values
+    wet_cells = as_bool_mask(ds["wet_cells"].isel(time=time_index, nele=cell_idx).values)
+    
+    print(f"\nTime index {time_index}:")
+    print(f"  Local cells: {len(cell_idx)}, wet: {np.sum(wet_cells)} "
+          f"({100*np.sum(wet_cells)/max(len(wet_cells), 1):.1f}%)")
+    
     print(f"\nCells within radius:")
     print(f"  Total: {np.sum(cells_in_radius)}")
     print(f"  Wet: {np.sum(cells_in_radius & wet_cells)}")
@@ -392,33 +685,30 @@ def plot_uv_components(ds, center_lat, center_lon, radius_miles=5,
     
     # Get wet_nodes for overlay
     print("\nExtracting wet_nodes mask...")
-    wet_nodes = ds["wet_nodes"].isel(time=time_index).values.astype(bool)
-    
-    # Mask nodes to radius
-    distances_nodes = np.sqrt((x_nodes - center_x)**2 + (y_nodes - center_y)**2)
-    node_mask = distances_nodes <= radius_meters * 1.2
-    
-    x_nodes_in = x_nodes[node_mask]
-    y_nodes_in = y_nodes[node_mask]
-    wet_in = wet_nodes[node_mask]
+    wet_nodes = as_bool_mask(ds["wet_nodes"].isel(time=time_index,
+                                                  node=ctx['node_idx']).values)
+    wet_in = wet_nodes[ctx['node_mask']]
     
     # Separate wet and dry nodes
-    x_wet = x_nodes_in[wet_in]
-    y_wet = y_nodes_in[wet_in]
-    x_dry = x_nodes_in[~wet_in]
-    y_dry = y_nodes_in[~wet_in]
+    x_wet = ctx['x_nodes_in'][wet_in]
+    y_wet = ctx['y_nodes_in'][wet_in]
+    x_dry = ctx['x_nodes_in'][~wet_in]
+    y_dry = ctx['y_nodes_in'][~wet_in]
     
     print(f"  Wet nodes: {len(x_wet)}")
     print(f"  Dry nodes: {len(x_dry)}")
     
-    # Interpolate to regular grid with proper wet/dry masking
+    # Interpolate to regular grid with proper wet/dry masking, on the
+    # context's triangulation and grid-point triangles
     print("\n" + "="*60)
     print("INTERPOLATION (WET-ONLY)")
     print("="*60)
     xg, yg, Xg, Yg, Ug, Vg, tri, inside, u_node, v_node = interpolate_to_grid(
-        x_nodes, y_nodes, tri_idx, u_cells, v_cells, wet_cells,
+        ctx['x_mesh'], ctx['y_mesh'], ctx['tri_local'],
+        u_cells[keep_cells], v_cells[keep_cells], wet_cells[keep_cells],
         center_x, center_y, radius_meters,
-        nx=300, ny=300
+        nx=ctx['grid_size'], ny=ctx['grid_size'],
+        tri=ctx['tri'], tind=ctx['tind'], areas=ctx['areas']
     )
     
     # Statistics on interpolated grid
@@ -433,17 +723,17 @@ def plot_uv_components(ds, center_lat, center_lon, radius_miles=5,
     print(f"  Water points: {water_points} ({100*water_points/(water_points+land_points):.1f}%)")
     print(f"  Land points: {land_points} ({100*land_points/(water_points+land_points):.1f}%)")
     
-    # Create quiver grid
+    # Quiver points from the context's sampling pattern
+    arrow_spacing_m = ctx['arrow_spacing_m']
     print("\n" + "="*60)
-    print(f"QUIVER GRID ({quiver_spacing_m}m spacing)")
+    print(f"QUIVER GRID ({arrow_spacing_m:.0f}m spacing)")
     print("="*60)
-    qx, qy = create_quiver_grid(center_x, center_y, radius_meters, spacing_m=quiver_spacing_m)
-    print(f"  Total quiver points: {len(qx)}")
+    print(f"  Total quiver points: {np.count_nonzero(ctx['quiver_mask'])}")
     
-    # Interpolate velocities at quiver points
-    qx_water, qy_water, qu, qv = interpolate_at_points(
-        tri, u_node, v_node, qx, qy, inside, xg, yg
-    )
+    # Keep the ones in water with valid velocities
+    qm = ctx['quiver_mask'] & inside & ~(np.isnan(Ug) | np.isnan(Vg))
+    qx_water, qy_water = Xg[qm], Yg[qm]
+    qu, qv = Ug[qm], Vg[qm]
     print(f"  Quiver points in water: {len(qx_water)}")
     
     # Compute speed at quiver points for coloring
@@ -470,16 +760,25 @@ def plot_uv_components(ds, center_lat, center_lon, radius_miles=5,
     fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(16, 7))
     
     # Determine shared color limits for consistency
-    u_vmin, u_vmax = np.nanpercentile(Ug, [2, 98])
-    v_vmin, v_vmax = np.nanpercentile(Vg, [2, 98])
+    # (only the wet points carry values; one partial sort per component)
+    u_wet = Ug[inside]
+    v_wet = Vg[inside]
+    u_vmin, u_vmax = partition_percentiles(u_wet[~np.isnan(u_wet)], [2, 98])
+    v_vmin, v_vmax = partition_percentiles(v_wet[~np.isnan(v_wet)], [2, 98])
+    
+    # Quiver colour limit, shared by both panels
+    qs_p95 = partition_percentiles(qs_knots[~np.isnan(qs_knots)], [95])[0]
     
     # Make limits symmetric for diverging colormap
     u_lim = max(abs(u_vmin), abs(u_vmax))
     v_lim = max(abs(v_vmin), abs(v_vmax))
     
-    # Create land mask (inverse of water mask) and overlay
-    land_mask = ~inside
-    land_overlay = create_land_overlay(Xg, Yg, land_mask)
+    # Land (~inside) is NaN in Ug/Vg, so the velocity colormap's "bad"
+    # colour shades it in the same mesh: the half-transparent black the
+    # separate land overlay used, or transparent over a basemap
+    field_cmap = plt.get_cmap('RdBu_r').copy()
+    if not basemap:
+        field_cmap.set_bad(color='black', alpha=0.5)
     
     # Set axis limits first (needed for basemap)
     margin = radius_meters * 0.05
@@ -489,17 +788,14 @@ def plot_uv_components(ds, center_lat, center_lon, radius_miles=5,
     
     # Add basemap if requested (behind everything)
     if basemap:
+        # Only needed for basemaps, so imported here
+        from basemap_utils import add_basemap
         print(f"\nAdding basemap: {basemap}")
         add_basemap(ax1, basemap_type=basemap, zoom='auto', alpha=0.7)
     
-    # Fill land areas with a neutral color (before plotting data)
-    # Only if no basemap, otherwise basemap shows land
-    if not basemap:
-        ax1.pcolormesh(Xg, Yg, land_overlay, cmap='Greys', vmin=0, vmax=1, 
-                       alpha=0.5, shading='auto', zorder=1)
-    
-    # Plot U component (only over water)
-    im1 = ax1.pcolormesh(Xg, Yg, Ug, cmap='RdBu_r', vmin=-u_lim, vmax=u_lim, 
+    # Plot U component (land shaded by the colormap's bad colour)
+    im1 = ax1.pcolormesh(xg, yg, np.ma.masked_invalid(Ug), cmap=field_cmap,
+                         vmin=-u_lim, vmax=u_lim, 
                          shading='auto', zorder=2)
     
     # Add quiver plot (colored by speed)
@@ -518,7 +814,7 @@ def plot_uv_components(ds, center_lat, center_lon, radius_miles=5,
                     scale=effective_scale, scale_units='inches',
                     width=0.003, headwidth=3, headlength=4, headaxislength=3,
                     alpha=0.8, zorder=10, 
-                    clim=[0, np.nanpercentile(qs_knots, 95)])
+                    clim=[0, qs_p95])
     
     # Overlay wet/dry nodes (optional - can be removed for cleaner plot)
     # if len(x_wet) > 0:
@@ -546,7 +842,7 @@ def plot_uv_components(ds, center_lat, center_lon, radius_miles=5,
     ax1.legend(loc='upper right', fontsize=8)
     
     # Add quiver reference
-    ax1.text(0.02, 0.02, f'Arrows: {quiver_spacing_m:.0f}m spacing\n{len(qx_water)} vectors\nScale: {arrow_scale:.1f}x',
+    ax1.text(0.02, 0.02, f'Arrows: {arrow_spacing_m:.0f}m spacing\n{len(qx_water)} vectors\nScale: {arrow_scale:.1f}x',
             transform=ax1.transAxes, fontsize=8, color='white',
             verticalalignment='bottom',
             bbox=dict(boxstyle='round', facecolor='black', alpha=0.6))
@@ -562,14 +858,9 @@ def plot_uv_components(ds, center_lat, center_lon, radius_miles=5,
     if basemap:
         add_basemap(ax2, basemap_type=basemap, zoom='auto', alpha=0.7)
     
-    # Fill land areas with a neutral color (before plotting data)
-    # Only if no basemap, otherwise basemap shows land
-    if not basemap:
-        ax2.pcolormesh(Xg, Yg, land_overlay, cmap='Greys', vmin=0, vmax=1, 
-                       alpha=0.5, shading='auto', zorder=1)
-    
-    # Plot V component (only over water)
-    im2 = ax2.pcolormesh(Xg, Yg, Vg, cmap='RdBu_r', vmin=-v_lim, vmax=v_lim, 
+    # Plot V component (land shaded by the colormap's bad colour)
+    im2 = ax2.pcolormesh(xg, yg, np.ma.masked_invalid(Vg), cmap=field_cmap,
+                         vmin=-v_lim, vmax=v_lim, 
                          shading='auto', zorder=2)
     
     # Add quiver plot (colored by speed)
@@ -578,7 +869,7 @@ def plot_uv_components(ds, center_lat, center_lon, radius_miles=5,
                     scale=effective_scale, scale_units='inches',
                     width=0.003, headwidth=3, headlength=4, headaxislength=3,
                     alpha=0.8, zorder=10,
-                    clim=[0, np.nanpercentile(qs_knots, 95)])
+                    clim=[0, qs_p95])
     
     # Overlay wet/dry nodes (optional)
     # if len(x_wet) > 0:
@@ -604,7 +895,7 @@ def plot_uv_components(ds, center_lat, center_lon, radius_miles=5,
     ax2.legend(loc='upper right', fontsize=8)
     
     # Add quiver reference
-    ax2.text(0.02, 0.02, f'Arrows: {quiver_spacing_m:.0f}m spacing\n{len(qx_water)} vectors\nScale: {arrow_scale:.1f}x',
+    ax2.text(0.02, 0.02, f'Arrows: {arrow_spacing_m:.0f}m spacing\n{len(qx_water)} vectors\nScale: {arrow_scale:.1f}x',
             transform=ax2.transAxes, fontsize=8, color='white',
             verticalalignment='bottom',
             bbox=dict(boxstyle='round', facecolor='black', alpha=0.6))
@@ -624,11 +915,52 @@ def plot_uv_components(ds, center_lat, center_lon, radius_miles=5,
         plt.savefig(save_file, dpi=150, bbox_inches='tight')
         print(f"\nPlot saved to: {save_file}")
     
-    print("\nDisplaying plot...")
-    plt.show()
+    if show:
+        print("\nDisplaying plot...")
+        plt.show()
     
     return fig
 
+def plot_uv_components(ds, center_lat, center_lon, radius_miles=5, 
+                       time_index=0, save_file=None, basemap=None, arrow_scale=1.0,
+                       quiver_spacing_m=100, grid_size=None):
+    """
+    Plot u and v components side by side to verify interpolation.
+    
+    Builds the mesh context (prepare_mesh_context) and draws one time step
+    on it (plot_frame); for several time steps of the same region, call
+    those two directly so the mesh work is done only once.
+    
+    Parameters:
+    -----------
+    ds : xarray.Dataset
+        SSCOFS dataset
+    center_lat, center_lon : float
+        Center coordinates in decimal degrees
+    radius_miles : float
+        Radius in miles to plot around center
+    time_index : int
+        Which time step to plot
+    save_file : str, optional
+        If provided, save the plot to this file
+    basemap : str, optional
+        'contextily' - use web tiles
+        None - no basemap (default)
+    arrow_scale : float
+        Multiplier for arrow lengths (default: 1.0)
+        Higher values = longer arrows, lower values = shorter arrows
+    quiver_spacing_m : float
+        Spacing between quiver arrows in meters (default: 100), rounded to
+        a whole number of interpolation grid cells
+    grid_size : int, optional
+        Interpolation grid points per axis (default: matched to the local
+        mesh density, see grid_size_for_mesh)
+    """
+    ctx = prepare_mesh_context(ds, center_lat, center_lon, radius_miles=radius_miles,
+                               quiver_spacing_m=quiver_spacing_m, grid_size=grid_size)
+    return plot_frame(ctx, ds, time_index=time_index, save_file=save_file,
+                      basemap=basemap, arrow_scale=arrow_scale)
+
 def main():
     parser = argparse.ArgumentParser(
         description="Simple SSCOFS current visualization - U and V components"
@@ -676,7 +1008,12 @@ def main():
     )
     parser.add_argument(
         "--quiver-spacing", type=float, default=100.0,
-        help="Spacing between quiver arrows in meters (default: 100)"
+        help="Spacing between quiver arrows in meters (default: 100); "
+             "rounded to a whole number of interpolation grid cells"
+    )
+    parser.add_argument(
+        "--grid-size", type=int, default=None,
+        help="Interpolation grid points per axis (default: matched to the mesh density)"
     )
     
     args = parser.parse_args()
@@ -711,7 +1048,8 @@ def main():
             save_file=args.save,
             basemap=args.basemap,
             arrow_scale=args.arrow_scale,
-            quiver_spacing_m=args.quiver_spacing
+            quiver_spacing_m=args.quiver_spacing,
+            grid_size=args.grid_size
         )
         
         if fig is None:
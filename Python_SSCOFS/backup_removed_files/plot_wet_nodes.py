@@ -11,18 +11,24 @@ Usage:
 
 import argparse
 import datetime as dt
+import hashlib
 from datetime import timezone, timedelta
 import numpy as np
 import pandas as pd
 import matplotlib.pyplot as plt
 import xarray as xr
+from matplotlib.collections import PathCollection
+from matplotlib.colors import to_rgba
+from matplotlib.lines import Line2D
+from matplotlib.markers import MarkerStyle
 from matplotlib.patches import Circle
+from matplotlib.transforms import IdentityTransform
 from pathlib import Path
 from pyproj import Transformer
 
 # Import helper functions from existing modules
 from latest_cycle import latest_cycle_and_url_for_local_hour
-from sscofs_cache import load_sscofs_data
+from sscofs_cache import load_sscofs_data, load_mesh_tree, mesh_digest, DEFAULT_CACHE_DIR
 
 def get_utm_zone(lon):
     """Get UTM zone number from longitude."""
@@ -36,6 +42,48 @@ def create_utm_transformer(center_lat, center_lon):
     transformer = Transformer.from_crs("EPSG:4326", utm_crs, always_xy=True)
     return transformer, utm_zone, hemisphere
 
+def meters_per_degree(center_lat):
+    """Meters per degree of longitude and of latitude at center_lat (WGS84)."""
+    a, e2 = 6378137.0, 6.69437999014e-3
+    phi = np.radians(center_lat)
+    w = 1.0 - e2 * np.sin(phi)**2
+    m_per_deg_lon = np.radians(a / np.sqrt(w) * np.cos(phi))
+    m_per_deg_lat = np.radians(a * (1.0 - e2) / w**1.5)
+    return m_per_deg_lon, m_per_deg_lat
+
+def local_offsets_m(lons, lats, center_lat, center_lon):
+    """
+    East/north offsets in meters from the center point, using a local
+    equirectangular approximation with the WGS84 radii of curvature at the
+    center latitude (errors of a few meters over a few miles).  The
+    longitude difference is wrapped, so 0-360 longitudes work as well.
+    """
+    m_per_deg_lon, m_per_deg_lat = meters_per_degree(center_lat)
+    dlon = (lons - center_lon + 180.0) % 360.0 - 180.0
+    return dlon * m_per_deg_lon, (lats - center_lat) * m_per_deg_lat
+
+def points_in_radius(lons, lats, center_lat, center_lon, radius_meters, tree=None):
+    """
+    Indices (sorted) of the points within radius_meters of the center.
+    
+    Candidates come from tree, a unit-sphere cKDTree over lons/lats (see
+    sscofs_cache.load_mesh_tree), when given; otherwise a latitude band
+    around the center rejects most points with two plain comparisons.  The
+    (longitude-wrapped) planar distance test then runs on the candidates only.
+    """
+    if tree is not None:
+        # Chord of the radius on a spherical earth, padded 1% for the
+        # difference to the ellipsoid; the planar test below decides
+        lat_r, lon_r = np.radians(center_lat), np.radians(center_lon)
+        center = [np.cos(lat_r) * np.cos(lon_r), np.cos(lat_r) * np.sin(lon_r), np.sin(lat_r)]
+        chord = 2 * np.sin(1.01 * radius_meters / (2 * 6371000.0))
+        cand = np.sort(np.asarray(tree.query_ball_point(center, chord), dtype=np.intp))
+    else:
+        dlat = radius_meters / meters_per_degree(center_lat)[1]
+        cand = np.flatnonzero((lats >= center_lat - dlat) & (lats <= center_lat + dlat))
+    dx, dy = local_offsets_m(lons[cand], lats[cand], center_lat, center_lon)
+    return cand[dx * dx + dy * dy <= radius_meters**2]
+
 def get_latest_current_data(use_cache=True):
     """Get the latest SSCOFS current data using the current time."""
     current_time_utc = dt.datetime.now(timezone.utc)
@@ -59,8 +107,81 @@ def get_latest_current_data(use_cache=True):
     
     return ds, info
 
+def radius_selection(lons, lats, center_lat, center_lon, radius_meters, transformer,
+                     use_cache=True, cache_dir=None):
+    """
+    Indices of the points within radius_meters of the center and their UTM
+    coordinates.
+    
+    The result depends only on the mesh, the center and the radius, so it
+    is stored as a small .npz sidecar in the cache directory and later runs
+    for the same place skip the KD-tree and the projection altogether.
+    
+    Returns:
+    --------
+    radius_idx : 1D int array
+        Sorted indices into lons/lats
+    x_utm, y_utm : 1D arrays
+        UTM coordinates of those points
+    """
+    if cache_dir is None:
+        cache_dir = DEFAULT_CACHE_DIR
+    
+    digest = mesh_digest(lons, lats)
+    key = hashlib.sha1(f"{digest} {center_lat!r} {center_lon!r} "
+                       f"{radius_meters!r}".encode()).hexdigest()[:16]
+    sidecar = Path(cache_dir) / f"radius_sel_{key}.npz"
+    if use_cache and sidecar.exists():
+        with np.load(sidecar) as f:
+            return f['idx'], f['x'], f['y']
+    
+    # Find points within radius: candidates from the cached KD-tree of
+    # this coordinate set, then squared planar distances on those
+    tree = load_mesh_tree(lons, lats, use_cache=use_cache, cache_dir=cache_dir,
+                          digest=digest)
+    radius_idx = points_in_radius(lons, lats, center_lat, center_lon, radius_meters,
+                                  tree=tree)
+    
+    # Only these points are transformed to UTM, in one call (PROJ works in
+    # float64 internally, whatever the input dtype)
+    lons_in = lons[radius_idx]
+    # Convert longitudes from 0-360 to -180 to 180 format if needed
+    # (in place: the fancy indexing above already made a copy)
+    np.subtract(lons_in, 360, out=lons_in, where=lons_in > 180)
+    x_utm, y_utm = transformer.transform(lons_in, lats[radius_idx])
+    
+    Path(cache_dir).mkdir(parents=True, exist_ok=True)
+    np.savez(sidecar, idx=radius_idx, x=x_utm, y=y_utm)
+    return radius_idx, x_utm, y_utm
+
+def dedupe_per_pixel(x, y, cell_m):
+    """
+    Indices (in drawing order) of the points to keep so that each
+    cell_m x cell_m square holds at most one; of the points sharing a
+    square the last one is kept, as it is the one drawn on top.
+    """
+    if len(x) == 0:
+        return np.arange(0)
+    px = np.floor((x - x.min()) / cell_m).astype(np.int64)
+    py = np.floor((y - y.min()) / cell_m).astype(np.int64)
+    key = py * (px.max() + 1) + px
+    # np.unique keeps first occurrences; search the reversed keys for the last
+    _, last = np.unique(key[::-1], return_index=True)
+    return np.sort(len(key) - 1 - last)
+
+def nearest_time_index(ds, when):
+    """
+    Index of the time step nearest to `when` (timestamp string or datetime;
+    naive values are taken as UTC).  Looked up in the dataset's time index
+    (a binary search) rather than by scanning the time values.
+    """
+    t = pd.Timestamp(when)
+    if t.tzinfo is not None:
+        t = t.tz_convert('UTC').tz_localize(None)
+    return int(ds.indexes['time'].get_indexer([t], method='nearest')[0])
+
 def plot_wet_nodes(ds, center_lat, center_lon, radius_miles=5, 
-                   time_index=0, save_file=None, wet_vars=None):
+                   time_index=0, save_file=None, wet_vars=None, use_cache=True):
     """
     Plot wet/dry nodes/cells within a radius of a center point.
     
@@ -80,6 +201,9 @@ def plot_wet_nodes(ds, center_lat, center_lon, radius_miles=5,
         Names of wet variables to plot (default: ["wet_nodes"])
         Common options: "wet_nodes", "wet_cells"
         Can specify multiple to compare, e.g., ["wet_nodes", "wet_cells"]
+    use_cache : bool
+        If False, recompute the in-radius selection instead of reading it
+        from the cache sidecar
     """
     
     if wet_vars is None:
@@ -97,6 +221,9 @@ def plot_wet_nodes(ds, center_lat, center_lon, radius_miles=5,
     
     print(f"\nUsing UTM Zone {utm_zone}{hemisphere[0].upper()}")
     
+    # Transform center point to UTM
+    center_x, center_y = transformer.transform(center_lon, center_lat)
+    
     # Define colors for different variables (distinct colors)
     colors = ['red', 'green', 'blue', 'magenta', 'orange', 'purple']
     dry_color = 'brown'
@@ -104,6 +231,10 @@ def plot_wet_nodes(ds, center_lat, center_lon, radius_miles=5,
     # Data structure to hold results for each variable
     plot_data = []
     
+    # Points within the radius and their UTM coordinates, per coordinate
+    # type; variables on the same points share them
+    selections = {}
+    
     # Process each wet variable
     for var_idx, wet_var in enumerate(wet_vars):
         print(f"\nProcessing variable: {wet_var}")
@@ -118,51 +249,35 @@ def plot_wet_nodes(ds, center_lat, center_lon, radius_miles=5,
                     print(f"    - {v}")
             continue
         
-        # Extract wet variable at the time step
+        # Wet variable at the time step (not read yet)
         wet = ds[wet_var].isel(time=time_index)
         
-        # Get coordinates - determine if it's on nodes or cells
+        # Determine if it's on nodes or cells
         if "nodes" in wet_var.lower():
-            lons = ds["lon"].values
-            lats = ds["lat"].values
             coord_type = "nodes"
         elif "cells" in wet_var.lower() or "elem" in wet_var.lower():
-            lons = ds["lonc"].values
-            lats = ds["latc"].values
             coord_type = "cells"
         else:
             # Try to infer from dimensions
-            if 'node' in wet.dims:
+            coord_type = "nodes" if 'node' in wet.dims else "cells"
+        
+        print(f"  Coordinate type: {coord_type}")
+        
+        if coord_type not in selections:
+            if coord_type == "nodes":
                 lons = ds["lon"].values
                 lats = ds["lat"].values
-                coord_type = "nodes"
             else:
                 lons = ds["lonc"].values
                 lats = ds["latc"].values
-                coord_type = "cells"
-        
-        print(f"  Coordinate type: {coord_type}")
-        
-        # Convert longitudes from 0-360 to -180 to 180 format if needed
-        if lons.max() > 180:
-            lons = np.where(lons > 180, lons - 360, lons)
-        
-        # Transform all points to UTM
-        x_utm, y_utm = transformer.transform(lons, lats)
-        
-        # Transform center point to UTM
-        center_x, center_y = transformer.transform(center_lon, center_lat)
-        
-        # Calculate distances from center in meters
-        distances = np.sqrt((x_utm - center_x)**2 + (y_utm - center_y)**2)
-        
-        # Create mask for points within radius
-        radius_mask = distances <= radius_meters
+            selections[coord_type] = radius_selection(lons, lats, center_lat, center_lon,
+                                                      radius_meters, transformer,
+                                                      use_cache=use_cache)
         
-        # Apply radius mask
-        x_in_radius = x_utm[radius_mask]
-        y_in_radius = y_utm[radius_mask]
-        wet_in_radius = wet.values[radius_mask]
+        radius_idx, x_in_radius, y_in_radius = selections[coord_type]
+        # Read just the selected points (a lazily opened dataset then
+        # fetches only those, not the whole time slice)
+        wet_in_radius = wet.isel({wet.dims[-1]: radius_idx}).values
         
         # Separate wet and dry points
         wet_points_mask = wet_in_radius == 1
@@ -206,32 +321,30 @@ def plot_wet_nodes(ds, center_lat, center_lon, radius_miles=5,
     # Create figure
     fig, ax = plt.subplots(1, 1, figsize=(12, 10))
     
-    # Plot each variable with its own color
+    # Plot each variable with its own color: every series goes into one
+    # rasterized collection, in the usual order (per variable, its dry 'x'
+    # markers, then its wet dots) so overlapping points stack as they would
+    # with one scatter per series; the legend gets one proxy marker per series
+    series = []
+    series_handles = []
     for data in plot_data:
-        # Plot dry nodes first (if any) with consistent brown color
+        # Dry nodes (if any) with consistent brown color
         if len(data['x_dry']) > 0:
-            ax.scatter(data['x_dry'], data['y_dry'], 
-                      c=dry_color, s=10, alpha=0.3, 
-                      marker='x',
-                      label=f"{data['var_name']}: Dry ({len(data['x_dry'])})", 
-                      edgecolors='none')
+            series.append((data['x_dry'], data['y_dry'], 'x', 'none',
+                           to_rgba(dry_color, 0.3), plt.rcParams['lines.linewidth']))
+            series_handles.append(Line2D(
+                [], [], linestyle='none', marker='x', color=dry_color, alpha=0.3,
+                markersize=np.sqrt(10), markeredgewidth=plt.rcParams['lines.linewidth'],
+                label=f"{data['var_name']}: Dry ({len(data['x_dry'])})"))
         
-        # Plot wet nodes with variable-specific color
+        # Wet nodes with variable-specific color
         if len(data['x_wet']) > 0:
-            ax.scatter(data['x_wet'], data['y_wet'], 
-                      c=data['color'], s=10, alpha=0.4, 
-                      label=f"{data['var_name']}: Wet ({len(data['x_wet'])})", 
-                      edgecolors='none')
-    
-    # Mark center point
-    ax.plot(center_x, center_y, 'r*', markersize=20, 
-            label='Center Point', zorder=10, markeredgecolor='white', markeredgewidth=1)
-    
-    # Add circle to show radius
-    circle = Circle((center_x, center_y), radius_meters,
-                   fill=False, edgecolor='red', linewidth=2, 
-                   linestyle='--', label=f'{radius_miles} mile radius')
-    ax.add_patch(circle)
+            series.append((data['x_wet'], data['y_wet'], 'o',
+                           to_rgba(data['color'], 0.4), 'none', 0))
+            series_handles.append(Line2D(
+                [], [], linestyle='none', marker='o', markerfacecolor=data['color'],
+                markeredgecolor='none', alpha=0.4, markersize=np.sqrt(10),
+                label=f"{data['var_name']}: Wet ({len(data['x_wet'])})"))
     
     ax.set_xlabel('Easting (m, UTM)', fontsize=12)
     ax.set_ylabel('Northing (m, UTM)', fontsize=12)
@@ -245,7 +358,6 @@ def plot_wet_nodes(ds, center_lat, center_lon, radius_miles=5,
     ax.set_title(f'{title}\nTime: {time_str}\nUTM Zone {utm_zone}{hemisphere[0].upper()}', 
                 fontsize=14, fontweight='bold')
     ax.grid(True, alpha=0.3)
-    ax.legend(loc='upper right', fontsize=10)
     ax.set_aspect('equal')
     
     # Set axis limits with margin
@@ -253,14 +365,53 @@ def plot_wet_nodes(ds, center_lat, center_lon, radius_miles=5,
     ax.set_xlim(center_x - radius_meters - margin, center_x + radius_meters + margin)
     ax.set_ylim(center_y - radius_meters - margin, center_y + radius_meters + margin)
     
+    # Lay out the figure before adding the points: the dedupe below needs
+    # the final size of the axes
+    plt.tight_layout()
+    
+    # Points of a series closer than half an output pixel would be drawn
+    # over each other; only the top one of each is drawn (the legend counts
+    # are the full ones).  Pixel size from the final (laid out, aspect
+    # adjusted) axes width at the larger of the screen and the saved (150) dpi
+    ax_px = ax.get_position().width * fig.get_figwidth() * max(fig.dpi, 150)
+    cell_m = 0.5 * 2 * radius_meters * 1.1 / ax_px
+    offsets, paths, facecolors, edgecolors, linewidths = [], [], [], [], []
+    for x, y, marker, facecolor, edgecolor, linewidth in series:
+        keep = dedupe_per_pixel(x, y, cell_m)
+        marker = MarkerStyle(marker)
+        offsets.append(np.column_stack([x[keep], y[keep]]))
+        paths += [marker.get_path().transformed(marker.get_transform())] * len(keep)
+        facecolors += [facecolor] * len(keep)
+        edgecolors += [edgecolor] * len(keep)
+        linewidths += [linewidth] * len(keep)
+    if series:
+        points = PathCollection(paths, sizes=[10], facecolors=facecolors,
+                                edgecolors=edgecolors, linewidths=linewidths,
+                                offsets=np.concatenate(offsets),
+                                offset_transform=ax.transData)
+        points.set_transform(IdentityTransform())
+        points.set_rasterized(True)
+        ax.add_collection(points, autolim=False)
+    
+    # Mark center point
+    ax.plot(center_x, center_y, 'r*', markersize=20, 
+            label='Center Point', zorder=10, markeredgecolor='white', markeredgewidth=1)
+    
+    # Add circle to show radius
+    circle = Circle((center_x, center_y), radius_meters,
+                   fill=False, edgecolor='red', linewidth=2, 
+                   linestyle='--', label=f'{radius_miles} mile radius')
+    ax.add_patch(circle)
+    
+    ax.legend(handles=series_handles + ax.get_legend_handles_labels()[0],
+              loc='upper right', fontsize=10)
+    
     # Add location info as text
     location_text = f'Location: {center_lat:.4f}°N, {abs(center_lon):.4f}°W'
     ax.text(0.02, 0.02, location_text, transform=ax.transAxes, 
             fontsize=10, verticalalignment='bottom',
             bbox=dict(boxstyle='round', facecolor='white', alpha=0.8))
     
-    plt.tight_layout()
-    
     if save_file:
         plt.savefig(save_file, dpi=150, bbox_inches='tight')
         print(f"\nPlot saved to: {save_file}")
@@ -297,6 +448,12 @@ def main():
         default=0,
         help="Time index to plot (default: 0, first time step)"
     )
+    parser.add_argument(
+        "--time",
+        type=str,
+        help="Plot the time step nearest to this time instead of --time-index "
+             "(e.g. '2025-01-01T12:00', UTC unless an offset is given)"
+    )
     parser.add_argument(
         "--save",
         type=str,
@@ -324,15 +481,21 @@ def main():
         # Get the latest data (use cache unless --no-cache is specified)
         ds, info = get_latest_current_data(use_cache=not args.no_cache)
         
+        time_index = args.time_index
+        if args.time:
+            time_index = nearest_time_index(ds, args.time)
+            print(f"Nearest time step to {args.time}: index {time_index}")
+        
         # Plot the wet nodes/cells
         fig = plot_wet_nodes(
             ds, 
             args.lat, 
             args.lon, 
             radius_miles=args.radius,
-            time_index=args.time_index,
+            time_index=time_index,
             save_file=args.save,
-            wet_vars=args.wet_var
+            wet_vars=args.wet_var,
+            use_cache=not args.no_cache
         )
         
     except Exception as e:
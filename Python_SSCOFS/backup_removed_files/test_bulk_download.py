@@ -129,13 +129,17 @@ def test_sequential_download(forecast_hours, use_cache=False):
     start_time = time.time()
     
     from sscofs_cache import download_to_cache, DEFAULT_CACHE_DIR
+    import s3fs
+    
+    # One filesystem (and connection) reused for every file
+    fs = s3fs.S3FileSystem(anon=True)
     
     cache_paths = []
     for idx, info in enumerate(run_infos):
         fh = info['forecast_hour_index']
         print(f"  [{idx+1}/{len(run_infos)}] Downloading forecast hour {fh:03d}...")
         try:
-            cache_path = download_to_cache(info, verbose=False)
+            cache_path = download_to_cache(info, verbose=False, fs=fs)
             cache_paths.append(cache_path)
             size_mb = cache_path.stat().st_size / (1024 * 1024)
             print(f"    ✓ Success - {size_mb:.1f} MB")
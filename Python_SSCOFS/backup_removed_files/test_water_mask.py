@@ -13,6 +13,7 @@ If present, these masks should be used to exclude land points before
 any interpolation or derivative calculations.
 """
 
+import re
 import xarray as xr
 import numpy as np
 from latest_cycle import latest_cycle_and_url_for_local_hour
@@ -20,6 +21,11 @@ from sscofs_cache import load_sscofs_data
 import datetime as dt
 from zoneinfo import ZoneInfo
 
+# Common mask-related keywords, as whole words within a variable name
+# ("wet_nodes", "mask_rho", "h") but not inside others ("north", "short_wave").
+# Letters only count as word characters, so underscores still separate.
+_MASK_RE = re.compile(r'(?<![a-z])(wet(?:dry)?|mask|land|rho|depth|h)(?![a-z])', re.I)
+
 
 def check_for_water_mask(ds: xr.Dataset, verbose: bool = True):
     """
@@ -36,11 +42,8 @@ def check_for_water_mask(ds: xr.Dataset, verbose: bool = True):
     --------
     list : List of candidate mask variable names found
     """
-    # Common mask-related keywords
-    mask_keywords = ["wet", "wetdry", "mask", "land", "rho", "depth", "h"]
-    
     # Search all variables for candidates
-    candidates = [k for k in ds.variables if any(s in k.lower() for s in mask_keywords)]
+    candidates = [k for k in ds.variables if _MASK_RE.search(k)]
     
     if verbose:
         print("=" * 70)
@@ -89,7 +92,12 @@ def examine_variable(ds: xr.Dataset, var_name: str):
     # For small variables or time-independent masks, show unique values
     if var.size < 1000000:  # Only for reasonably-sized variables
         try:
-            unique_vals = np.unique(var.values[~np.isnan(var.values)])
+            vals = var.values
+            unique_vals = np.unique(vals)
+            if vals.dtype.kind not in 'biu':
+                # NaNs sort to the end of the (small) unique array; dropping
+                # them there avoids a full-size mask and filtered copy
+                unique_vals = unique_vals[~np.isnan(unique_vals)]
             print(f"\nUnique values (excluding NaN): {unique_vals[:20]}")  # First 20
             if len(unique_vals) > 20:
                 print(f"  ... and {len(unique_vals) - 20} more")
@@ -169,13 +177,17 @@ v_masked = ds["v"].where(ds["{mask_var}"] == 1)
             else:
                 mask_t0 = mask
             
-            # Apply mask
-            u_masked = u_t0.where(mask_t0 == 1)
-            v_masked = v_t0.where(mask_t0 == 1)
+            # Apply mask (0/1 integer masks are used as booleans directly)
+            if mask_t0.dtype.kind in 'biu':
+                water = mask_t0.astype(bool)
+            else:
+                water = mask_t0 == 1
+            u_masked = u_t0.where(water)
+            v_masked = v_t0.where(water)
             
-            # Count valid points
-            u_valid_orig = np.sum(~np.isnan(u_t0.values))
-            u_valid_masked = np.sum(~np.isnan(u_masked.values))
+            # Count valid points (reductions stay lazy on dask-backed data)
+            u_valid_orig = int(u_t0.notnull().sum())
+            u_valid_masked = int(u_masked.notnull().sum())
             
             print(f"\nResults:")
             print(f"  Original valid points: {u_valid_orig}")
@@ -8,10 +8,16 @@ that download SSCOFS data.
 """
 
 import os
-import xarray as xr
-import s3fs
+import hashlib
+import numpy as np
 from pathlib import Path
-from typing import Dict, Optional, List, Tuple, Any
+from typing import TYPE_CHECKING, Dict, Optional, List, Tuple, Any
+
+# xarray and s3fs are imported where they are used so that cache
+# management (list/clear/info) starts without loading them.
+if TYPE_CHECKING:
+    import xarray as xr
+    from scipy.spatial import cKDTree
 from concurrent.futures import ThreadPoolExecutor, as_completed
 
 # Default cache directory - can be overridden by SSCOFS_CACHE_DIR env var
@@ -41,7 +47,8 @@ def get_cached_filename(run_info: Dict) -> str:
 
 def download_to_cache(run_info: Dict,
                       cache_dir: Optional[Path] = None,
-                      verbose: bool = True) -> Path:
+                      verbose: bool = True,
+                      fs: Any = None) -> Path:
     """
     Download SSCOFS file from S3 to cache as raw bytes (no parsing).
     
@@ -56,6 +63,9 @@ def download_to_cache(run_info: Dict,
         Directory to store cached files. If None, uses DEFAULT_CACHE_DIR.
     verbose : bool
         If True, print status messages.
+    fs : s3fs.S3FileSystem, optional
+        Filesystem to read through, e.g. one shared by several downloads so
+        they reuse its connection pool. If None, an anonymous S3FileSystem.
         
     Returns:
     --------
@@ -75,7 +85,9 @@ def download_to_cache(run_info: Dict,
         fh = run_info['forecast_hour_index']
         print(f"Downloading forecast hour {fh:03d}...")
     
-    fs = s3fs.S3FileSystem(anon=True)
+    if fs is None:
+        import s3fs
+        fs = s3fs.S3FileSystem(anon=True)
     
     # Extract the S3 key from the URL
     url = run_info['url']
@@ -105,7 +117,9 @@ def download_to_cache(run_info: Dict,
 def load_sscofs_data(run_info: Dict, 
                      use_cache: bool = True,
                      cache_dir: Optional[Path] = None,
-                     verbose: bool = True) -> xr.Dataset:
+                     verbose: bool = True,
+                     decode_cf: bool = True,
+                     chunks: Optional[Dict[str, int]] = None) -> "xr.Dataset":
     """
     Load SSCOFS data from cache or download from S3.
     
@@ -120,6 +134,17 @@ def load_sscofs_data(run_info: Dict,
         Directory to store cached files. If None, uses DEFAULT_CACHE_DIR.
     verbose : bool
         If True, print status messages.
+    decode_cf : bool
+        If False, skip CF decoding (times, _FillValue masking, scale/offset)
+        and return the raw stored values.  Faster for numeric-only reads;
+        the caller is responsible for interpreting the attributes.
+    chunks : dict, optional
+        Dask chunk sizes per dimension, e.g. {'node': 100000, 'nele': 200000}.
+        If given, variables are opened lazily as dask arrays (requires
+        dask); if None, the default lazily-indexed NumPy backend is used.
+        Each SSCOFS file holds a single time step, so there is nothing to
+        gain from chunking along 'time'; with either backend, isel on
+        'node'/'nele' reads only the selected part of a variable.
         
     Returns:
     --------
@@ -144,12 +169,105 @@ def load_sscofs_data(run_info: Dict,
     # FVCOM NetCDF files have 'siglay' as both a variable and a dimension,
     # which newer xarray/h5netcdf reject.  Drop the coordinate variable so
     # the dimension survives and isel(siglay=0) still works.
+    import xarray as xr
     ds = xr.open_dataset(cache_file, engine='h5netcdf',
-                         drop_variables=['siglay', 'siglev'])
+                         drop_variables=['siglay', 'siglev'],
+                         decode_cf=decode_cf,
+                         chunks=chunks)
     return ds
 
 
-def list_cache(cache_dir: Optional[Path] = None) -> None:
+def mesh_digest(lons: np.ndarray, lats: np.ndarray) -> str:
+    """
+    Short stable hash of a mesh's coordinate arrays.
+
+    The SSCOFS grid is identical across cycles, so this is a convenient key
+    for anything derived purely from the mesh geometry.
+    """
+    h = hashlib.sha1()
+    h.update(np.ascontiguousarray(lons).tobytes())
+    h.update(np.ascontiguousarray(lats).tobytes())
+    return h.hexdigest()[:16]
+
+
+# Trees already loaded in this process, by mesh digest
+_MESH_TREES: Dict[str, "cKDTree"] = {}
+
+
+def load_mesh_tree(lons: np.ndarray,
+                   lats: np.ndarray,
+                   use_cache: bool = True,
+                   cache_dir: Optional[Path] = None,
+                   digest: Optional[str] = None) -> "cKDTree":
+    """
+    Return a cKDTree over mesh points on the unit sphere.
+    
+    The SSCOFS mesh is static across cycles, so the tree is pickled into
+    the cache directory keyed by a hash of the coordinates and reused; a
+    tree loaded once is also kept in memory for later calls.
+    
+    Parameters:
+    -----------
+    lons, lats : np.ndarray
+        Mesh coordinates in degrees (nodes or cell centers).
+    use_cache : bool
+        If False, always rebuild the tree (and overwrite the pickle).
+    cache_dir : Path, optional
+        Directory to store cached files. If None, uses DEFAULT_CACHE_DIR.
+    digest : str, optional
+        mesh_digest(lons, lats), if the caller already has it.
+        
+    Returns:
+    --------
+    cKDTree : tree over the mesh points as float32 unit-sphere (x, y, z)
+    """
+    import pickle
+    from scipy.spatial import cKDTree
+    
+    if cache_dir is None:
+        cache_dir = DEFAULT_CACHE_DIR
+    
+    if digest is None:
+        digest = mesh_digest(lons, lats)
+    if use_cache and digest in _MESH_TREES:
+        return _MESH_TREES[digest]
+    
+    tree_file = cache_dir / f"mesh_tree_{digest}.pkl"
+    if use_cache and tree_file.exists():
+        with open(tree_file, 'rb') as f:
+            tree = pickle.load(f)
+    else:
+        lats_rad = np.radians(lats).astype(np.float32)
+        lons_rad = np.radians(lons).astype(np.float32)
+        cos_lat = np.cos(lats_rad)
+        tree = cKDTree(np.column_stack([cos_lat * np.cos(lons_rad),
+                                        cos_lat * np.sin(lons_rad),
+                                        np.sin(lats_rad)]))
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        with open(tree_file, 'wb') as f:
+            pickle.dump(tree, f, protocol=pickle.HIGHEST_PROTOCOL)
+    
+    _MESH_TREES[digest] = tree
+    return tree
+
+
+# Files derived from the downloads that are kept in the same directory:
+# mesh KD-trees, in-radius selections (one per center/radius), extracted
+# metadata, and the mesh_precomp_* arrays written by earlier versions
+DERIVED_CACHE_PATTERNS = ("mesh_tree_*.pkl", "radius_sel_*.npz",
+                          "metadata/*.json", "mesh_precomp_*/*.npy")
+
+
+def _cache_files(cache_dir: Path, include_derived: bool = True) -> List[Path]:
+    """Cached NetCDF files, followed by the derived files if requested."""
+    files = sorted(cache_dir.glob("*.nc"))
+    if include_derived:
+        for pattern in DERIVED_CACHE_PATTERNS:
+            files.extend(sorted(cache_dir.glob(pattern)))
+    return files
+
+
+def list_cache(cache_dir: Optional[Path] = None, include_derived: bool = True) -> None:
     """
     List all cached files and their sizes.
     
@@ -157,6 +275,9 @@ def list_cache(cache_dir: Optional[Path] = None) -> None:
     -----------
     cache_dir : Path, optional
         Directory containing cached files. If None, uses DEFAULT_CACHE_DIR.
+    include_derived : bool
+        If True, also list the files derived from the data (mesh trees,
+        radius selections, metadata); see DERIVED_CACHE_PATTERNS.
     """
     if cache_dir is None:
         cache_dir = DEFAULT_CACHE_DIR
@@ -165,7 +286,7 @@ def list_cache(cache_dir: Optional[Path] = None) -> None:
         print("No cache directory found.")
         return
     
-    cache_files = sorted(cache_dir.glob("*.nc"))
+    cache_files = _cache_files(cache_dir, include_derived)
     if not cache_files:
         print("Cache is empty.")
         return
@@ -176,12 +297,12 @@ def list_cache(cache_dir: Optional[Path] = None) -> None:
     for f in cache_files:
         size_mb = f.stat().st_size / (1024 * 1024)
         total_size += size_mb
-        print(f"  {f.name:50s} {size_mb:7.2f} MB")
+        print(f"  {str(f.relative_to(cache_dir)):50s} {size_mb:7.2f} MB")
     print("-" * 70)
     print(f"Total: {len(cache_files)} files, {total_size:.2f} MB")
 
 
-def clear_cache(cache_dir: Optional[Path] = None) -> int:
+def clear_cache(cache_dir: Optional[Path] = None, include_derived: bool = True) -> int:
     """
     Delete all cached files.
     
@@ -189,6 +310,9 @@ def clear_cache(cache_dir: Optional[Path] = None) -> int:
     -----------
     cache_dir : Path, optional
         Directory containing cached files. If None, uses DEFAULT_CACHE_DIR.
+    include_derived : bool
+        If True, also delete the files derived from the data (mesh trees,
+        radius selections, metadata); see DERIVED_CACHE_PATTERNS.
         
     Returns:
     --------
@@ -201,7 +325,7 @@ def clear_cache(cache_dir: Optional[Path] = None) -> int:
         print("No cache directory found.")
         return 0
     
-    cache_files = list(cache_dir.glob("*.nc"))
+    cache_files = _cache_files(cache_dir, include_derived)
     if not cache_files:
         print("Cache is already empty.")
         return 0
@@ -210,11 +334,17 @@ def clear_cache(cache_dir: Optional[Path] = None) -> int:
     for f in cache_files:
         f.unlink()
         count += 1
+    if include_derived:
+        # Subdirectories left empty (metadata/, mesh_precomp_*/)
+        for d in {f.parent for f in cache_files} - {cache_dir}:
+            if not any(d.iterdir()):
+                d.rmdir()
+        _MESH_TREES.clear()
     print(f"Deleted {count} cached files from {cache_dir}")
     return count
 
 
-def get_cache_info(cache_dir: Optional[Path] = None) -> Dict:
+def get_cache_info(cache_dir: Optional[Path] = None, include_derived: bool = True) -> Dict:
     """
     Get information about the cache.
     
@@ -222,6 +352,9 @@ def get_cache_info(cache_dir: Optional[Path] = None) -> Dict:
     -----------
     cache_dir : Path, optional
         Directory containing cached files. If None, uses DEFAULT_CACHE_DIR.
+    include_derived : bool
+        If True, also count the files derived from the data (mesh trees,
+        radius selections, metadata); see DERIVED_CACHE_PATTERNS.
         
     Returns:
     --------
@@ -233,12 +366,12 @@ def get_cache_info(cache_dir: Optional[Path] = None) -> Dict:
     if not cache_dir.exists():
         return {'num_files': 0, 'total_size_mb': 0.0, 'files': []}
     
-    cache_files = sorted(cache_dir.glob("*.nc"))
+    cache_files = _cache_files(cache_dir, include_derived)
     total_size = sum(f.stat().st_size for f in cache_files) / (1024 * 1024)
     
     files_info = [
         {
-            'name': f.name,
+            'name': str(f.relative_to(cache_dir)),
             'size_mb': f.stat().st_size / (1024 * 1024),
             'path': str(f)
         }
@@ -334,9 +467,16 @@ def bulk_download_forecasts(
     if verbose:
         print(f"\nDownloading {len(to_download)} files...")
     
+    # One filesystem for all workers, with a connection pool large enough
+    # that every worker keeps its own connection alive between files
+    # (botocore's default pool holds 10)
+    import s3fs
+    fs = s3fs.S3FileSystem(anon=True,
+                           config_kwargs={'max_pool_connections': max(10, max_workers)})
+    
     def download_one(idx_and_info: Tuple[int, Dict[str, Any]]) -> Tuple[int, Path]:
         idx, info = idx_and_info
-        cache_file = download_to_cache(info, cache_dir=cache_dir, verbose=False)
+        cache_file = download_to_cache(info, cache_dir=cache_dir, verbose=False, fs=fs)
         return idx, cache_file
     
     # Use ThreadPoolExecutor for parallel downloads
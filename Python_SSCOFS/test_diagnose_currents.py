@@ -0,0 +1,82 @@
+"""
+test_diagnose_currents.py
+-------------------------
+Tests for the current statistics in diagnose_currents.py: the Numba
+kernel must give the same answers as the NumPy expressions it replaced.
+
+Run:
+    cd WaysWaterMoves/OceanCurrents/Python_SSCOFS
+    python -m pytest test_diagnose_currents.py -v
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent))
+sys.path.insert(0, str(Path(__file__).parent / "backup_removed_files"))
+
+import numpy as np
+import pytest
+
+import diagnose_currents as dc
+
+needs_numba = pytest.mark.skipif(dc._current_stats_jit is None, reason="numba not installed")
+
+
+def numpy_stats(monkeypatch, u, v, thresh=0.001):
+    """current_stats with the Numba kernel switched off."""
+    monkeypatch.setattr(dc, "_current_stats_jit", None)
+    return dc.current_stats(u, v, thresh)
+
+
+@needs_numba
+def test_current_stats_matches_numpy_with_dry_cells(monkeypatch):
+    rng = np.random.default_rng(0)
+    u = rng.normal(0, 0.5, 10_000).astype(np.float32)
+    v = rng.normal(0, 0.5, 10_000).astype(np.float32)
+    # Dry cells, and a few where only one component is missing
+    u[::7] = np.nan
+    v[::7] = np.nan
+    u[3::50] = np.nan
+    v[5::60] = np.nan
+    u[10:20] = 0.0
+    v[10:20] = 0.0
+
+    jit = dc.current_stats(u, v)
+    ref = numpy_stats(monkeypatch, u, v)
+
+    assert jit.keys() == ref.keys()
+    for key in ref:
+        assert jit[key] == pytest.approx(float(ref[key]), rel=1e-5, abs=1e-6), key
+    assert jit['n_nonzero'] == ref['n_nonzero']
+
+
+@needs_numba
+def test_current_stats_all_nan_gives_nan(monkeypatch):
+    u = np.full(100, np.nan, dtype=np.float32)
+    v = np.full(100, np.nan, dtype=np.float32)
+
+    jit = dc.current_stats(u, v)
+    with pytest.warns(RuntimeWarning):
+        ref = numpy_stats(monkeypatch, u, v)
+
+    for key in ('u_min', 'u_max', 'u_mean', 'v_min', 'v_max', 'v_mean',
+                'speed_min', 'speed_max', 'speed_mean'):
+        assert np.isnan(jit[key]), key
+        assert np.isnan(ref[key]), key
+    assert jit['n_nonzero'] == ref['n_nonzero'] == 0
+
+
+@needs_numba
+def test_current_stats_speed_nan_when_components_never_overlap():
+    # u and v each have values, but never at the same point
+    u = np.array([1.0, np.nan, 2.0, np.nan])
+    v = np.array([np.nan, 3.0, np.nan, 4.0])
+
+    stats = dc.current_stats(u, v)
+
+    assert (stats['u_min'], stats['u_max']) == (1.0, 2.0)
+    assert (stats['v_min'], stats['v_max']) == (3.0, 4.0)
+    assert np.isnan(stats['speed_min']) and np.isnan(stats['speed_max'])
+    assert np.isnan(stats['speed_mean'])
+    assert stats['n_nonzero'] == 0
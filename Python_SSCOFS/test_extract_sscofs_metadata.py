@@ -0,0 +1,88 @@
+"""
+test_extract_sscofs_metadata.py
+-------------------------------
+Tests for the array statistics in extract_sscofs_metadata.py: the fused
+Numba kernel must give the same summary as the NumPy reductions it
+replaced.
+
+Run:
+    cd WaysWaterMoves/OceanCurrents/Python_SSCOFS
+    python -m pytest test_extract_sscofs_metadata.py -v
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent))
+sys.path.insert(0, str(Path(__file__).parent / "backup_removed_files"))
+
+import numpy as np
+import pytest
+
+import extract_sscofs_metadata as esm
+
+needs_numba = pytest.mark.skipif(esm._fused_stats is None, reason="numba not installed")
+
+
+def both_stats(monkeypatch, flat):
+    """compute_array_stats with and without the Numba kernel."""
+    jit = esm.compute_array_stats(flat)
+    monkeypatch.setattr(esm, "_fused_stats", None)
+    return jit, esm.compute_array_stats(flat)
+
+
+def assert_stats_match(jit, ref):
+    assert jit.keys() == ref.keys()
+    assert jit['n_valid'] == ref['n_valid']
+    assert jit['nan_count'] == ref['nan_count']
+    for key in ('min', 'max', 'mean', 'std'):
+        if key in ref:
+            assert jit[key] == pytest.approx(ref[key], rel=1e-6, abs=1e-9), key
+
+
+@needs_numba
+def test_fused_stats_matches_numpy_with_dry_cells(monkeypatch):
+    rng = np.random.default_rng(1)
+    flat = rng.normal(10.0, 3.0, 50_001).astype(np.float32)
+    # Dry cells come through as NaN, in runs and scattered
+    flat[::9] = np.nan
+    flat[1000:3000] = np.nan
+
+    jit, ref = both_stats(monkeypatch, flat)
+
+    assert_stats_match(jit, ref)
+    assert jit['nan_count'] > 0
+
+
+@needs_numba
+def test_fused_stats_large_offset_keeps_std(monkeypatch):
+    # A naive sum of squares loses the spread at this offset
+    rng = np.random.default_rng(2)
+    flat = 1e6 + rng.normal(0.0, 0.01, 20_000)
+
+    jit, ref = both_stats(monkeypatch, flat)
+
+    assert_stats_match(jit, ref)
+
+
+@needs_numba
+def test_fused_stats_integer_array(monkeypatch):
+    flat = np.arange(-50, 1000, dtype=np.int32)
+
+    jit, ref = both_stats(monkeypatch, flat)
+
+    assert_stats_match(jit, ref)
+    assert jit['nan_count'] == 0
+
+
+@needs_numba
+@pytest.mark.parametrize("flat", [
+    np.full(1000, np.nan, dtype=np.float32),
+    np.array([], dtype=np.float32),
+], ids=["all_nan", "empty"])
+def test_fused_stats_no_valid_values(monkeypatch, flat):
+    jit, ref = both_stats(monkeypatch, flat)
+
+    assert jit == ref
+    assert jit['n_valid'] == 0
+    assert 'min' not in jit
@@ -0,0 +1,175 @@
+"""
+test_plot_currents_enhanced.py
+------------------------------
+Tests for the gridded-field helpers in plot_currents_enhanced.py: each
+Numba kernel must reproduce the NumPy code it replaced, including the
+NaN (land / dry cell) footprint.
+
+Run:
+    cd WaysWaterMoves/OceanCurrents/Python_SSCOFS
+    python -m pytest test_plot_currents_enhanced.py -v
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent))
+sys.path.insert(0, str(Path(__file__).parent / "backup_removed_files"))
+
+import numpy as np
+import pytest
+
+import plot_currents_enhanced as pce
+
+needs_numba = pytest.mark.skipif(not pce._NUMBA_AVAILABLE, reason="numba not installed")
+
+
+def swirl_grid(nx, ny, land=True):
+    """A rotating flow with a strain component on a uniform grid, plus a
+    block of NaN land cells."""
+    xg = np.linspace(500_000.0, 510_000.0, nx)
+    yg = np.linspace(5_270_000.0, 5_278_000.0, ny)
+    X, Y = np.meshgrid(xg - xg.mean(), yg - yg.mean())
+    Ug = (-Y * 1e-4 + 0.3 * np.sin(X / 900.0)).astype(np.float32)
+    Vg = (X * 1e-4 + 0.2 * np.cos(Y / 700.0)).astype(np.float32)
+    if land:
+        Ug[ny // 3:ny // 2, nx // 4:nx // 2] = np.nan
+        Vg[ny // 3:ny // 2, nx // 4:nx // 2] = np.nan
+    return Ug, Vg, xg, yg
+
+
+# =====================================================================
+# Flow diagnostics stencil
+# =====================================================================
+
+@needs_numba
+@pytest.mark.parametrize("shape", [(40, 55), (2, 2), (2, 7)])
+def test_flow_diagnostics_kernel_matches_np_gradient(monkeypatch, shape):
+    ny, nx = shape
+    Ug, Vg, xg, yg = swirl_grid(nx, ny, land=min(shape) > 2)
+
+    jit = pce.compute_flow_diagnostics(Ug, Vg, xg, yg)
+    monkeypatch.setattr(pce, "_flow_diag_kernel", None)
+    ref = pce.compute_flow_diagnostics(Ug, Vg, xg, yg)
+
+    for name, a, b in zip(("zeta", "div", "OW"), jit, ref):
+        assert a.dtype == b.dtype == np.float32, name
+        assert a.shape == b.shape == (ny, nx), name
+        np.testing.assert_array_equal(np.isnan(a), np.isnan(b), err_msg=name)
+        scale = np.nanmax(np.abs(b))
+        np.testing.assert_allclose(a, b, rtol=1e-4, atol=1e-5 * scale, err_msg=name)
+
+
+@needs_numba
+def test_flow_diagnostics_nan_spreads_one_cell():
+    Ug, Vg, xg, yg = swirl_grid(30, 30)
+
+    zeta, div, OW = pce.compute_flow_diagnostics(Ug, Vg, xg, yg)
+
+    # Centered differences reach one cell past the land block, no further
+    land = np.isnan(Ug)
+    grown = land.copy()
+    grown[1:, :] |= land[:-1, :]
+    grown[:-1, :] |= land[1:, :]
+    grown[:, 1:] |= land[:, :-1]
+    grown[:, :-1] |= land[:, 1:]
+    for field in (zeta, div, OW):
+        np.testing.assert_array_equal(np.isnan(field), grown)
+
+
+@needs_numba
+def test_flow_diagnostics_nan_pocket_matches_np_gradient(monkeypatch):
+    Ug, Vg, xg, yg = swirl_grid(24, 20, land=False)
+    # Isolated NaN cells inside, on the edges and in a corner, a 2x2
+    # pocket, and cells where only one component is missing
+    for i, j in [(5, 5), (0, 7), (9, 0), (19, 23), (12, 23)]:
+        Ug[i, j] = np.nan
+        Vg[i, j] = np.nan
+    Ug[14:16, 10:12] = np.nan
+    Vg[14:16, 10:12] = np.nan
+    Ug[3, 15] = np.nan
+    Vg[16, 4] = np.nan
+
+    jit = pce.compute_flow_diagnostics(Ug, Vg, xg, yg)
+    monkeypatch.setattr(pce, "_flow_diag_kernel", None)
+    ref = pce.compute_flow_diagnostics(Ug, Vg, xg, yg)
+
+    for name, a, b in zip(("zeta", "div", "OW"), jit, ref):
+        np.testing.assert_array_equal(np.isnan(a), np.isnan(b), err_msg=name)
+        scale = np.nanmax(np.abs(b))
+        np.testing.assert_allclose(a, b, rtol=1e-4, atol=1e-5 * scale, err_msg=name)
+    # The stencil neighbours of a NaN cell are NaN as well
+    zeta = jit[0]
+    assert np.isnan(zeta[4, 5]) and np.isnan(zeta[6, 5])
+    assert np.isnan(zeta[5, 4]) and np.isnan(zeta[5, 6])
+    assert np.isnan(zeta[1, 7]) and np.isnan(zeta[9, 1])
+
+
+# =====================================================================
+# Barycentric gridding
+# =====================================================================
+
+def scattered_currents(n=400, seed=3):
+    """Scattered mesh points around a centre, with some dry (NaN) cells
+    and a few where only one component is missing."""
+    rng = np.random.default_rng(seed)
+    x0, y0 = 550_000.0, 5_280_000.0
+    x = x0 + rng.uniform(-3000, 3000, n)
+    y = y0 + rng.uniform(-3000, 3000, n)
+    u = 0.5 * np.sin((x - x0) / 800.0)
+    v = 0.4 * np.cos((y - y0) / 600.0)
+    u[::11] = np.nan
+    v[::11] = np.nan
+    u[5::37] = np.nan
+    v[7::41] = np.nan
+    return x, y, u, v, x0, y0
+
+
+@needs_numba
+def test_apply_bary_matches_einsum_gridding(monkeypatch):
+    x, y, u, v, x0, y0 = scattered_currents()
+    # Radius plus padding reaches past the points, so some nodes are outside
+    args = (x, y, u, v, x0, y0, 3000.0)
+
+    jit = pce.interpolate_to_grid(*args, nx=60, ny=50)
+    monkeypatch.setattr(pce, "_apply_bary", None)
+    ref = pce.interpolate_to_grid(*args, nx=60, ny=50)
+
+    for name, a, b in zip(("xg", "yg", "Xg", "Yg", "Ug", "Vg", "Sg"), jit, ref):
+        assert a.dtype == b.dtype, name
+        assert a.shape == b.shape, name
+        np.testing.assert_allclose(a, b, rtol=1e-6, atol=1e-7, err_msg=name)
+    Ug, Vg = jit[4], jit[5]
+    # Both components share one NaN footprint, which covers the outside nodes
+    np.testing.assert_array_equal(np.isnan(Ug), np.isnan(Vg))
+    assert np.isnan(Ug).any() and not np.isnan(Ug).all()
+
+
+@needs_numba
+def test_apply_bary_nan_vertex_and_outside():
+    verts = np.array([[0, 1, 2], [1, 2, 3], [0, 0, 0]])
+    weights = np.array([[0.2, 0.3, 0.5], [0.6, 0.2, 0.2], [1.0, 0.0, 0.0]])
+    outside = np.array([False, False, True])
+    u = np.array([1.0, 2.0, 3.0, np.nan])
+    v = np.array([4.0, 5.0, 6.0, 7.0])
+    Ug = np.empty(3, dtype=np.float32)
+    Vg = np.empty(3, dtype=np.float32)
+
+    pce._apply_bary(verts, weights, outside, u, v, Ug, Vg)
+
+    assert Ug[0] == pytest.approx(0.2 * 1 + 0.3 * 2 + 0.5 * 3)
+    assert Vg[0] == pytest.approx(0.2 * 4 + 0.3 * 5 + 0.5 * 6)
+    # A NaN u at one vertex blanks v too, as in the NumPy path
+    assert np.isnan(Ug[1]) and np.isnan(Vg[1])
+    assert np.isnan(Ug[2]) and np.isnan(Vg[2])
+
+
+@needs_numba
+def test_apply_bary_empty_grid():
+    Ug = np.empty(0, dtype=np.float32)
+    Vg = np.empty(0, dtype=np.float32)
+
+    pce._apply_bary(np.empty((0, 3), dtype=np.int64), np.empty((0, 3)),
+                    np.empty(0, dtype=bool), np.array([1.0]), np.array([1.0]), Ug, Vg)
+
+    assert Ug.size == Vg.size == 0
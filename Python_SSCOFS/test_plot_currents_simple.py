@@ -0,0 +1,189 @@
+"""
+test_plot_currents_simple.py
+----------------------------
+Tests for the mesh helpers in plot_currents_simple.py: the Numba kernels
+for triangle areas, the cell-to-node averaging and the barycentric
+sampling must reproduce the NumPy code they replaced, including NaN
+(dry cell) handling and empty inputs.
+
+Run:
+    cd WaysWaterMoves/OceanCurrents/Python_SSCOFS
+    python -m pytest test_plot_currents_simple.py -v
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent))
+sys.path.insert(0, str(Path(__file__).parent / "backup_removed_files"))
+
+import numpy as np
+import pytest
+
+import plot_currents_simple as pcs
+
+needs_numba = pytest.mark.skipif(not pcs._NUMBA_AVAILABLE, reason="numba not installed")
+
+
+def jittered_mesh(n=70, seed=4):
+    """Nodes on a jittered n-by-n UTM grid, two triangles per square, and
+    cell-centred currents with a patch of dry cells (NaN velocities)."""
+    rng = np.random.default_rng(seed)
+    step = 100.0
+    xs, ys = np.meshgrid(np.arange(n) * step, np.arange(n) * step)
+    x = 550_000.0 + xs.ravel() + rng.uniform(-20, 20, n * n)
+    y = 5_280_000.0 + ys.ravel() + rng.uniform(-20, 20, n * n)
+    i, j = np.meshgrid(np.arange(n - 1), np.arange(n - 1), indexing='ij')
+    a = (i * n + j).ravel()
+    tri_idx = np.concatenate([np.column_stack([a, a + 1, a + n]),
+                              np.column_stack([a + 1, a + n + 1, a + n])])
+    xc = x[tri_idx].mean(axis=1)
+    yc = y[tri_idx].mean(axis=1)
+    u = 0.5 * np.sin((xc - xc.min()) / 900.0)
+    v = 0.4 * np.cos((yc - yc.min()) / 700.0)
+    wet = rng.uniform(size=len(tri_idx)) > 0.2
+    wet[:300] = False
+    u[~wet] = np.nan
+    v[~wet] = np.nan
+    return x, y, tri_idx, u, v, wet
+
+
+def numpy_path(monkeypatch):
+    for name in ("_tri_areas_jit", "_scatter_uvw_jit", "_bary_jit"):
+        monkeypatch.setattr(pcs, name, None)
+
+
+# =====================================================================
+# Triangle areas
+# =====================================================================
+
+@needs_numba
+def test_triangle_areas_kernel_matches_numpy(monkeypatch):
+    x, y, tri_idx, _, _, _ = jittered_mesh()
+
+    jit = pcs.triangle_areas(x, y, tri_idx)
+    numpy_path(monkeypatch)
+    ref = pcs.triangle_areas(x, y, tri_idx)
+
+    np.testing.assert_allclose(jit, ref, rtol=1e-9)
+    assert (ref > 0).all()
+
+
+@needs_numba
+def test_triangle_areas_empty(monkeypatch):
+    x, y, _, _, _, _ = jittered_mesh(n=3)
+    tri_idx = np.empty((0, 3), dtype=np.int64)
+
+    assert pcs.triangle_areas(x, y, tri_idx).shape == (0,)
+    numpy_path(monkeypatch)
+    assert pcs.triangle_areas(x, y, tri_idx).shape == (0,)
+
+
+# =====================================================================
+# Cell-to-node averaging
+# =====================================================================
+
+@needs_numba
+def test_cells_to_nodes_kernel_matches_bincount(monkeypatch):
+    x, y, tri_idx, u, v, wet = jittered_mesh()
+    # Dry cells carry zero velocity here so that only the wet weighting
+    # decides which nodes are NaN
+    u0, v0 = np.where(wet, u, 0.0), np.where(wet, v, 0.0)
+
+    jit = pcs.cells_to_nodes_area_weighted_uv(x, y, tri_idx, u0, v0, wet)
+    numpy_path(monkeypatch)
+    ref = pcs.cells_to_nodes_area_weighted_uv(x, y, tri_idx, u0, v0, wet)
+
+    for a, b in zip(jit, ref):
+        np.testing.assert_allclose(a, b, rtol=1e-9, atol=1e-12)
+    # Nodes touching only dry cells have no value
+    u_node = ref[0]
+    assert np.isnan(u_node).any() and not np.isnan(u_node).all()
+
+
+@needs_numba
+def test_cells_to_nodes_nan_dry_cells_match(monkeypatch):
+    x, y, tri_idx, u, v, wet = jittered_mesh()
+
+    jit = pcs.cells_to_nodes_area_weighted_uv(x, y, tri_idx, u, v, wet)
+    numpy_path(monkeypatch)
+    ref = pcs.cells_to_nodes_area_weighted_uv(x, y, tri_idx, u, v, wet)
+
+    for a, b in zip(jit, ref):
+        np.testing.assert_array_equal(np.isnan(a), np.isnan(b))
+        np.testing.assert_allclose(a, b, rtol=1e-9, atol=1e-12)
+
+
+@needs_numba
+@pytest.mark.parametrize("n_chunks", [1, 3, 8])
+def test_scatter_kernel_chunking(n_chunks):
+    x, y, tri_idx, u, v, wet = jittered_mesh(n=20)
+    wA = pcs.triangle_areas(x, y, tri_idx) * wet
+    u0, v0 = np.where(wet, u, 0.0), np.where(wet, v, 0.0)
+
+    accU, accV, wsum = pcs._scatter_uvw_jit(tri_idx, u0, v0, wA, x.size, n_chunks)
+
+    flat = tri_idx.ravel()
+    np.testing.assert_allclose(wsum, np.bincount(flat, np.repeat(wA, 3), x.size))
+    np.testing.assert_allclose(accU, np.bincount(flat, np.repeat(u0 * wA, 3), x.size),
+                               atol=1e-9)
+    np.testing.assert_allclose(accV, np.bincount(flat, np.repeat(v0 * wA, 3), x.size),
+                               atol=1e-9)
+
+
+@needs_numba
+def test_cells_to_nodes_empty_mesh(monkeypatch):
+    x, y, _, _, _, _ = jittered_mesh(n=3)
+    tri_idx = np.empty((0, 3), dtype=np.int64)
+    empty = np.empty(0)
+
+    u_node, v_node = pcs.cells_to_nodes_area_weighted_uv(
+        x, y, tri_idx, empty, empty, np.empty(0, dtype=bool))
+
+    assert u_node.shape == v_node.shape == x.shape
+    assert np.isnan(u_node).all() and np.isnan(v_node).all()
+
+
+# =====================================================================
+# Barycentric sampling
+# =====================================================================
+
+@needs_numba
+def test_bary_interp_kernel_matches_numpy(monkeypatch):
+    x, y, tri_idx, u, v, wet = jittered_mesh()
+    u_node, v_node = pcs.cells_to_nodes_area_weighted_uv(
+        x, y, tri_idx, np.where(wet, u, 0.0), np.where(wet, v, 0.0), wet)
+    # Random points inside random triangles
+    rng = np.random.default_rng(6)
+    tind = rng.integers(0, len(tri_idx), 2000)
+    b = rng.dirichlet(np.ones(3), len(tind))
+    qx = (b * x[tri_idx[tind]]).sum(axis=1)
+    qy = (b * y[tri_idx[tind]]).sum(axis=1)
+
+    jit = pcs.bary_interp(tri_idx, x, y, u_node, v_node, qx, qy, tind)
+    numpy_path(monkeypatch)
+    ref = pcs.bary_interp(tri_idx, x, y, u_node, v_node, qx, qy, tind)
+
+    for a, r in zip(jit, ref):
+        np.testing.assert_array_equal(np.isnan(a), np.isnan(r))
+        np.testing.assert_allclose(a, r, rtol=1e-7, atol=1e-9)
+    # Triangles with a dry (NaN) vertex give NaN, the rest do not
+    assert np.isnan(ref[0]).any() and not np.isnan(ref[0]).all()
+    # The weights reproduce the query points' own barycentric mix
+    ok = ~np.isnan(ref[0])
+    expected = (b * u_node[tri_idx[tind]]).sum(axis=1)
+    np.testing.assert_allclose(jit[0][ok], expected[ok], atol=1e-9)
+
+
+@needs_numba
+def test_bary_interp_empty(monkeypatch):
+    x, y, tri_idx, _, _, _ = jittered_mesh(n=3)
+    u_node = np.zeros(x.size)
+    empty = np.empty(0)
+    tind = np.empty(0, dtype=np.int64)
+
+    qu, qv = pcs.bary_interp(tri_idx, x, y, u_node, u_node, empty, empty, tind)
+    assert qu.shape == qv.shape == (0,)
+    numpy_path(monkeypatch)
+    qu, qv = pcs.bary_interp(tri_idx, x, y, u_node, u_node, empty, empty, tind)
+    assert qu.shape == qv.shape == (0,)